@@ -8,7 +8,7 @@ These section models are composed by :class:`~ztlctl.config.settings.ZtlSettings
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -77,6 +77,7 @@ class SearchConfig(BaseModel):
     semantic_enabled: bool = False
     embedding_model: str = "local"
     embedding_dim: int = 384
+    embedding_storage: Literal["float32", "int8"] = "float32"
     half_life_days: float = 30.0
     semantic_weight: float = 0.5
 
@@ -90,6 +91,7 @@ class SessionConfig(BaseModel):
     close_orphan_sweep: bool = True
     close_integrity_check: bool = True
     orphan_reweave_threshold: float = 0.2
+    close_drain_timeout_ms: int = 200  # 0 waits for every plugin event
 
 
 class TagsConfig(BaseModel):
@@ -21,6 +21,7 @@ clean: infrastructure -> domain, never the reverse.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import date
 from io import StringIO
@@ -178,6 +179,73 @@ def render_frontmatter(frontmatter: dict[str, Any], body: str) -> str:
     return "".join(parts)
 
 
+_CANONICAL_RANK: dict[str, int] = {key: i for i, key in enumerate(CANONICAL_KEY_ORDER)}
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TOP_LEVEL_KEY_RE = re.compile(r"([A-Za-z_][\w-]*):")
+
+
+def _key_rank(key: str) -> tuple[int, int, str]:
+    """Sort rank matching :func:`order_frontmatter`'s key placement."""
+    rank = _CANONICAL_RANK.get(key)
+    return (0, rank, "") if rank is not None else (1, 0, key)
+
+
+def _plain_scalar(value: Any) -> str | None:
+    """YAML text for values the patcher can emit without a dumper."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str) and _ISO_DATE_RE.fullmatch(value):
+        return f"'{value}'"  # quoted, as ruamel emits date-like strings
+    return None
+
+
+def patch_frontmatter(content: str, updates: dict[str, Any]) -> str | None:
+    """Set single-line scalar keys in *content*'s frontmatter in place.
+
+    A line-level alternative to ``parse_frontmatter`` + ``render_frontmatter``
+    for small known-shape edits. Existing keys are rewritten on their line;
+    missing keys are inserted at their canonical position. Returns ``None``
+    when the edit needs the full YAML round trip: no frontmatter fence, a
+    value that is not a bool or ISO date string, or a multi-line entry.
+    """
+    rendered: dict[str, str] = {}
+    for key, value in updates.items():
+        text_value = _plain_scalar(value)
+        if text_value is None:
+            return None
+        rendered[key] = f"{key}: {text_value}"
+
+    lines = content.replace("\r\n", "\n").split("\n")
+    if not lines or lines[0].strip() != _FRONTMATTER_DELIMITER:
+        return None
+    try:
+        end_idx = next(
+            i for i, line in enumerate(lines[1:], start=1) if line.strip() == _FRONTMATTER_DELIMITER
+        )
+    except StopIteration:
+        return None
+
+    block = lines[1:end_idx]
+    for key, line in rendered.items():
+        insert_at = len(block)
+        for i, existing in enumerate(block):
+            match = _TOP_LEVEL_KEY_RE.match(existing)
+            if match is None:
+                continue
+            if match.group(1) == key:
+                following = block[i + 1] if i + 1 < len(block) else ""
+                if following[:1] in (" ", "-"):
+                    return None  # multi-line value
+                block[i] = line
+                break
+            if insert_at == len(block) and _key_rank(match.group(1)) > _key_rank(key):
+                insert_at = i
+        else:
+            block.insert(insert_at, line)
+
+    return "\n".join([lines[0], *block, *lines[end_idx:]])
+
+
 # ---------------------------------------------------------------------------
 # Content model registry
 # ---------------------------------------------------------------------------
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from alembic import context
-from sqlalchemy import create_engine, event, pool
+from sqlalchemy import Connection, create_engine, event, pool
 
 from ztlctl.infrastructure.database.schema import metadata
 
@@ -32,8 +32,24 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_with_connection(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
-    """Run migrations against a live database connection."""
+    """Run migrations against a live database connection.
+
+    Callers that already hold a connection pass it as
+    ``config.attributes["connection"]``; the migration then runs inside
+    the caller's transaction instead of opening the database again.
+    """
+    shared = context.config.attributes.get("connection")
+    if shared is not None:
+        _run_with_connection(shared)
+        return
+
     url = context.config.get_main_option("sqlalchemy.url")
     assert url is not None, "sqlalchemy.url must be set in Alembic config"
 
@@ -41,9 +57,7 @@ def run_migrations_online() -> None:
     event.listen(connectable, "connect", _set_sqlite_pragma)
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_with_connection(connection)
 
 
 if context.is_offline_mode():
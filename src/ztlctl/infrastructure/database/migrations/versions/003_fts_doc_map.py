@@ -0,0 +1,36 @@
+"""Add fts_doc_map for rowid-addressed FTS5 updates.
+
+Revision ID: 003_fts_doc_map
+Revises: 002_node_timestamps
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "003_fts_doc_map"
+down_revision: str | None = "002_node_timestamps"
+branch_labels: tuple[str, ...] | None = None
+depends_on: tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    # init_database() creates missing tables on every vault open, so the
+    # table may already exist by the time the migration runs.
+    if "fts_doc_map" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "fts_doc_map",
+            sa.Column("doc_id", sa.Text, primary_key=True),
+            sa.Column("fts_rowid", sa.Integer, nullable=False),
+        )
+
+    # Map existing FTS rows so their next update is addressed by rowid.
+    op.execute(
+        "INSERT OR IGNORE INTO fts_doc_map(doc_id, fts_rowid) SELECT id, rowid FROM nodes_fts"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fts_doc_map")
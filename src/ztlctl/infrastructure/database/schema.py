@@ -139,6 +139,16 @@ session_logs = Table(
     Column("metadata", Text),  # JSON object
 )
 
+# Maps node ids to nodes_fts rowids. nodes_fts.id is UNINDEXED, so a
+# ``WHERE id = ?`` against the FTS table is a full scan; per-node FTS
+# updates resolve the rowid here (B-tree) and address the FTS row by rowid.
+fts_doc_map = Table(
+    "fts_doc_map",
+    metadata,
+    Column("doc_id", Text, primary_key=True),
+    Column("fts_rowid", Integer, nullable=False),
+)
+
 # FTS5 virtual table DDL — standalone (no content= clause).
 # The service layer manages inserts/deletes explicitly alongside node ops.
 # id is UNINDEXED: stored for joins but not searched.
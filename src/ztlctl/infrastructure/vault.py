@@ -20,13 +20,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import insert, select, text
+from sqlalchemy import delete, insert, select, text
 
-from ztlctl.domain.content import parse_frontmatter, render_frontmatter
+from ztlctl.domain.content import parse_frontmatter, patch_frontmatter, render_frontmatter
 from ztlctl.domain.links import extract_frontmatter_links, extract_wikilinks
 from ztlctl.domain.tags import parse_tag_parts
 from ztlctl.infrastructure.database.engine import init_database
-from ztlctl.infrastructure.database.schema import edges, node_tags, nodes, tags_registry
+from ztlctl.infrastructure.database.schema import (
+    edges,
+    fts_doc_map,
+    node_tags,
+    nodes,
+    tags_registry,
+)
 from ztlctl.infrastructure.filesystem import find_content_files, resolve_content_path
 from ztlctl.infrastructure.graph.engine import GraphEngine
 
@@ -80,6 +86,9 @@ class VaultTransaction:
     conn: Connection
     _vault: Vault
     _file_ops: list[_FileOp] = field(default_factory=list, repr=False)
+    _events: list[tuple[int, str, dict[str, Any], list[str]]] = field(
+        default_factory=list, repr=False
+    )
 
     def write_file(self, path: Path, content: str) -> None:
         """Write *content* to *path*, tracking for rollback.
@@ -100,6 +109,46 @@ class VaultTransaction:
         rendered = render_frontmatter(frontmatter, body)
         self.write_file(path, rendered)
 
+    def patch_frontmatter_keys(self, path: Path, updates: dict[str, Any]) -> None:
+        """Set scalar frontmatter keys in *path* (tracked).
+
+        Uses a line-level patch (one read, one write, no YAML round trip)
+        and falls back to ``read_content`` + ``write_content`` when the
+        patch cannot express the change.
+        """
+        raw = self.read_file(path)
+        patched = patch_frontmatter(raw, updates)
+        if patched is None:
+            fm, body = parse_frontmatter(raw)
+            fm.update(updates)
+            self.write_content(path, fm, body)
+            return
+        path.write_text(patched, encoding="utf-8")
+        self._file_ops.append(_FileOp(path=path, backup=raw))
+
+    def defer_event(self, hook_name: str, payload: dict[str, Any], warnings: list[str]) -> None:
+        """Record a lifecycle event in this transaction; deliver after commit.
+
+        The WAL row commits (or rolls back) with the change it describes,
+        so no separate write transaction is needed, and hooks run only once
+        the change is durable. No-op if the event bus is not initialized.
+
+        INVARIANT: Plugin failures are warnings, never errors. A failed
+        WAL insert (SQLite rolls back just that statement) is reported in
+        *warnings* and the change still commits, like a failed delivery
+        after commit.
+        """
+        bus = self._vault.event_bus
+        if bus is None:
+            return
+        try:
+            event_id = bus.record(self.conn, hook_name, payload)
+        except Exception:
+            logger.debug("Event dispatch failed for %s", hook_name, exc_info=True)
+            warnings.append(f"Event dispatch failed for {hook_name}")
+            return
+        self._events.append((event_id, hook_name, payload, warnings))
+
     def read_file(self, path: Path) -> str:
         """Read raw file content (no tracking needed for reads)."""
         return path.read_text(encoding="utf-8")
@@ -124,30 +173,60 @@ class VaultTransaction:
     # ------------------------------------------------------------------
 
     def upsert_fts(self, node_id: str, title: str, body: str) -> None:
-        """Insert or replace FTS5 index entry (DELETE + INSERT pattern).
+        """Insert or replace the FTS5 index entry for a node.
 
-        FTS5 virtual tables don't support UPDATE, so we delete any
-        existing row first, then insert the new one.
+        Known nodes are updated in place by rowid via ``fts_doc_map``.
+        A missing or stale map entry falls back to deleting by id (a scan,
+        since the FTS id column is UNINDEXED) before inserting and mapping
+        the new row: vaults not yet upgraded by migration 003 have an empty
+        map but may already hold FTS rows.
         """
+        rowid = self._fts_rowid(node_id)
+        if rowid is not None:
+            updated = self.conn.execute(
+                text("UPDATE nodes_fts SET title = :title, body = :body WHERE rowid = :rowid"),
+                {"title": title, "body": body, "rowid": rowid},
+            )
+            if updated.rowcount:
+                return
         self.conn.execute(
             text("DELETE FROM nodes_fts WHERE id = :id"),
             {"id": node_id},
         )
-        self.conn.execute(
+        inserted = self.conn.execute(
             text("INSERT INTO nodes_fts(id, title, body) VALUES (:id, :title, :body)"),
             {"id": node_id, "title": title, "body": body},
         )
+        self.conn.execute(
+            insert(fts_doc_map)
+            .prefix_with("OR REPLACE")
+            .values(doc_id=node_id, fts_rowid=inserted.lastrowid)
+        )
 
     def delete_fts(self, node_id: str) -> None:
         """Remove FTS5 index entry for a node."""
-        self.conn.execute(
-            text("DELETE FROM nodes_fts WHERE id = :id"),
-            {"id": node_id},
-        )
+        rowid = self._fts_rowid(node_id)
+        if rowid is not None:
+            self.conn.execute(text("DELETE FROM nodes_fts WHERE rowid = :rowid"), {"rowid": rowid})
+            self.conn.execute(delete(fts_doc_map).where(fts_doc_map.c.doc_id == node_id))
+        else:
+            # No map entry: fall back to the id scan for any stray row
+            self.conn.execute(
+                text("DELETE FROM nodes_fts WHERE id = :id"),
+                {"id": node_id},
+            )
 
     def clear_fts(self) -> None:
         """Remove all FTS5 entries (for rebuild)."""
         self.conn.execute(text("DELETE FROM nodes_fts"))
+        self.conn.execute(delete(fts_doc_map))
+
+    def _fts_rowid(self, node_id: str) -> int | None:
+        """Look up the nodes_fts rowid for *node_id*, if mapped."""
+        rowid: int | None = self.conn.execute(
+            select(fts_doc_map.c.fts_rowid).where(fts_doc_map.c.doc_id == node_id)
+        ).scalar()
+        return rowid
 
     def index_tags(self, node_id: str, tag_list: list[str], today: str) -> int:
         """Register tags and link them to a node. Returns count indexed."""
@@ -423,3 +502,15 @@ class Vault:
                 raise
             finally:
                 self._graph.invalidate()
+
+        # Committed: hand deferred events to the bus. Anything not delivered
+        # stays pending in the WAL for the next drain.
+        bus = self._event_bus
+        if bus is None:
+            return
+        for event_id, hook_name, payload, warnings in txn._events:
+            try:
+                bus.deliver(event_id, hook_name, payload)
+            except Exception:
+                logger.debug("Event dispatch failed for %s", hook_name, exc_info=True)
+                warnings.append(f"Event dispatch failed for {hook_name}")
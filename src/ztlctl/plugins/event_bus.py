@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
@@ -20,7 +21,7 @@ from ztlctl.infrastructure.database.schema import event_wal
 from ztlctl.services._helpers import now_iso
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Engine
+    from sqlalchemy.engine import Connection, Engine
 
     from ztlctl.plugins.manager import PluginManager
 
@@ -71,8 +72,40 @@ class EventBus:
 
         Returns the WAL event row id.
         """
-        event_id = self._write_wal(hook_name, payload, session_id=session_id)
+        with self._engine.begin() as conn:
+            event_id = self.record(conn, hook_name, payload, session_id=session_id)
+        self.deliver(event_id, hook_name, payload)
+        return event_id
 
+    def record(
+        self,
+        conn: Connection,
+        hook_name: str,
+        payload: dict[str, Any],
+        *,
+        session_id: str | None = None,
+    ) -> int:
+        """Insert a pending event into the WAL on the caller's connection.
+
+        Lets a service write the event in its own transaction (commits or
+        rolls back with the change it describes); pair with :meth:`deliver`
+        after commit. Returns the WAL event row id.
+        """
+        result = conn.execute(
+            insert(event_wal).values(
+                hook_name=hook_name,
+                payload=json.dumps(payload),
+                status="pending",
+                retries=0,
+                session_id=session_id,
+                created=now_iso(),
+            )
+        )
+        assert result.lastrowid is not None
+        return result.lastrowid
+
+    def deliver(self, event_id: int, hook_name: str, payload: dict[str, Any]) -> None:
+        """Run hooks for a committed WAL event, async (or sync)."""
         if self._sync:
             self._execute_hook(event_id, hook_name, payload)
         else:
@@ -80,15 +113,22 @@ class EventBus:
             future = self._executor.submit(self._execute_hook, event_id, hook_name, payload)
             self._futures.append(future)
 
-        return event_id
-
-    def drain(self) -> list[dict[str, Any]]:
+    def drain(self, *, timeout: float | None = None) -> list[dict[str, Any]]:
         """Retry pending/failed events synchronously. Sync barrier at session close.
 
+        Args:
+            timeout: Optional overall budget in seconds. When it runs out,
+                in-flight tasks keep running in the background and any
+                events not yet retried stay in the WAL for the next drain.
+
         Returns a summary list of ``{id, hook_name, status}`` for each retried event.
         """
-        # Wait for any in-flight async tasks first.
-        self._wait_futures()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        # Wait for any in-flight async tasks first. Their events are still
+        # pending in the WAL, so skip the retry pass if any are unfinished.
+        if not self._wait_futures(deadline):
+            return []
 
         results: list[dict[str, Any]] = []
 
@@ -100,6 +140,8 @@ class EventBus:
             ).fetchall()
 
         for row in rows:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
             event_id = row.id
             hook_name = row.hook_name
             payload = json.loads(row.payload)
@@ -135,28 +177,6 @@ class EventBus:
     # Internal
     # ------------------------------------------------------------------
 
-    def _write_wal(
-        self,
-        hook_name: str,
-        payload: dict[str, Any],
-        *,
-        session_id: str | None = None,
-    ) -> int:
-        """Insert a pending event into the WAL. Returns the row id."""
-        with self._engine.begin() as conn:
-            result = conn.execute(
-                insert(event_wal).values(
-                    hook_name=hook_name,
-                    payload=json.dumps(payload),
-                    status="pending",
-                    retries=0,
-                    session_id=session_id,
-                    created=now_iso(),
-                )
-            )
-            assert result.lastrowid is not None
-            return result.lastrowid
-
     def _execute_hook(
         self,
         event_id: int,
@@ -207,11 +227,21 @@ class EventBus:
                 )
             )
 
-    def _wait_futures(self) -> None:
-        """Wait for all in-flight async futures to complete."""
+    def _wait_futures(self, deadline: float | None = None) -> bool:
+        """Wait for in-flight async futures, up to *deadline* if given.
+
+        Returns False if some futures were still running at the deadline;
+        those are kept so a later drain or shutdown can wait on them.
+        """
         for future in self._futures:
+            wait = 30.0 if deadline is None else max(deadline - time.monotonic(), 0.0)
             try:
-                future.result(timeout=30)
+                future.result(timeout=wait)
+            except TimeoutError:
+                if deadline is not None:
+                    self._futures = [f for f in self._futures if not f.done()]
+                    return False
             except Exception:
                 pass  # Errors already handled in _execute_hook
         self._futures.clear()
+        return True
@@ -317,11 +317,14 @@ class ContextAssembler:
                         entry["detail"] = str(row.detail)
                         tokens_used += detail_tokens
 
-                # Include references if present
+                # Include references if present. The stored column is already
+                # JSON, so count it as-is instead of re-encoding the list.
+                entry_json = json.dumps(entry)
                 if row.references:
                     entry["references"] = json.loads(row.references)
+                    entry_json += row.references
 
-                entry_tokens = estimate_tokens(json.dumps(entry))
+                entry_tokens = estimate_tokens(entry_json)
                 if tokens_used + entry_tokens > remaining_budget and not row.pinned:
                     continue  # Skip non-pinned entries when over budget
                 tokens_used += entry_tokens
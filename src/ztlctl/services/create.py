@@ -217,7 +217,7 @@ class CreateService(BaseService):
                 },
                 warnings,
             )
-            self._vector_index_created(created, warnings)
+        self._vector_index_created(*created_items, warnings=warnings)
 
         return ServiceResult(
             ok=True,
@@ -275,7 +275,7 @@ class CreateService(BaseService):
                 warnings,
             )
 
-        self._vector_index_created(created, warnings)
+        self._vector_index_created(created, warnings=warnings)
 
         return ServiceResult(
             ok=True,
@@ -455,9 +455,9 @@ class CreateService(BaseService):
         )
         return result, created
 
-    def _vector_index_created(self, created: _CreatedContent, warnings: list[str]) -> None:
-        """Best-effort vector indexing for newly created content."""
-        if not self._vault.settings.search.semantic_enabled:
+    def _vector_index_created(self, *created: _CreatedContent, warnings: list[str]) -> None:
+        """Best-effort vector indexing for newly created content (batched)."""
+        if not created or not self._vault.settings.search.semantic_enabled:
             return
 
         with trace_span("vector_index"):
@@ -466,8 +466,12 @@ class CreateService(BaseService):
 
                 vec_svc = VectorService(self._vault)
                 if vec_svc.is_available():
-                    vec_svc.ensure_table()
-                    vec_svc.index_node(created.content_id, f"{created.title} {created.body}")
+                    table_warning = vec_svc.ensure_table()
+                    if table_warning:
+                        warnings.append(table_warning)
+                    for item in created:
+                        vec_svc.queue_node(item.content_id, f"{item.title} {item.body}")
+                    vec_svc.flush()
             except Exception as exc:
                 warnings.append(f"Vector indexing skipped: {exc}")
 
@@ -566,13 +566,27 @@ class GraphService(BaseService):
     # ------------------------------------------------------------------
 
     @traced
-    def materialize_metrics(self) -> ServiceResult:
+    def materialize_metrics(self, *, only_if_stale: bool = False) -> ServiceResult:
         """Compute and store graph metrics in the nodes table.
 
         Computes PageRank, degree_in, degree_out, betweenness centrality,
         and cluster_id via NetworkX, then flags bidirectional edges in
         the edges table (``bidirectional = 1`` when the reverse edge exists).
+
+        With *only_if_stale*, first runs a cheap SQL probe and skips the
+        graph-wide recomputation when the stored degrees still match the
+        edges table (see :meth:`_metrics_stale`).
         """
+        if only_if_stale:
+            with self._vault.engine.connect() as conn:
+                stale = self._metrics_stale(conn)
+            if not stale:
+                return ServiceResult(
+                    ok=True,
+                    op="materialize_metrics",
+                    data={"nodes_updated": 0, "skipped": True},
+                )
+
         g = self._vault.graph.graph
 
         if g.number_of_nodes() == 0:
@@ -645,3 +659,32 @@ class GraphService(BaseService):
             data={"nodes_updated": updated, "edges_bidirectional": bidir_count},
             warnings=warnings,
         )
+
+    @staticmethod
+    def _metrics_stale(conn: Any) -> bool:
+        """Whether any node's stored metrics disagree with the graph.
+
+        Every edge insert or delete shifts some node's degree, so this
+        catches structural changes since the last materialization in one
+        indexed pass. Nodes added without edges still carry the 0.0
+        ``pagerank`` server default (``nx.pagerank`` gives every node a
+        positive score), so they count as stale too. Degree-preserving
+        rewires and isolated node removals slip through; the next real
+        change picks them up.
+        """
+        return bool(
+            conn.execute(
+                text(
+                    "SELECT EXISTS ("
+                    "  SELECT 1 FROM nodes AS n"
+                    "  WHERE n.pagerank = 0"
+                    "  OR n.degree_out != ("
+                    "    SELECT COUNT(DISTINCT e.target_id) FROM edges AS e"
+                    "    WHERE e.source_id = n.id)"
+                    "  OR n.degree_in != ("
+                    "    SELECT COUNT(DISTINCT e.source_id) FROM edges AS e"
+                    "    WHERE e.target_id = n.id)"
+                    ")"
+                )
+            ).scalar()
+        )
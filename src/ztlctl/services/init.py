@@ -198,7 +198,9 @@ class InitService:
             (snippets_dir / "ztlctl.css").write_text(_OBSIDIAN_CSS, encoding="utf-8")
             files_created.append(".obsidian/snippets/ztlctl.css")
 
-        # 7. WORKFLOW
+        # 7. WORKFLOW — serial, on this thread and after steps 4-6: Copier
+        # probes the template with a process-wide chdir, so nothing that
+        # resolves paths may run alongside it.
         if not no_workflow:
             from ztlctl.services.workflow import WorkflowService
 
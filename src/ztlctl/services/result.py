@@ -42,3 +42,14 @@ class ServiceResult(BaseModel):
     warnings: list[str] = Field(default_factory=list)
     error: ServiceError | None = None
     meta: dict[str, Any] | None = None
+
+    def with_meta(self, extra: dict[str, Any]) -> ServiceResult:
+        """Merge *extra* into ``meta`` in place and return ``self``.
+
+        Skips the full-model copy of ``model_copy(update=...)``. Bypasses
+        the frozen guard, so only the producer of a freshly built result
+        may call it (e.g. telemetry injection in ``@traced``).
+        """
+        object.__setattr__(self, "meta", {**(self.meta or {}), **extra})
+        self.__pydantic_fields_set__.add("meta")
+        return self
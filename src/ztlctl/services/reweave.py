@@ -172,6 +172,123 @@ class ReweaveService(BaseService):
             warnings=warnings,
         )
 
+    @traced
+    def reweave_many(
+        self,
+        content_ids: list[str],
+        *,
+        min_score_override: float | None = None,
+    ) -> ServiceResult:
+        """Reweave several items in one pass.
+
+        Node rows, tags, and outgoing edges are loaded once and shared by
+        every target; all suggestions are connected in a single transaction.
+        Unknown or archived ids are reported in ``failed`` rather than
+        aborting the batch.
+        """
+        op = "reweave_many"
+        cfg = self._vault.settings.reweave
+
+        if not cfg.enabled:
+            return ServiceResult(
+                ok=True,
+                op=op,
+                data={"results": [], "failed": [], "count": 0, "skipped": True},
+                warnings=["Reweave is disabled in settings"],
+            )
+
+        threshold = (
+            min_score_override if min_score_override is not None else cfg.min_score_threshold
+        )
+        plans: list[tuple[str, list[dict[str, Any]]]] = []
+        failed: list[dict[str, str]] = []
+
+        with self._vault.engine.connect() as conn:
+            # -- DISCOVER (shared) --
+            with trace_span("discover"):
+                rows = conn.execute(select(nodes).where(nodes.c.archived == 0)).fetchall()
+                by_id = {r.id: r for r in rows}
+                tag_map = self._get_tag_map(conn)
+                outgoing = self._get_outgoing_map(conn)
+
+            # -- SCORE + FILTER (per target) --
+            with trace_span("score") as span:
+                for target_id in content_ids:
+                    target = by_id.get(target_id)
+                    if target is None:
+                        failed.append(
+                            {
+                                "id": target_id,
+                                "message": f"No target found for reweave (id={target_id})",
+                            }
+                        )
+                        continue
+
+                    existing_targets = outgoing.get(target_id, set())
+                    max_new = cfg.max_links_per_note - len(existing_targets)
+                    candidates = [
+                        r for r in rows if r.id != target_id and r.id not in existing_targets
+                    ]
+                    if max_new <= 0 or not candidates:
+                        continue
+
+                    scored = self._score_candidates(
+                        conn,
+                        target_id=target_id,
+                        target_title=str(target.title),
+                        target_tags=tag_map.get(target_id, set()),
+                        target_topic=target.topic,
+                        candidates=candidates,
+                        cfg=cfg,
+                        tag_map=tag_map,
+                    )
+                    suggestions = [s for s in scored if s["score"] >= threshold]
+                    suggestions.sort(key=lambda s: s["score"], reverse=True)
+                    if suggestions:
+                        plans.append((target_id, suggestions[:max_new]))
+                if span:
+                    span.annotate("targets", len(content_ids))
+
+        # -- CONNECT (single transaction) --
+        results: list[dict[str, Any]] = []
+        if plans:
+            with trace_span("connect"):
+                today = today_iso()
+                timestamp = now_iso()
+                with self._vault.transaction() as txn:
+                    for target_id, suggestions in plans:
+                        connected = self._connect_in(txn, target_id, suggestions, today, timestamp)
+                        results.append(
+                            {
+                                "target_id": target_id,
+                                "connected": connected,
+                                "count": len(connected),
+                            }
+                        )
+
+        warnings: list[str] = []
+        for item in results:
+            self._dispatch_event(
+                "post_reweave",
+                {
+                    "source_id": item["target_id"],
+                    "affected_ids": [c["id"] for c in item["connected"]],
+                    "links_added": item["count"],
+                },
+                warnings,
+            )
+
+        return ServiceResult(
+            ok=True,
+            op=op,
+            data={
+                "results": results,
+                "failed": failed,
+                "count": sum(item["count"] for item in results),
+            },
+            warnings=warnings,
+        )
+
     @traced
     def prune(
         self,
@@ -376,6 +493,22 @@ class ReweaveService(BaseService):
         ).fetchall()
         return {str(r.tag) for r in rows}
 
+    @staticmethod
+    def _get_tag_map(conn: Connection) -> dict[str, set[str]]:
+        """Get tags for every node in one query."""
+        tag_map: dict[str, set[str]] = {}
+        for row in conn.execute(select(node_tags.c.node_id, node_tags.c.tag)):
+            tag_map.setdefault(row.node_id, set()).add(row.tag)
+        return tag_map
+
+    @staticmethod
+    def _get_outgoing_map(conn: Connection) -> dict[str, set[str]]:
+        """Get outgoing edge targets for every node in one query."""
+        outgoing: dict[str, set[str]] = {}
+        for row in conn.execute(select(edges.c.source_id, edges.c.target_id)):
+            outgoing.setdefault(row.source_id, set()).add(row.target_id)
+        return outgoing
+
     # ------------------------------------------------------------------
     # Scoring — four signals
     # ------------------------------------------------------------------
@@ -390,8 +523,12 @@ class ReweaveService(BaseService):
         target_topic: str | None,
         candidates: list[Any],
         cfg: Any,
+        tag_map: dict[str, set[str]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Score all candidates using the 4-signal weighted sum."""
+        """Score all candidates using the 4-signal weighted sum.
+
+        Pass a preloaded *tag_map* to skip the per-candidate tag query.
+        """
         # Signal 1: Lexical (BM25 percentile)
         bm25_scores = self._score_bm25(conn, target_title, candidates)
 
@@ -407,7 +544,10 @@ class ReweaveService(BaseService):
             s1 = bm25_scores.get(cand_id, 0.0)
 
             # S2: Tag overlap (Jaccard)
-            cand_tags = self._get_node_tags(conn, cand_id)
+            if tag_map is not None:
+                cand_tags = tag_map.get(cand_id, set())
+            else:
+                cand_tags = self._get_node_tags(conn, cand_id)
             s2 = _jaccard(target_tags, cand_tags)
 
             # S3: Graph proximity
@@ -534,84 +674,93 @@ class ReweaveService(BaseService):
         suggestions: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Apply link suggestions: update frontmatter, insert edges, log."""
-        today = today_iso()
-        timestamp = now_iso()
-        connected: list[dict[str, Any]] = []
-
         with self._vault.transaction() as txn:
-            # Read current file
-            node_row = txn.conn.execute(
-                select(nodes.c.path, nodes.c.maturity).where(nodes.c.id == target_id)
-            ).first()
-            if node_row is None:
-                return []
-
-            file_path = self._vault.root / node_row.path
-            fm, body = txn.read_content(file_path)
+            return self._connect_in(txn, target_id, suggestions, today_iso(), now_iso())
 
-            # Initialize links dict if not present
-            fm_links = fm.get("links", {})
-            if not isinstance(fm_links, dict):
-                fm_links = {}
+    def _connect_in(
+        self,
+        txn: VaultTransaction,
+        target_id: str,
+        suggestions: list[dict[str, Any]],
+        today: str,
+        timestamp: str,
+    ) -> list[dict[str, Any]]:
+        """Apply link suggestions for one target inside an open transaction."""
+        connected: list[dict[str, Any]] = []
 
-            relates_list = list(fm_links.get("relates", []))
+        # Read current file
+        node_row = txn.conn.execute(
+            select(nodes.c.path, nodes.c.maturity).where(nodes.c.id == target_id)
+        ).first()
+        if node_row is None:
+            return []
 
-            for suggestion in suggestions:
-                sugg_id = suggestion["id"]
-                sugg_title = suggestion["title"]
-
-                # Add to frontmatter links
-                if sugg_id not in relates_list:
-                    relates_list.append(sugg_id)
-
-                # Add body wikilink if not a garden note
-                if node_row.maturity is None:
-                    wikilink = f"[[{sugg_title}]]"
-                    if wikilink not in body:
-                        if body.strip():
-                            body = body.rstrip() + f"\n\n{wikilink}"
-                        else:
-                            body = wikilink
-
-                # Insert edge
-                txn.insert_edge(
-                    target_id,
-                    sugg_id,
-                    "relates",
-                    "frontmatter",
-                    today,
-                    check_duplicate=True,
-                )
+        file_path = self._vault.root / node_row.path
+        fm, body = txn.read_content(file_path)
+
+        # Initialize links dict if not present
+        fm_links = fm.get("links", {})
+        if not isinstance(fm_links, dict):
+            fm_links = {}
+
+        relates_list = list(fm_links.get("relates", []))
+
+        for suggestion in suggestions:
+            sugg_id = suggestion["id"]
+            sugg_title = suggestion["title"]
+
+            # Add to frontmatter links
+            if sugg_id not in relates_list:
+                relates_list.append(sugg_id)
+
+            # Add body wikilink if not a garden note
+            if node_row.maturity is None:
+                wikilink = f"[[{sugg_title}]]"
+                if wikilink not in body:
+                    if body.strip():
+                        body = body.rstrip() + f"\n\n{wikilink}"
+                    else:
+                        body = wikilink
+
+            # Insert edge
+            txn.insert_edge(
+                target_id,
+                sugg_id,
+                "relates",
+                "frontmatter",
+                today,
+                check_duplicate=True,
+            )
 
-                # Log entry
-                txn.conn.execute(
-                    insert(reweave_log).values(
-                        source_id=target_id,
-                        target_id=sugg_id,
-                        action="add",
-                        direction="outgoing",
-                        timestamp=timestamp,
-                        undone=0,
-                    )
+            # Log entry
+            txn.conn.execute(
+                insert(reweave_log).values(
+                    source_id=target_id,
+                    target_id=sugg_id,
+                    action="add",
+                    direction="outgoing",
+                    timestamp=timestamp,
+                    undone=0,
                 )
+            )
 
-                connected.append({"id": sugg_id, "title": sugg_title})
+            connected.append({"id": sugg_id, "title": sugg_title})
 
-            # Update frontmatter and write back
-            fm_links["relates"] = relates_list
-            fm["links"] = fm_links
-            fm["modified"] = today
-            txn.write_content(file_path, fm, body)
+        # Update frontmatter and write back
+        fm_links["relates"] = relates_list
+        fm["links"] = fm_links
+        fm["modified"] = today
+        txn.write_content(file_path, fm, body)
 
-            # Update FTS5
-            txn.upsert_fts(target_id, str(fm.get("title", "")), body)
+        # Update FTS5
+        txn.upsert_fts(target_id, str(fm.get("title", "")), body)
 
-            # Update modified in nodes
-            txn.conn.execute(
-                nodes.update()
-                .where(nodes.c.id == target_id)
-                .values(modified=today, modified_at=timestamp)
-            )
+        # Update modified in nodes
+        txn.conn.execute(
+            nodes.update()
+            .where(nodes.c.id == target_id)
+            .values(modified=today, modified_at=timestamp)
+        )
 
         return connected
 
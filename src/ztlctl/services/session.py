@@ -7,10 +7,13 @@ item links to its creation session. (DESIGN.md Section 2, 8)
 from __future__ import annotations
 
 import json
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, insert, select
+from sqlalchemy import func, insert, or_, select
 
+from ztlctl.domain.types import ContentType
 from ztlctl.infrastructure.database.counters import next_sequential_id
 from ztlctl.infrastructure.database.schema import edges, nodes, session_logs
 from ztlctl.services._helpers import now_iso, today_iso
@@ -18,10 +21,28 @@ from ztlctl.services.base import BaseService
 from ztlctl.services.result import ServiceError, ServiceResult
 from ztlctl.services.telemetry import trace_span, traced
 
+if TYPE_CHECKING:
+    from ztlctl.infrastructure.vault import Vault
+
+# Compact encoder for session_logs JSON columns. ``json.dumps`` builds a
+# fresh JSONEncoder on every call once non-default options are passed.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Per-type counts of non-archived nodes as a single row (COUNT ... FILTER).
+_TYPE_COUNTS_QUERY = select(
+    *(func.count(nodes.c.id).filter(nodes.c.type == t.value).label(t.value) for t in ContentType)
+).where(nodes.c.archived == 0)
+
 
 class SessionService(BaseService):
     """Handles session lifecycle and agent context."""
 
+    def __init__(self, vault: Vault) -> None:
+        """Initialize service, caching the vault's fixed root and engine."""
+        super().__init__(vault)
+        self._root = vault.root
+        self._engine = vault.engine
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -58,7 +79,7 @@ class SessionService(BaseService):
         with self._vault.transaction() as txn:
             active = self._find_active_session(txn.conn)
             if active is not None:
-                active_id = str(active.id)
+                active_id = active.id
                 return ServiceResult(
                     ok=False,
                     op=op,
@@ -100,7 +121,8 @@ class SessionService(BaseService):
                     summary=f"Session started: {topic}",
                     cost=0,
                     pinned=0,
-                    metadata=json.dumps({"topic": topic}),
+                    # Fixed-shape payload: only the topic value needs escaping
+                    metadata=f'{{"topic":{_encode_json(topic)}}}',
                 )
             )
 
@@ -124,7 +146,8 @@ class SessionService(BaseService):
     def close(self, *, summary: str | None = None) -> ServiceResult:
         """Close the active session with enrichment pipeline.
 
-        Pipeline: LOG CLOSE -> CROSS-SESSION REWEAVE -> ORPHAN SWEEP -> INTEGRITY CHECK -> REPORT
+        Pipeline: LOG CLOSE -> CROSS-SESSION REWEAVE -> ORPHAN SWEEP
+        -> (INTEGRITY CHECK || MATERIALIZE) -> REPORT
         """
         op = "session_close"
         today = today_iso()
@@ -146,7 +169,7 @@ class SessionService(BaseService):
                     ),
                 )
 
-            session_id = str(active.id)
+            session_id = active.id
 
             # Update status to closed
             txn.conn.execute(
@@ -183,19 +206,32 @@ class SessionService(BaseService):
             if span:
                 span.annotate("orphan_count", orphan_count)
 
-        # -- INTEGRITY CHECK --
-        with trace_span("integrity_check"):
-            integrity_issues = 0
+        # -- INTEGRITY CHECK || GRAPH MATERIALIZATION --
+        # Both stages follow the writers above, so the check still sees the
+        # post-reweave state. Materialization only rewrites metric columns
+        # the check never reads, so the two overlap safely (WAL readers do
+        # not block the writer).
+        integrity_issues = 0
+        integrity_warnings: list[str] = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            integrity_future = None
             if cfg.close_integrity_check:
-                integrity_issues = self._integrity_check(warnings)
+                integrity_future = pool.submit(
+                    copy_context().run, self._traced_integrity_check, integrity_warnings
+                )
+
+            with trace_span("materialize"):
+                from ztlctl.services.graph import GraphService
+
+                # Graph-wide metrics are only recomputed when edges changed
+                mat_result = GraphService(self._vault).materialize_metrics(only_if_stale=True)
 
-        # -- GRAPH MATERIALIZATION --
-        with trace_span("materialize"):
-            from ztlctl.services.graph import GraphService
+            if integrity_future is not None:
+                integrity_issues = integrity_future.result()
 
-            mat_result = GraphService(self._vault).materialize_metrics()
-            if not mat_result.ok:
-                warnings.append("Graph metric materialization failed during session close")
+        warnings.extend(integrity_warnings)
+        if not mat_result.ok:
+            warnings.append("Graph metric materialization failed during session close")
 
         # -- EVENT DISPATCH --
         self._dispatch_event(
@@ -212,10 +248,12 @@ class SessionService(BaseService):
             session_id=session_id,
         )
 
-        # Drain event bus as sync barrier
+        # Drain event bus as a bounded barrier; slow plugins finish in the
+        # background and anything left stays in the WAL for the next drain.
         bus = self._vault.event_bus
         if bus is not None:
-            bus.drain()
+            timeout_ms = cfg.close_drain_timeout_ms
+            bus.drain(timeout=timeout_ms / 1000 if timeout_ms > 0 else None)
 
         # -- REPORT --
         return ServiceResult(
@@ -264,8 +302,8 @@ class SessionService(BaseService):
                 )
 
             active = self._find_active_session(txn.conn)
-            if active is not None and str(active.id) != session_id:
-                active_id = str(active.id)
+            if active is not None and active.id != session_id:
+                active_id = active.id
                 return ServiceResult(
                     ok=False,
                     op=op,
@@ -320,10 +358,16 @@ class SessionService(BaseService):
         op = "log_entry"
         today = today_iso()
         timestamp = now_iso()
-
-        with self._vault.transaction() as txn:
+        # Encode once, outside the write transaction
+        refs_json = _encode_json(references) if references else None
+        meta_json = _encode_json(metadata) if metadata else None
+
+        # Log entries touch neither content files nor the graph (id, type,
+        # title, edges), so a plain DB transaction suffices and the cached
+        # graph survives high-frequency logging.
+        with self._engine.begin() as conn:
             # Find active session
-            active = self._find_active_session(txn.conn)
+            active = self._find_active_session(conn)
 
             if active is None:
                 return ServiceResult(
@@ -335,10 +379,10 @@ class SessionService(BaseService):
                     ),
                 )
 
-            session_id = str(active.id)
+            session_id = active.id
 
             # Insert into session_logs DB table
-            result = txn.conn.execute(
+            result = conn.execute(
                 insert(session_logs).values(
                     session_id=session_id,
                     timestamp=timestamp,
@@ -348,13 +392,13 @@ class SessionService(BaseService):
                     detail=detail,
                     cost=cost,
                     pinned=1 if pin else 0,
-                    references=json.dumps(references) if references else None,
-                    metadata=json.dumps(metadata) if metadata else None,
+                    references=refs_json,
+                    metadata=meta_json,
                 )
             )
             entry_id = result.lastrowid
 
-            txn.conn.execute(
+            conn.execute(
                 nodes.update()
                 .where(nodes.c.id == session_id)
                 .values(modified=today, modified_at=timestamp)
@@ -379,7 +423,7 @@ class SessionService(BaseService):
         """
         op = "cost"
 
-        with self._vault.engine.connect() as conn:
+        with self._engine.connect() as conn:
             # Find active session
             active = self._find_active_session(conn)
 
@@ -393,7 +437,7 @@ class SessionService(BaseService):
                     ),
                 )
 
-            session_id = str(active.id)
+            session_id = active.id
 
             # Sum costs from session_logs
             from sqlalchemy import func
@@ -433,7 +477,7 @@ class SessionService(BaseService):
         """Build token-budgeted agent context payload (delegates to ContextAssembler)."""
         from ztlctl.services.context import ContextAssembler
 
-        with self._vault.engine.connect() as conn:
+        with self._engine.connect() as conn:
             active = self._find_active_session(conn)
 
         if active is None:
@@ -453,20 +497,14 @@ class SessionService(BaseService):
     @traced
     def brief(self) -> ServiceResult:
         """Quick orientation (delegates to ContextAssembler)."""
-        from sqlalchemy import func
-
         from ztlctl.services.context import ContextAssembler
 
-        with self._vault.engine.connect() as conn:
+        with self._engine.connect() as conn:
             active = self._find_active_session(conn)
 
-            # Vault stats: type counts for non-archived nodes
-            type_rows = conn.execute(
-                select(nodes.c.type, func.count(nodes.c.id).label("cnt"))
-                .where(nodes.c.archived == 0)
-                .group_by(nodes.c.type)
-            ).fetchall()
-            vault_stats = {str(r.type): int(r.cnt) for r in type_rows}
+            # Vault stats: type counts for non-archived nodes, pivoted into one row
+            stats_row = conn.execute(_TYPE_COUNTS_QUERY).one()
+            vault_stats: dict[str, int] = stats_row._asdict()
 
         return ContextAssembler(self._vault).build_brief(active, vault_stats)
 
@@ -476,31 +514,43 @@ class SessionService(BaseService):
         op = "extract_decision"
         warnings: list[str] = []
 
-        # Find the session node
-        with self._vault.engine.connect() as conn:
+        # Find the session node and its decision-worthy log entries
+        entry_query = (
+            select(
+                session_logs.c.timestamp,
+                session_logs.c.type,
+                session_logs.c.summary,
+            )
+            .where(session_logs.c.session_id == session_id)
+            .order_by(session_logs.c.timestamp.asc())
+        )
+        with self._engine.connect() as conn:
             session_row = conn.execute(
-                select(nodes).where(nodes.c.id == session_id, nodes.c.type == "log")
+                select(nodes.c.topic).where(nodes.c.id == session_id, nodes.c.type == "log")
             ).first()
+            if session_row is None:
+                return ServiceResult(
+                    ok=False,
+                    op=op,
+                    error=ServiceError(
+                        code="NOT_FOUND",
+                        message=f"No session found with ID: {session_id}",
+                    ),
+                )
 
-        if session_row is None:
-            return ServiceResult(
-                ok=False,
-                op=op,
-                error=ServiceError(
-                    code="NOT_FOUND",
-                    message=f"No session found with ID: {session_id}",
-                ),
-            )
-
-        # Query log entries from DB
-        with self._vault.engine.connect() as conn:
-            all_rows = conn.execute(
-                select(session_logs)
-                .where(session_logs.c.session_id == session_id)
-                .order_by(session_logs.c.timestamp.asc())
+            # Pinned and decision-type entries, falling back to the full log
+            entries = conn.execute(
+                entry_query.where(
+                    or_(
+                        session_logs.c.pinned == 1,
+                        session_logs.c.type.in_(("decision_made", "decision")),
+                    )
+                )
             ).fetchall()
+            if not entries:
+                entries = conn.execute(entry_query).fetchall()
 
-        if not all_rows:
+        if not entries:
             # Pre-refactor sessions stored lifecycle events only in JSONL
             # (not in session_logs DB). If zero log_entry() calls were made,
             # the DB has no rows for this session. This is expected for
@@ -514,10 +564,6 @@ class SessionService(BaseService):
                 ),
             )
 
-        # Collect pinned and decision-type entries
-        pinned = [r for r in all_rows if r.pinned or str(r.type) in ("decision_made", "decision")]
-        entries = pinned if pinned else all_rows
-
         # Build decision body from entries
         session_topic = str(session_row.topic or "unknown")
         decision_title = title or f"Decision: {session_topic}"
@@ -547,7 +593,7 @@ class SessionService(BaseService):
             )
 
         # Overwrite the template body with extracted content
-        note_path = self._vault.root / create_result.data["path"]
+        note_path = self._root / create_result.data["path"]
         from ztlctl.infrastructure.filesystem import read_content_file, write_content_file
 
         fm, _template_body = read_content_file(note_path)
@@ -597,8 +643,7 @@ class SessionService(BaseService):
         """Reweave all notes created in this session."""
         from ztlctl.services.reweave import ReweaveService
 
-        count = 0
-        with self._vault.engine.connect() as conn:
+        with self._engine.connect() as conn:
             session_notes = conn.execute(
                 select(nodes.c.id).where(
                     nodes.c.session == session_id,
@@ -607,25 +652,21 @@ class SessionService(BaseService):
                 )
             ).fetchall()
 
-        svc = ReweaveService(self._vault)
-        for row in session_notes:
-            result = svc.reweave(content_id=str(row.id))
-            if result.ok:
-                count += result.data.get("count", 0)
-            else:
-                msg = result.error.message if result.error else "unknown"
-                warnings.append(f"Reweave failed for {row.id}: {msg}")
+        if not session_notes:
+            return 0
 
-        return count
+        result = ReweaveService(self._vault).reweave_many([r.id for r in session_notes])
+        for failure in result.data.get("failed", []):
+            warnings.append(f"Reweave failed for {failure['id']}: {failure['message']}")
+        return int(result.data.get("count", 0))
 
     def _orphan_sweep(self, warnings: list[str]) -> int:
         """Reweave orphan notes (0 outgoing edges) at lower threshold."""
         from ztlctl.services.reweave import ReweaveService
 
-        count = 0
         orphan_threshold = self._vault.settings.session.orphan_reweave_threshold
 
-        with self._vault.engine.connect() as conn:
+        with self._engine.connect() as conn:
             # Find notes with 0 outgoing edges
             all_notes = conn.execute(
                 select(nodes.c.id).where(
@@ -640,18 +681,22 @@ class SessionService(BaseService):
                     select(edges.c.source_id).where(edges.c.source_id == row.id)
                 ).fetchall()
                 if len(edge_count) == 0:
-                    orphans.append(str(row.id))
-
-        svc = ReweaveService(self._vault)
-        for orphan_id in orphans:
-            result = svc.reweave(content_id=orphan_id, min_score_override=orphan_threshold)
-            if result.ok:
-                count += result.data.get("count", 0)
-            else:
-                msg = result.error.message if result.error else "unknown"
-                warnings.append(f"Orphan reweave failed for {orphan_id}: {msg}")
-
-        return count
+                    orphans.append(row.id)
+
+        if not orphans:
+            return 0
+
+        result = ReweaveService(self._vault).reweave_many(
+            orphans, min_score_override=orphan_threshold
+        )
+        for failure in result.data.get("failed", []):
+            warnings.append(f"Orphan reweave failed for {failure['id']}: {failure['message']}")
+        return int(result.data.get("count", 0))
+
+    def _traced_integrity_check(self, warnings: list[str]) -> int:
+        """Run :meth:`_integrity_check` under its own telemetry span."""
+        with trace_span("integrity_check"):
+            return self._integrity_check(warnings)
 
     def _integrity_check(self, warnings: list[str]) -> int:
         """Run an integrity check via CheckService."""
@@ -1,6 +1,6 @@
 """Telemetry primitives — Span, @traced, trace_span.
 
-Near-zero overhead when disabled (single ContextVar.get per call).
+Near-zero overhead when disabled (single module-global read per call).
 When enabled via --verbose, builds hierarchical span trees with timing
 and injects them into ServiceResult.meta.
 """
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import functools
 import logging
+import sys
 import time
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
@@ -20,16 +21,19 @@ from ztlctl.services.result import ServiceResult
 
 logger = logging.getLogger(__name__)
 
-# ── Context variables ────────────────────────────────────────────────
+# ── Module state ─────────────────────────────────────────────────────
 
-_verbose_enabled: ContextVar[bool] = ContextVar("_verbose_enabled", default=False)
+# Process-wide switch, flipped once at startup. A plain global keeps the
+# disabled fast path to a single load; only the span stack needs
+# per-context isolation.
+_verbose_enabled: bool = False
 _current_span: ContextVar[Span | None] = ContextVar("_current_span", default=None)
 
 
 # ── Span ─────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     """Hierarchical timing span with optional cost/token tracking."""
 
@@ -59,6 +63,9 @@ class Span:
             "name": self.name,
             "duration_ms": round(self.duration_ms, 2),
         }
+        # Leaf fast path: most spans carry no optional data
+        if not self.children and not self.annotations and self.tokens is None and self.cost is None:
+            return result
         if self.tokens is not None:
             result["tokens"] = self.tokens
         if self.cost is not None:
@@ -79,7 +86,7 @@ def trace_span(name: str) -> Generator[Span | None]:
 
     Yields None when telemetry is disabled (near-zero overhead).
     """
-    if not _verbose_enabled.get():
+    if not _verbose_enabled:
         yield None
         return
 
@@ -103,14 +110,8 @@ def trace_span(name: str) -> Generator[Span | None]:
 
 
 def _inject_meta(result: ServiceResult, span: Span) -> ServiceResult:
-    """Create a new ServiceResult with span data merged into meta.
-
-    Uses model_copy(update=...) since ServiceResult is frozen.
-    """
-    telemetry = {"telemetry": span.to_dict()}
-    existing_meta = result.meta or {}
-    merged_meta = {**existing_meta, **telemetry}
-    return result.model_copy(update={"meta": merged_meta})
+    """Merge span data into the meta of the just-returned ServiceResult."""
+    return result.with_meta({"telemetry": span.to_dict()})
 
 
 def _log_span(span: Span, *, ok: bool) -> None:
@@ -138,16 +139,19 @@ def _log_span(span: Span, *, ok: bool) -> None:
 _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
+# Methods decorated while telemetry is off are left unwrapped and recorded
+# here as (original, wrapper) pairs. enable_telemetry() installs the
+# wrappers on the owning classes; disable_telemetry() restores originals.
+_deferred_methods: list[tuple[Callable[..., Any], Callable[..., Any]]] = []
+_installed: list[tuple[type, str, Any]] = []
 
-def traced(func: Callable[_P, _R]) -> Callable[_P, _R]:  # noqa: UP047
-    """Decorator: time a service method and inject span data into ServiceResult.meta.
 
-    No-op when telemetry is disabled (~10ns overhead).
-    """
+def _instrument(func: Callable[_P, _R]) -> Callable[_P, _R]:  # noqa: UP047
+    """Build the timing wrapper for *func*."""
 
     @functools.wraps(func)
     def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-        if not _verbose_enabled.get():
+        if not _verbose_enabled:
             return func(*args, **kwargs)
 
         span = Span(name=func.__qualname__)
@@ -172,21 +176,81 @@ def traced(func: Callable[_P, _R]) -> Callable[_P, _R]:  # noqa: UP047
     return wrapper
 
 
+def traced(func: Callable[_P, _R]) -> Callable[_P, _R]:  # noqa: UP047
+    """Decorator: time a service method and inject span data into ServiceResult.meta.
+
+    Class methods decorated while telemetry is disabled are returned
+    unchanged (zero call overhead) and instrumented in place by
+    :func:`enable_telemetry`. Module-level and nested functions cannot be
+    re-bound later, so they always get the wrapper (~10ns when disabled).
+    """
+    wrapper = _instrument(func)
+    qualname = func.__qualname__
+    if _verbose_enabled or "." not in qualname or "<locals>" in qualname:
+        return wrapper
+    _deferred_methods.append((func, wrapper))
+    return func
+
+
+def _resolve_owner(func: Callable[..., Any]) -> type | None:
+    """Find the class that defines *func* from its module and qualname."""
+    owner: Any = sys.modules.get(func.__module__)
+    for part in func.__qualname__.split(".")[:-1]:
+        owner = getattr(owner, part, None)
+    return owner if isinstance(owner, type) else None
+
+
+def _install_wrappers() -> None:
+    """Swap instrumented wrappers onto owning classes (idempotent)."""
+    for func, wrapper in _deferred_methods:
+        owner = _resolve_owner(func)
+        if owner is None:
+            continue
+        name = func.__name__
+        current: Any = owner.__dict__.get(name)
+        if isinstance(current, staticmethod | classmethod):
+            if current.__func__ is not func:
+                continue
+            replacement: Any = type(current)(wrapper)
+        elif current is func:
+            replacement = wrapper
+        else:
+            continue  # already installed, or replaced by someone else
+        setattr(owner, name, replacement)
+        _installed.append((owner, name, current))
+
+
+def _restore_originals() -> None:
+    """Put back the unwrapped methods replaced by :func:`_install_wrappers`."""
+    for owner, name, original in reversed(_installed):
+        setattr(owner, name, original)
+    _installed.clear()
+
+
 # ── Public helpers ───────────────────────────────────────────────────
 
 
 def enable_telemetry() -> None:
     """Enable verbose telemetry (called by AppContext at startup)."""
-    _verbose_enabled.set(True)
+    global _verbose_enabled
+    _verbose_enabled = True
+    _install_wrappers()
 
 
 def disable_telemetry() -> None:
     """Disable verbose telemetry."""
-    _verbose_enabled.set(False)
+    global _verbose_enabled
+    _verbose_enabled = False
+    _restore_originals()
+
+
+def is_telemetry_enabled() -> bool:
+    """Whether verbose telemetry is currently enabled."""
+    return _verbose_enabled
 
 
 def get_current_span() -> Span | None:
     """Get the current active span (for manual annotation)."""
-    if not _verbose_enabled.get():
+    if not _verbose_enabled:
         return None
     return _current_span.get()
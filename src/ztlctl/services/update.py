@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, func, select
 
 from ztlctl.domain.content import get_content_model
 from ztlctl.domain.lifecycle import (
@@ -32,6 +32,35 @@ _TRANSITION_MAPS: dict[str, dict[str, list[str]]] = {
     "task": TASK_TRANSITIONS,
 }
 
+# Statements are built once at import with a ``content_id`` bind parameter;
+# per call only parameters change, and SQLAlchemy's compiled cache is hit
+# without rebuilding the construct.
+
+# VALIDATE load: the node columns the pipeline uses plus its outgoing edge
+# count, so an update that leaves links alone needs no second edges query.
+_NODE_LOAD_QUERY = select(
+    nodes.c.type,
+    nodes.c.subtype,
+    nodes.c.path,
+    nodes.c.title,
+    nodes.c.status,
+    select(func.count())
+    .select_from(edges)
+    .where(edges.c.source_id == nodes.c.id)
+    .scalar_subquery()
+    .label("outdeg"),
+).where(nodes.c.id == bindparam("content_id"))
+_ARCHIVE_LOAD_QUERY = select(nodes.c.path, nodes.c.type).where(
+    nodes.c.id == bindparam("content_id")
+)
+_OUTDEGREE_QUERY = (
+    select(func.count()).select_from(edges).where(edges.c.source_id == bindparam("content_id"))
+)
+# SET columns come from the execution parameters.
+_UPDATE_NODE = nodes.update().where(nodes.c.id == bindparam("content_id"))
+_DELETE_NODE_TAGS = delete(node_tags).where(node_tags.c.node_id == bindparam("content_id"))
+_DELETE_OUT_EDGES = delete(edges).where(edges.c.source_id == bindparam("content_id"))
+
 
 class UpdateService(BaseService):
     """Handles content modification, archiving, and supersession."""
@@ -54,70 +83,14 @@ class UpdateService(BaseService):
         with self._vault.transaction() as txn:
             # ── VALIDATE ─────────────────────────────────────────
             with trace_span("validate"):
-                node_row = txn.conn.execute(select(nodes).where(nodes.c.id == content_id)).first()
-                if node_row is None:
-                    return ServiceResult(
-                        ok=False,
-                        op=op,
-                        error=ServiceError(
-                            code="NOT_FOUND",
-                            message=f"No content found with ID: {content_id}",
-                        ),
-                    )
-
+                loaded = self._load_validated(txn, content_id, changes, op, warnings)
+                if isinstance(loaded, ServiceResult):
+                    return loaded
+                node_row, fm, body = loaded
                 content_type = node_row.type
                 subtype = node_row.subtype
                 file_path = self._vault.root / node_row.path
 
-                try:
-                    model_cls = get_content_model(content_type, subtype)
-                except KeyError:
-                    return ServiceResult(
-                        ok=False,
-                        op=op,
-                        error=ServiceError(
-                            code="UNKNOWN_TYPE",
-                            message=f"Unknown type: {content_type!r} / subtype: {subtype!r}",
-                        ),
-                    )
-
-                # Read current file (files are truth)
-                fm, body = txn.read_content(file_path)
-
-                # Validate update against business rules
-                vr = model_cls.validate_update(fm, changes)
-                if not vr.valid:
-                    return ServiceResult(
-                        ok=False,
-                        op=op,
-                        error=ServiceError(
-                            code="VALIDATION_FAILED",
-                            message="; ".join(vr.errors),
-                        ),
-                    )
-                warnings.extend(vr.warnings)
-
-                # Validate status transition if status is being changed
-                if "status" in changes:
-                    new_status = str(changes["status"])
-                    current_status = str(fm.get("status", ""))
-                    transition_map = _get_transition_map(content_type, subtype)
-                    if transition_map is not None:
-                        allowed = transition_map.get(current_status, [])
-                        if new_status not in allowed:
-                            return ServiceResult(
-                                ok=False,
-                                op=op,
-                                error=ServiceError(
-                                    code="INVALID_TRANSITION",
-                                    message=(
-                                        f"Invalid status transition: "
-                                        f"{current_status} -> {new_status}. "
-                                        f"Allowed: {allowed}"
-                                    ),
-                                ),
-                            )
-
             # ── APPLY ────────────────────────────────────────────
             with trace_span("apply"):
                 fields_changed: list[str] = []
@@ -141,9 +114,7 @@ class UpdateService(BaseService):
                     fields_changed.append(key)
 
                 fm["modified"] = today
-
-                # Write back
-                txn.write_content(file_path, fm, body)
+                # The file is written once, after INDEX settles the note status.
 
             # ── PROPAGATE ────────────────────────────────────────
             with trace_span("propagate"):
@@ -178,45 +149,46 @@ class UpdateService(BaseService):
 
                 # Re-sync tags if changed
                 if "tags" in changes:
-                    txn.conn.execute(delete(node_tags).where(node_tags.c.node_id == content_id))
+                    txn.conn.execute(_DELETE_NODE_TAGS, {"content_id": content_id})
                     new_tags = fm.get("tags", [])
                     if isinstance(new_tags, list):
                         txn.index_tags(content_id, new_tags, today)
 
                 # Re-index edges if explicit links changed or body wikilinks changed
+                outdeg = node_row.outdeg
                 if "links" in changes or "body" in fields_changed:
-                    txn.conn.execute(delete(edges).where(edges.c.source_id == content_id))
+                    txn.conn.execute(_DELETE_OUT_EDGES, {"content_id": content_id})
                     fm_links = fm.get("links", {})
                     if not isinstance(fm_links, dict):
                         fm_links = {}
                     txn.index_links(content_id, fm_links, body, today)
+                    outdeg = None  # edge set changed; count the new one
 
                 if content_type == "note" and subtype != "decision":
-                    outgoing = txn.conn.execute(
-                        select(edges.c.target_id).where(edges.c.source_id == content_id)
-                    ).fetchall()
-                    computed_status = compute_note_status(len(outgoing))
+                    if outdeg is None:
+                        outdeg = txn.conn.execute(
+                            _OUTDEGREE_QUERY, {"content_id": content_id}
+                        ).scalar_one()
+                    computed_status = compute_note_status(outdeg)
                     if computed_status != str(fm.get("status", "draft")):
                         fm["status"] = computed_status
-                        fm["modified"] = today
                         update_cols["status"] = computed_status
-                        txn.write_content(file_path, fm, body)
 
-                txn.conn.execute(
-                    nodes.update().where(nodes.c.id == content_id).values(**update_cols)
-                )
+                txn.write_content(file_path, fm, body)
 
-        # ── EVENT ────────────────────────────────────────────
-        self._dispatch_event(
-            "post_update",
-            {
-                "content_type": content_type,
-                "content_id": content_id,
-                "fields_changed": fields_changed,
-                "path": node_row.path,
-            },
-            warnings,
-        )
+                txn.conn.execute(_UPDATE_NODE, {"content_id": content_id, **update_cols})
+
+            # ── EVENT (delivered after commit) ───────────────────
+            txn.defer_event(
+                "post_update",
+                {
+                    "content_type": content_type,
+                    "content_id": content_id,
+                    "fields_changed": fields_changed,
+                    "path": node_row.path,
+                },
+                warnings,
+            )
 
         # ── VECTOR RE-INDEX ──────────────────────────────────────
         if self._vault.settings.search.semantic_enabled and (
@@ -228,7 +200,9 @@ class UpdateService(BaseService):
 
                     vec_svc = VectorService(self._vault)
                     if vec_svc.is_available():
-                        vec_svc.ensure_table()
+                        table_warning = vec_svc.ensure_table()
+                        if table_warning:
+                            warnings.append(table_warning)
                         new_title = str(fm.get("title", ""))
                         vec_svc.index_node(content_id, f"{new_title} {body}")
                 except Exception as exc:
@@ -250,13 +224,12 @@ class UpdateService(BaseService):
     @traced
     def archive(self, content_id: str) -> ServiceResult:
         """Archive a content item (soft delete, preserves edges)."""
+        warnings: list[str] = []
         today = today_iso()
         now = now_iso()
 
         with self._vault.transaction() as txn:
-            node_row = txn.conn.execute(
-                select(nodes.c.id, nodes.c.path, nodes.c.type).where(nodes.c.id == content_id)
-            ).first()
+            node_row = txn.conn.execute(_ARCHIVE_LOAD_QUERY, {"content_id": content_id}).first()
             if node_row is None:
                 return ServiceResult(
                     ok=False,
@@ -267,33 +240,28 @@ class UpdateService(BaseService):
                     ),
                 )
 
-            file_path = self._vault.root / node_row.path
-            fm, body = txn.read_content(file_path)
-
-            # Set archived in frontmatter and write back
-            fm["archived"] = True
-            fm["modified"] = today
-            txn.write_content(file_path, fm, body)
+            # Set archived in frontmatter (line-level patch, no YAML round trip)
+            txn.patch_frontmatter_keys(
+                self._vault.root / node_row.path,
+                {"archived": True, "modified": today},
+            )
 
             # Update DB
             txn.conn.execute(
-                nodes.update()
-                .where(nodes.c.id == content_id)
-                .values(archived=1, modified=today, modified_at=now)
+                _UPDATE_NODE,
+                {"content_id": content_id, "archived": 1, "modified": today, "modified_at": now},
             )
 
-        # Dispatch post_close event
-        warnings: list[str] = []
-        self._dispatch_event(
-            "post_close",
-            {
-                "content_type": node_row.type,
-                "content_id": content_id,
-                "path": node_row.path,
-                "summary": "archived",
-            },
-            warnings,
-        )
+            txn.defer_event(
+                "post_close",
+                {
+                    "content_type": node_row.type,
+                    "content_id": content_id,
+                    "path": node_row.path,
+                    "summary": "archived",
+                },
+                warnings,
+            )
 
         return ServiceResult(
             ok=True,
@@ -304,12 +272,142 @@ class UpdateService(BaseService):
 
     @traced
     def supersede(self, old_id: str, new_id: str) -> ServiceResult:
-        """Supersede a decision with a new one."""
-        return self.update(
-            old_id,
-            changes={"status": "superseded", "superseded_by": new_id},
+        """Supersede a decision with a new one.
+
+        Specialized update: only ``status`` and ``superseded_by`` change, so
+        after validation this is one file write and one nodes UPDATE. The
+        FTS, tag, link and vector stages of :meth:`update` have nothing to do.
+        """
+        op = "update"
+        warnings: list[str] = []
+        today = today_iso()
+        changes: dict[str, Any] = {"status": "superseded", "superseded_by": new_id}
+
+        with self._vault.transaction() as txn:
+            with trace_span("validate"):
+                loaded = self._load_validated(txn, old_id, changes, op, warnings)
+                if isinstance(loaded, ServiceResult):
+                    return loaded
+                node_row, fm, body = loaded
+
+            with trace_span("apply"):
+                fm.update(changes)
+                fm["modified"] = today
+                txn.write_content(self._vault.root / node_row.path, fm, body)
+                txn.conn.execute(
+                    _UPDATE_NODE,
+                    {
+                        "content_id": old_id,
+                        "status": "superseded",
+                        "modified": today,
+                        "modified_at": now_iso(),
+                    },
+                )
+
+            fields_changed = list(changes)
+            txn.defer_event(
+                "post_update",
+                {
+                    "content_type": node_row.type,
+                    "content_id": old_id,
+                    "fields_changed": fields_changed,
+                    "path": node_row.path,
+                },
+                warnings,
+            )
+
+        return ServiceResult(
+            ok=True,
+            op=op,
+            data={
+                "id": old_id,
+                "path": node_row.path,
+                "fields_changed": fields_changed,
+                "status": "superseded",
+            },
+            warnings=warnings,
         )
 
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _load_validated(
+        self,
+        txn: Any,
+        content_id: str,
+        changes: dict[str, Any],
+        op: str,
+        warnings: list[str],
+    ) -> ServiceResult | tuple[Any, dict[str, Any], str]:
+        """VALIDATE stage: load the node and its file, check *changes*.
+
+        Returns ``(node_row, frontmatter, body)`` or a failed ServiceResult.
+        """
+        node_row = txn.conn.execute(_NODE_LOAD_QUERY, {"content_id": content_id}).first()
+        if node_row is None:
+            return ServiceResult(
+                ok=False,
+                op=op,
+                error=ServiceError(
+                    code="NOT_FOUND",
+                    message=f"No content found with ID: {content_id}",
+                ),
+            )
+
+        content_type = node_row.type
+        subtype = node_row.subtype
+
+        try:
+            model_cls = get_content_model(content_type, subtype)
+        except KeyError:
+            return ServiceResult(
+                ok=False,
+                op=op,
+                error=ServiceError(
+                    code="UNKNOWN_TYPE",
+                    message=f"Unknown type: {content_type!r} / subtype: {subtype!r}",
+                ),
+            )
+
+        # Read current file (files are truth)
+        fm, body = txn.read_content(self._vault.root / node_row.path)
+
+        # Validate update against business rules
+        vr = model_cls.validate_update(fm, changes)
+        if not vr.valid:
+            return ServiceResult(
+                ok=False,
+                op=op,
+                error=ServiceError(
+                    code="VALIDATION_FAILED",
+                    message="; ".join(vr.errors),
+                ),
+            )
+        warnings.extend(vr.warnings)
+
+        # Validate status transition if status is being changed
+        if "status" in changes:
+            new_status = str(changes["status"])
+            current_status = str(fm.get("status", ""))
+            transition_map = _get_transition_map(content_type, subtype)
+            if transition_map is not None:
+                allowed = transition_map.get(current_status, [])
+                if new_status not in allowed:
+                    return ServiceResult(
+                        ok=False,
+                        op=op,
+                        error=ServiceError(
+                            code="INVALID_TRANSITION",
+                            message=(
+                                f"Invalid status transition: "
+                                f"{current_status} -> {new_status}. "
+                                f"Allowed: {allowed}"
+                            ),
+                        ),
+                    )
+        return node_row, fm, body
+
 
 def _get_transition_map(content_type: str, subtype: str | None) -> dict[str, list[str]] | None:
     """Get the transition map for a content type/subtype."""
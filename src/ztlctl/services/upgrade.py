@@ -48,21 +48,13 @@ class UpgradeService(BaseService):
                 ctx = MigrationContext.configure(conn)
                 current = ctx.get_current_revision()
 
-            # Collect pending revisions by walking from head down to current
+            # Pending revisions, head first, down to (excluding) current
             pending: list[dict[str, Any]] = []
             if current != head and head is not None:
-                rev_obj = script.get_revision(head)
-                while rev_obj is not None and rev_obj.revision != current:
-                    pending.append(
-                        {
-                            "revision": rev_obj.revision,
-                            "description": rev_obj.doc or "",
-                        }
-                    )
-                    down = rev_obj.down_revision
-                    if down is None:
-                        break
-                    rev_obj = script.get_revision(str(down))
+                pending = [
+                    {"revision": rev.revision, "description": rev.doc or ""}
+                    for rev in script.iterate_revisions(head, current)
+                ]
 
             return ServiceResult(
                 ok=True,
@@ -126,12 +118,17 @@ class UpgradeService(BaseService):
         try:
             cfg = build_config(self._db_url())
             current = check_result.data.get("current")
-            if current is None and self._tables_exist():
-                # Pre-Alembic vault: tables exist but no version tracking.
-                # Stamp at head instead of running CREATE TABLE migrations.
-                command.stamp(cfg, "head")
-            else:
-                command.upgrade(cfg, "head")
+            pre_alembic = current is None and self._tables_exist()
+            # Run Alembic on the vault's pooled connection, in one
+            # transaction, instead of letting env.py open the file again.
+            with self._vault.engine.begin() as conn:
+                cfg.attributes["connection"] = conn
+                if pre_alembic:
+                    # Pre-Alembic vault: tables exist but no version tracking.
+                    # Stamp at head instead of running CREATE TABLE migrations.
+                    command.stamp(cfg, "head")
+                else:
+                    command.upgrade(cfg, "head")
         except Exception as exc:
             return ServiceResult(
                 ok=False,
@@ -173,7 +170,9 @@ class UpgradeService(BaseService):
 
         try:
             cfg = build_config(self._db_url())
-            command.stamp(cfg, "head")
+            with self._vault.engine.begin() as conn:
+                cfg.attributes["connection"] = conn
+                command.stamp(cfg, "head")
             script = ScriptDirectory.from_config(cfg)
             head = script.get_current_head()
 
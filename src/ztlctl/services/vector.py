@@ -7,10 +7,11 @@ All operations gated by is_available() — graceful no-op when deps missing.
 from __future__ import annotations
 
 import logging
-import struct
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, bindparam, text
 
 from ztlctl.services.base import BaseService
 from ztlctl.services.result import ServiceError, ServiceResult
@@ -21,10 +22,105 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Source rows per fetch/embed/insert round in reindex_all.
+_REINDEX_BATCH_SIZE = 1024
 
-def _serialize_f32(vec: list[float]) -> bytes:
-    """Serialize a float list to compact binary format for sqlite-vec."""
-    return struct.pack(f"{len(vec)}f", *vec)
+# IDs per DELETE ... IN statement; stays under SQLite's bound-parameter cap.
+_DELETE_BATCH_SIZE = 500
+
+_REINDEX_SOURCE_SQL = text(
+    "SELECT n.id, TRIM(n.title || ' ' || COALESCE(fts.body, ''), ' ' || char(9, 10, 13)) "
+    "FROM nodes n LEFT JOIN nodes_fts fts ON n.id = fts.id "
+    "WHERE n.archived = 0"
+)
+
+_DELETE_IDS = text("DELETE FROM vec_items WHERE node_id IN :ids").bindparams(
+    bindparam("ids", expanding=True)
+)
+
+# conn.info marker: sqlite-vec already loaded into this DBAPI connection.
+_VEC_LOADED_KEY = "ztlctl.sqlite_vec_loaded"
+
+# int8 quantization scale: unit vectors map onto [-127, 127].
+_INT8_SCALE = 127.0
+
+# Process-wide result of the first is_available() probe. Whether sqlite-vec
+# imports and loads does not change within a process, so later services
+# skip the connection checkout, import and extension load.
+_vec_available: bool | None = None
+
+
+def _serialize_f32(vec: Sequence[float]) -> bytes:
+    """Serialize a float vector to compact binary format for sqlite-vec.
+
+    numpy (installed with scipy) converts the whole vector in one C loop;
+    ``struct.pack`` would unpack it through an argument tuple element by
+    element. Imported lazily so loading this module stays cheap.
+    """
+    import numpy as np
+
+    return np.asarray(vec, dtype=np.float32).tobytes()
+
+
+def _serialize_int8(vec: Sequence[float]) -> bytes:
+    """Quantize a vector to int8 for an ``int8[dim]`` vec0 column.
+
+    The vector is L2-normalized and scaled by 127, so every row shares one
+    scale and vec0 distances stay comparable across rows (a per-row scale
+    would be invisible to the KNN scan). Normalizing keeps the cosine
+    ranking; sentence-transformers models mostly emit unit vectors anyway.
+    """
+    import numpy as np
+
+    arr = np.asarray(vec, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    if norm > 0.0:
+        arr = arr / norm
+    return np.clip(np.rint(arr * _INT8_SCALE), -127, 127).astype(np.int8).tobytes()
+
+
+@dataclass(frozen=True, slots=True)
+class _VecCodec:
+    """Storage format of ``vec_items.embedding`` and the statements bound to it."""
+
+    column_type: str
+    serialize: Callable[[Sequence[float]], bytes]
+    insert: TextClause
+    # KNN query in driver paramstyle. Executed via exec_driver_sql so no
+    # SQLAlchemy compilation happens per call; sqlite3's per-connection
+    # statement cache reuses the prepared statement for this exact string.
+    search_sql: str
+    # Stored vectors are this multiple of unit scale; search_similar divides
+    # distances by it so callers always see unit-scale distances.
+    distance_scale: float = 1.0
+
+
+def _make_codec(
+    column_type: str,
+    serialize: Callable[[Sequence[float]], bytes],
+    wrap: str,
+    distance_scale: float = 1.0,
+) -> _VecCodec:
+    """Build a codec; *wrap* is the SQL that turns a bound blob into a vector."""
+    emb, qvec = wrap.format(":emb"), wrap.format("?")
+    return _VecCodec(
+        column_type=column_type,
+        serialize=serialize,
+        insert=text(f"INSERT INTO vec_items(node_id, embedding) VALUES (:nid, {emb})"),
+        search_sql=(
+            f"SELECT node_id, distance FROM vec_items "
+            f"WHERE embedding MATCH {qvec} AND k = ? ORDER BY distance"
+        ),
+        distance_scale=distance_scale,
+    )
+
+
+# Keyed by SearchConfig.embedding_storage. int8 stores 1 byte per dimension
+# instead of 4, so the brute-force MATCH scan reads a quarter of the data.
+_CODECS: dict[str, _VecCodec] = {
+    "float32": _make_codec("FLOAT", _serialize_f32, "{}"),
+    "int8": _make_codec("INT8", _serialize_int8, "vec_int8({})", _INT8_SCALE),
+}
 
 
 class VectorService(BaseService):
@@ -39,6 +135,8 @@ class VectorService(BaseService):
         super().__init__(vault)
         self._provider = provider
         self._vec_available: bool | None = None
+        self._pending: dict[str, str] = {}
+        self._codec = _CODECS[vault.settings.search.embedding_storage]
 
     def _ensure_provider(self) -> EmbeddingProvider:
         if self._provider is None:
@@ -63,9 +161,16 @@ class VectorService(BaseService):
 
     @classmethod
     def _load_sqlite_vec(cls, conn: Any) -> Any:
-        """Load sqlite-vec into the active sqlite connection."""
+        """Load sqlite-vec into the active sqlite connection.
+
+        Pooled DBAPI connections are reused across ``engine.connect()``
+        calls, so the load is recorded in ``conn.info`` (which lives as long
+        as the DBAPI connection) and skipped on later checkouts.
+        """
         import sqlite_vec  # type: ignore[import-not-found]
 
+        if conn.info.get(_VEC_LOADED_KEY) is True:
+            return sqlite_vec
         raw = cls._driver_connection(conn)
         enable_load_extension = getattr(raw, "enable_load_extension", None)
         if callable(enable_load_extension):
@@ -75,34 +180,59 @@ class VectorService(BaseService):
         finally:
             if callable(enable_load_extension):
                 enable_load_extension(False)
+        conn.info[_VEC_LOADED_KEY] = True
         return sqlite_vec
 
     def is_available(self) -> bool:
-        """Check if sqlite-vec extension can be loaded."""
+        """Check if sqlite-vec extension can be loaded.
+
+        The probe runs once per process; ``self._vec_available`` overrides it
+        per instance.
+        """
+        global _vec_available
         if self._vec_available is not None:
             return self._vec_available
-        try:
-            with self._vault.engine.connect() as conn:
-                self._load_sqlite_vec(conn)
-            self._vec_available = True
-        except Exception:
-            self._vec_available = False
-        return self._vec_available
+        if _vec_available is None:
+            try:
+                with self._vault.engine.connect() as conn:
+                    self._load_sqlite_vec(conn)
+                _vec_available = True
+            except Exception:
+                _vec_available = False
+        self._vec_available = _vec_available
+        return _vec_available
 
-    def ensure_table(self) -> None:
-        """Create the vec_items virtual table if it doesn't exist."""
+    def ensure_table(self) -> str | None:
+        """Create the vec_items virtual table if it doesn't exist.
+
+        Returns a warning when an existing table had to be recreated for a
+        new storage type or dimension, since its vectors are then gone.
+        """
         if not self.is_available():
-            return
-        dim = self._vault.settings.search.embedding_dim
-        with self._vault.engine.connect() as conn:
+            return None
+        warning = None
+        column = f"embedding {self._codec.column_type}[{self._vault.settings.search.embedding_dim}]"
+        with self._vault.engine.begin() as conn:
             self._load_sqlite_vec(conn)
+            ddl = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = 'vec_items'")
+            ).scalar()
+            if ddl is not None and column not in ddl:
+                # Storage type or dimension changed; vectors are derived data
+                # and are rebuilt by `ztlctl vector reindex`.
+                warning = (
+                    "Vector index layout changed; existing embeddings were dropped. "
+                    "Run `ztlctl vector reindex` to rebuild them."
+                )
+                logger.warning(warning)
+                conn.execute(text("DROP TABLE vec_items"))
             conn.execute(
                 text(
                     f"CREATE VIRTUAL TABLE IF NOT EXISTS vec_items "
-                    f"USING vec0(node_id TEXT PRIMARY KEY, embedding FLOAT[{dim}])"
+                    f"USING vec0(node_id TEXT PRIMARY KEY, {column})"
                 )
             )
-            conn.commit()
+        return warning
 
     @traced
     def index_node(self, node_id: str, content: str) -> None:
@@ -111,26 +241,68 @@ class VectorService(BaseService):
             return
         provider = self._ensure_provider()
         vec = provider.embed(content)
-        blob = _serialize_f32(vec)
-        with self._vault.engine.connect() as conn:
+        params = {"nid": node_id, "emb": self._codec.serialize(vec)}
+        with self._vault.engine.begin() as conn:
             self._load_sqlite_vec(conn)
-            # Upsert: delete then insert (sqlite-vec doesn't support ON CONFLICT)
-            conn.execute(text("DELETE FROM vec_items WHERE node_id = :nid"), {"nid": node_id})
-            conn.execute(
-                text("INSERT INTO vec_items(node_id, embedding) VALUES (:nid, :emb)"),
-                {"nid": node_id, "emb": blob},
-            )
-            conn.commit()
+            # vec0 has no ON CONFLICT / OR REPLACE: replace by DELETE + INSERT
+            self._delete_ids(conn, [node_id])
+            conn.execute(self._codec.insert, params)
+
+    def queue_node(self, node_id: str, content: str) -> None:
+        """Queue content for embedding on the next :meth:`flush`.
+
+        Re-queuing a node before the flush replaces its pending content.
+        """
+        self._pending[node_id] = content
+
+    @traced
+    def flush(self, *, batch_size: int = 256) -> int:
+        """Embed and store all queued nodes; returns how many were written.
+
+        Each batch is one ``embed_batch`` call and one transaction with
+        a batched DELETE + executemany INSERT, instead of a round trip per node.
+        """
+        pending, self._pending = self._pending, {}
+        if not pending or not self.is_available():
+            return 0
+        provider = self._ensure_provider()
+        items = list(pending.items())
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+            with trace_span("batch_embed"):
+                vectors = provider.embed_batch([content for _, content in batch])
+            with self._vault.engine.begin() as conn:
+                self._load_sqlite_vec(conn)
+                self._delete_ids(conn, [nid for nid, _ in batch])
+                conn.execute(
+                    self._codec.insert,
+                    [
+                        {"nid": nid, "emb": self._codec.serialize(vec)}
+                        for (nid, _), vec in zip(batch, vectors)
+                    ],
+                )
+        return len(items)
+
+    @staticmethod
+    def _delete_ids(conn: Any, node_ids: Sequence[str]) -> None:
+        """DELETE the given node IDs with one IN statement per slice."""
+        for start in range(0, len(node_ids), _DELETE_BATCH_SIZE):
+            conn.execute(_DELETE_IDS, {"ids": list(node_ids[start : start + _DELETE_BATCH_SIZE])})
 
     @traced
     def remove_node(self, node_id: str) -> None:
         """Remove a node's embedding from vec_items."""
-        if not self.is_available():
+        self.remove_nodes([node_id])
+
+    @traced
+    def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """Remove several nodes' embeddings in one transaction."""
+        ids = list(node_ids)
+        if not ids or not self.is_available():
             return
-        with self._vault.engine.connect() as conn:
+        with self._vault.engine.begin() as conn:
             self._load_sqlite_vec(conn)
-            conn.execute(text("DELETE FROM vec_items WHERE node_id = :nid"), {"nid": node_id})
-            conn.commit()
+            self._delete_ids(conn, ids)
 
     @traced
     def search_similar(
@@ -145,20 +317,14 @@ class VectorService(BaseService):
         provider = self._ensure_provider()
         with trace_span("embed_query"):
             query_vec = provider.embed(query_text)
-        blob = _serialize_f32(query_vec)
+        blob = self._codec.serialize(query_vec)
 
         with self._vault.engine.connect() as conn:
-            self._load_sqlite_vec(conn)
-            rows = conn.execute(
-                text(
-                    "SELECT node_id, distance FROM vec_items "
-                    "WHERE embedding MATCH :qvec AND k = :k "
-                    "ORDER BY distance"
-                ),
-                {"qvec": blob, "k": limit},
-            ).fetchall()
+            self._load_sqlite_vec(conn)  # no-op once loaded on this connection
+            rows = conn.exec_driver_sql(self._codec.search_sql, (blob, limit)).fetchall()
 
-        return [{"node_id": r.node_id, "distance": float(r.distance)} for r in rows]
+        scale = self._codec.distance_scale
+        return [{"node_id": node_id, "distance": distance / scale} for node_id, distance in rows]
 
     @traced
     def reindex_all(self) -> ServiceResult:
@@ -175,37 +341,36 @@ class VectorService(BaseService):
             )
         provider = self._ensure_provider()
 
-        with self._vault.engine.connect() as conn:
-            rows = conn.execute(
-                text(
-                    "SELECT n.id, n.title, COALESCE(fts.body, '') AS body "
-                    "FROM nodes n LEFT JOIN nodes_fts fts ON n.id = fts.id "
-                    "WHERE n.archived = 0"
-                )
-            ).fetchall()
-
-        texts = [f"{r.title} {r.body}".strip() for r in rows]
-        node_ids = [r.id for r in rows]
-
-        if not texts:
-            return ServiceResult(ok=True, op=op, data={"indexed_count": 0})
-
-        with trace_span("batch_embed"):
-            vectors = provider.embed_batch(texts)
-
-        with self._vault.engine.connect() as conn:
+        # One BEGIN...COMMIT for the whole rebuild. Source rows are streamed
+        # in batches (fetch -> embed -> insert), so memory is bounded by one
+        # batch of bodies and vectors rather than the whole vault.
+        indexed = 0
+        with self._vault.engine.begin() as conn:
             self._load_sqlite_vec(conn)
-            conn.execute(text("DELETE FROM vec_items"))
-            for nid, vec in zip(node_ids, vectors):
-                blob = _serialize_f32(vec)
+            existing = set(conn.execute(text("SELECT node_id FROM vec_items")).scalars())
+            live: set[str] = set()
+            # SQLite assembles "title body" so no per-row Python formatting.
+            source = conn.execution_options(stream_results=True).execute(_REINDEX_SOURCE_SQL)
+            for batch in source.partitions(_REINDEX_BATCH_SIZE):
+                node_ids = [node_id for node_id, _ in batch]
+                with trace_span("batch_embed"):
+                    vectors = provider.embed_batch([content for _, content in batch])
+                # Replace rows in place instead of wiping the table first.
+                self._delete_ids(conn, [nid for nid in node_ids if nid in existing])
                 conn.execute(
-                    text("INSERT INTO vec_items(node_id, embedding) VALUES (:nid, :emb)"),
-                    {"nid": nid, "emb": blob},
+                    self._codec.insert,
+                    [
+                        {"nid": nid, "emb": self._codec.serialize(vec)}
+                        for nid, vec in zip(node_ids, vectors)
+                    ],
                 )
-            conn.commit()
+                live.update(node_ids)
+                indexed += len(node_ids)
+            # Drop vectors whose node is gone or archived.
+            self._delete_ids(conn, sorted(existing - live))
 
         return ServiceResult(
             ok=True,
             op=op,
-            data={"indexed_count": len(node_ids)},
+            data={"indexed_count": indexed},
         )
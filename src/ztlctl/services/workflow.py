@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import atexit
+import functools
+import itertools
+import os
+import re
+from collections.abc import Callable, Mapping
+from contextlib import ExitStack
 from importlib import resources
-from importlib.resources.abc import Traversable
 from pathlib import Path
-from typing import Literal, cast
-
-from copier import run_copy, run_recopy, run_update
-from copier.errors import CopierError
-from ruamel.yaml import YAML
-from ruamel.yaml.error import YAMLError
+from types import MappingProxyType
+from typing import Any, Literal, NamedTuple, cast
 
 from ztlctl.services.result import ServiceError, ServiceResult
 from ztlctl.services.telemetry import traced
@@ -21,23 +22,90 @@ SkillSet = Literal["research", "engineering", "minimal"]
 SourceControl = Literal["git", "none"]
 Viewer = Literal["obsidian", "vanilla"]
 
-_ANSWERS_RELATIVE_PATH = Path(".ztlctl") / "workflow-answers.yml"
-_GENERATED_FILES = [
+_ANSWERS_FILE = os.path.join(".ztlctl", "workflow-answers.yml")
+# Immutable, so results can share it instead of copying per call.
+_GENERATED_FILES: tuple[str, ...] = (
     ".ztlctl/workflow-answers.yml",
     ".ztlctl/workflow/README.md",
     ".ztlctl/workflow/source-control.md",
     ".ztlctl/workflow/viewer.md",
     ".ztlctl/workflow/operating-mode.md",
     ".ztlctl/workflow/skill-set.md",
-]
-_SOURCE_CONTROL_VALUES = {"git", "none"}
-_VIEWER_VALUES = {"obsidian", "vanilla"}
-_WORKFLOW_VALUES = {"claude-driven", "agent-generic", "manual"}
-_SKILL_SET_VALUES = {"research", "engineering", "minimal"}
+)
+_SOURCE_CONTROL_VALUES = ("git", "none")
+_VIEWER_VALUES = ("obsidian", "vanilla")
+_WORKFLOW_VALUES = ("claude-driven", "agent-generic", "manual")
+_SKILL_SET_VALUES = ("research", "engineering", "minimal")
+# Every valid (source_control, viewer, workflow, skill_set) combination:
+# 36 tuples, so validating stored answers is one hash lookup.
+_VALID_CHOICES: frozenset[tuple[str, str, str, str]] = frozenset(
+    itertools.product(_SOURCE_CONTROL_VALUES, _VIEWER_VALUES, _WORKFLOW_VALUES, _SKILL_SET_VALUES)
+)
+
+
+@functools.cache
+def _yaml_backend() -> tuple[Callable[[bytes], Any], tuple[type[Exception], ...]]:
+    """Pick the answers YAML loader and its error types on first use.
+
+    PyYAML (a Copier dependency) with libyaml parses in C; ruamel's safe
+    loader is pure Python here. Imported lazily: most files never need
+    either, because the line scanner handles them.
+    """
+    try:
+        import yaml as pyyaml  # type: ignore[import-untyped]
+    except ImportError:
+        pass
+    else:
+        if hasattr(pyyaml, "CSafeLoader"):
+            load = functools.partial(pyyaml.load, Loader=pyyaml.CSafeLoader)
+            return load, (pyyaml.YAMLError,)
+
+    from ruamel.yaml import YAML
+    from ruamel.yaml.error import YAMLError
+
+    # Load-only safe parser. Unlike the round-trip dumper in
+    # domain.content, a safe load leaves no emitter state behind to corrupt.
+    return YAML(typ="safe").load, (YAMLError,)
+
+
+# Copier's answers file is ~120 bytes. Larger files were edited by hand and
+# are likely to need the YAML loader anyway, so skip the line scan.
+_SCAN_MAX_BYTES = 512
+
+# One ``key: scalar`` line of the flat file Copier writes. Anything this
+# does not cover (flow style, anchors, comments after values, ...) is
+# handed to the YAML loader instead.
+_ANSWER_LINE = re.compile(
+    rb"([A-Za-z_][\w-]*):[ \t]+"
+    rb"(?:'([^'\r\n]*)'|\"([^\"\\\r\n]*)\"|([\w./~+](?:[\w./~+:-]*[\w./~+-])?))[ \t]*"
+)
+
+
+def _scan_answers(raw: bytes) -> dict[str, str] | None:
+    """Parse a flat ``key: value`` answers file without a YAML loader.
+
+    Returns None when the file uses any syntax beyond plain or simply
+    quoted scalars, so the caller can fall back to a full parse.
+    """
+    fields: dict[str, str] = {}
+    for line in raw.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(b"#"):
+            continue
+        match = _ANSWER_LINE.fullmatch(line)
+        if match is None:
+            return None
+        key = match[1].decode()
+        if key in fields:
+            return None
+        value = match[2] if match[2] is not None else match[3]
+        if value is None:
+            value = match[4]
+        fields[key] = value.decode()
+    return fields
 
 
-@dataclass(frozen=True)
-class WorkflowChoices:
+class WorkflowChoices(NamedTuple):
     """Resolved workflow selections used for Copier rendering."""
 
     source_control: SourceControl
@@ -45,14 +113,98 @@ class WorkflowChoices:
     workflow: WorkflowMode
     skill_set: SkillSet
 
-    def as_data(self) -> dict[str, str]:
-        """Convert to Copier's expected mapping."""
-        return {
-            "source_control": self.source_control,
-            "viewer": self.viewer,
-            "workflow": self.workflow,
-            "skill_set": self.skill_set,
-        }
+    def as_data(self) -> Mapping[str, str]:
+        """Copier's expected mapping (read-only view, shared by equal choices)."""
+        return _choices_data(self)
+
+
+@functools.lru_cache(maxsize=64)
+def _choices_data(choices: WorkflowChoices) -> Mapping[str, str]:
+    # Immutable, so the mapping never changes: build it once per selection.
+    return MappingProxyType(choices._asdict())
+
+
+# Hash-consing table: equal selection sets share one WorkflowChoices object.
+# Tuples cannot be weakly referenced, but at most 36 valid selections exist.
+_CHOICES_INTERN: dict[tuple[str, str, str, str], WorkflowChoices] = {}
+
+
+def _intern_choices(
+    source_control: SourceControl, viewer: Viewer, workflow: WorkflowMode, skill_set: SkillSet
+) -> WorkflowChoices:
+    """Return the shared WorkflowChoices for these selections."""
+    key = (source_control, viewer, workflow, skill_set)
+    choices = _CHOICES_INTERN.get(key)
+    if choices is None:
+        choices = WorkflowChoices(*key)
+        _CHOICES_INTERN[key] = choices
+    return choices
+
+
+@functools.lru_cache(maxsize=32)
+def _answers_path_for(vault_root: str) -> str:
+    """Return the answers file path under *vault_root*, built once per root."""
+    return os.path.join(vault_root, _ANSWERS_FILE)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_answers_file(path: str, mtime_ns: int, size: int, inode: int) -> WorkflowChoices | None:
+    """Parse and validate an answers file, memoized on its stat identity.
+
+    Any rewrite changes mtime/size/inode, so stale entries are never hit.
+    Read errors propagate and are therefore not cached.
+    """
+    raw = Path(path).read_bytes()
+    data: Any = _scan_answers(raw) if size <= _SCAN_MAX_BYTES else None
+    if data is None:
+        load, errors = _yaml_backend()
+        try:
+            data = load(raw)  # both loaders decode UTF-8 themselves
+        except errors:
+            return None
+    if not isinstance(data, dict):
+        return None
+
+    key = (
+        data.get("source_control"),
+        data.get("viewer"),
+        data.get("workflow"),
+        data.get("skill_set"),
+    )
+    try:
+        if key not in _VALID_CHOICES:
+            return None
+    except TypeError:  # unhashable value, e.g. a YAML list
+        return None
+    source_control, viewer, workflow, skill_set = key
+    return _intern_choices(
+        cast(SourceControl, source_control),
+        cast(Viewer, viewer),
+        cast(WorkflowMode, workflow),
+        cast(SkillSet, skill_set),
+    )
+
+
+def _check_generated_files(vault_root: Path) -> tuple[tuple[str, ...], list[str]]:
+    """Split _GENERATED_FILES into (present, missing) under *vault_root*.
+
+    Lists each parent directory once instead of stat-ing every file.
+    """
+    listings: dict[str, set[str]] = {}
+    present: list[str] = []
+    missing: list[str] = []
+    for rel_path in _GENERATED_FILES:
+        parent, _, name = rel_path.rpartition("/")
+        found = listings.get(parent)
+        if found is None:
+            try:
+                with os.scandir(vault_root / parent) as it:
+                    found = {entry.name for entry in it if entry.is_file()}
+            except OSError:
+                found = set()
+            listings[parent] = found
+        (present if name in found else missing).append(rel_path)
+    return tuple(present), missing
 
 
 class WorkflowService:
@@ -61,55 +213,38 @@ class WorkflowService:
     @staticmethod
     def default_choices(*, viewer: Viewer = "obsidian") -> WorkflowChoices:
         """Return the default workflow selection set."""
-        return WorkflowChoices(
-            source_control="git",
-            viewer=viewer,
-            workflow="claude-driven",
-            skill_set="research",
-        )
+        return _intern_choices("git", viewer, "claude-driven", "research")
 
     @staticmethod
     def read_answers(vault_root: Path) -> WorkflowChoices | None:
         """Read the stored workflow answers file if present."""
-        answers_path = vault_root / _ANSWERS_RELATIVE_PATH
-        if not answers_path.exists():
-            return None
-
+        answers_path = _answers_path_for(os.fspath(vault_root))
         try:
-            data = YAML(typ="safe").load(answers_path.read_text(encoding="utf-8"))
-        except (OSError, UnicodeError, YAMLError):
+            st = os.stat(answers_path)
+        except OSError:
             return None
-        if not isinstance(data, dict):
-            return None
-
         try:
-            source_control = cast(SourceControl, str(data["source_control"]))
-            viewer = cast(Viewer, str(data["viewer"]))
-            workflow = cast(WorkflowMode, str(data["workflow"]))
-            skill_set = cast(SkillSet, str(data["skill_set"]))
-        except KeyError:
-            return None
-        if source_control not in _SOURCE_CONTROL_VALUES:
-            return None
-        if viewer not in _VIEWER_VALUES:
-            return None
-        if workflow not in _WORKFLOW_VALUES:
+            return _read_answers_file(answers_path, st.st_mtime_ns, st.st_size, st.st_ino)
+        except (OSError, UnicodeError):
             return None
-        if skill_set not in _SKILL_SET_VALUES:
-            return None
-
-        return WorkflowChoices(
-            source_control=source_control,
-            viewer=viewer,
-            workflow=workflow,
-            skill_set=skill_set,
-        )
 
     @staticmethod
-    def _validate_vault_root(vault_root: Path, *, op: str) -> ServiceResult | None:
-        """Ensure the workflow service operates on a vault-like directory."""
-        if (vault_root / "ztlctl.toml").exists() or (vault_root / ".ztlctl").exists():
-            return None
+    def _probe_vault_root(vault_root: Path, *, op: str) -> ServiceResult | bool:
+        """Ensure *vault_root* is vault-like; report whether answers exist.
+
+        One directory listing answers both vault markers; the answers file
+        is only stat'ed when ``.ztlctl/`` is present. Returns a failed
+        ServiceResult for non-vaults, else whether the answers file exists.
+        """
+        try:
+            with os.scandir(vault_root) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            entries = set()
+        if ".ztlctl" in entries:
+            return os.path.exists(_answers_path_for(os.fspath(vault_root)))
+        if "ztlctl.toml" in entries:
+            return False
         return ServiceResult(
             ok=False,
             op=op,
@@ -121,27 +256,40 @@ class WorkflowService:
         )
 
     @staticmethod
-    def _template_root() -> Traversable:
-        """Return the packaged Copier template root."""
-        return resources.files("ztlctl").joinpath("templates/workflow")
+    @functools.cache
+    def _template_root() -> Path:
+        """Return the packaged Copier template as a directory on disk.
+
+        Regular installs already have it on disk. Zipped packages extract
+        it once and keep it until interpreter exit, rather than per copy.
+        """
+        root = resources.files("ztlctl").joinpath("templates/workflow")
+        if isinstance(root, Path):
+            return root
+        stack = ExitStack()
+        extracted = stack.enter_context(resources.as_file(root))
+        atexit.register(stack.close)
+        return extracted
 
     @staticmethod
     def validate_init_target(vault_root: Path) -> ServiceResult | None:
-        """Validate that a vault can accept initial workflow scaffolding."""
-        vault_root = vault_root.resolve()
-        validation_error = WorkflowService._validate_vault_root(vault_root, op="workflow_init")
-        if validation_error is not None:
-            return validation_error
+        """Validate that a vault can accept initial workflow scaffolding.
 
-        answers_path = vault_root / _ANSWERS_RELATIVE_PATH
-        if answers_path.exists():
+        *vault_root* must already be resolved; callers resolve it once and
+        reuse it for the copy/update that follows.
+        """
+        probe = WorkflowService._probe_vault_root(vault_root, op="workflow_init")
+        if isinstance(probe, ServiceResult):
+            return probe
+
+        if probe:
             return ServiceResult(
                 ok=False,
                 op="workflow_init",
                 error=ServiceError(
                     code="WORKFLOW_EXISTS",
                     message="Workflow scaffolding already exists. Use `ztlctl workflow update`.",
-                    detail={"path": str(answers_path)},
+                    detail={"path": _answers_path_for(os.fspath(vault_root))},
                 ),
             )
 
@@ -149,21 +297,23 @@ class WorkflowService:
 
     @staticmethod
     def validate_update_target(vault_root: Path) -> ServiceResult | None:
-        """Validate that a vault can update existing workflow scaffolding."""
-        vault_root = vault_root.resolve()
-        validation_error = WorkflowService._validate_vault_root(vault_root, op="workflow_update")
-        if validation_error is not None:
-            return validation_error
+        """Validate that a vault can update existing workflow scaffolding.
+
+        *vault_root* must already be resolved; callers resolve it once and
+        reuse it for the copy/update that follows.
+        """
+        probe = WorkflowService._probe_vault_root(vault_root, op="workflow_update")
+        if isinstance(probe, ServiceResult):
+            return probe
 
-        answers_path = vault_root / _ANSWERS_RELATIVE_PATH
-        if not answers_path.exists():
+        if not probe:
             return ServiceResult(
                 ok=False,
                 op="workflow_update",
                 error=ServiceError(
                     code="WORKFLOW_NOT_INITIALIZED",
                     message="Workflow scaffolding has not been initialized for this vault.",
-                    detail={"path": str(answers_path)},
+                    detail={"path": _answers_path_for(os.fspath(vault_root))},
                 ),
             )
 
@@ -171,26 +321,30 @@ class WorkflowService:
 
     @staticmethod
     def _run_copy(vault_root: Path, choices: WorkflowChoices) -> None:
-        with resources.as_file(WorkflowService._template_root()) as template_root:
-            run_copy(
-                str(template_root),
-                dst_path=vault_root,
-                answers_file=str(_ANSWERS_RELATIVE_PATH),
-                data=choices.as_data(),
-                defaults=True,
-                overwrite=True,
-                quiet=True,
-            )
+        from copier import run_copy
+
+        run_copy(
+            str(WorkflowService._template_root()),
+            dst_path=vault_root,
+            answers_file=_ANSWERS_FILE,
+            data=dict(choices.as_data()),
+            defaults=True,
+            overwrite=True,
+            quiet=True,
+        )
 
     @staticmethod
     def _run_update(vault_root: Path, choices: WorkflowChoices | None) -> tuple[str, list[str]]:
+        from copier import run_recopy, run_update
+        from copier.errors import CopierError
+
         warnings: list[str] = []
-        update_data = None if choices is None else choices.as_data()
+        update_data = None if choices is None else dict(choices.as_data())
 
         try:
             run_update(
                 dst_path=vault_root,
-                answers_file=str(_ANSWERS_RELATIVE_PATH),
+                answers_file=_ANSWERS_FILE,
                 data=update_data,
                 defaults=True,
                 overwrite=True,
@@ -203,7 +357,7 @@ class WorkflowService:
             )
             run_recopy(
                 dst_path=vault_root,
-                answers_file=str(_ANSWERS_RELATIVE_PATH),
+                answers_file=_ANSWERS_FILE,
                 data=update_data,
                 defaults=True,
                 overwrite=True,
@@ -211,10 +365,26 @@ class WorkflowService:
             )
             return "recopy", warnings
 
+    @staticmethod
+    def _files_written(vault_root: Path, *, verify: bool) -> tuple[tuple[str, ...], list[str]]:
+        """Return the generated file list and warnings for missing files."""
+        if not verify:
+            return _GENERATED_FILES, []
+        present, missing = _check_generated_files(vault_root)
+        return present, [f"Expected workflow file was not written: {path}" for path in missing]
+
     @staticmethod
     @traced
-    def init_workflow(vault_root: Path, choices: WorkflowChoices) -> ServiceResult:
-        """Initialize Copier-backed workflow scaffolding for a vault."""
+    def init_workflow(
+        vault_root: Path, choices: WorkflowChoices, *, verify: bool = False
+    ) -> ServiceResult:
+        """Initialize Copier-backed workflow scaffolding for a vault.
+
+        With *verify*, ``files_written`` lists only files found on disk
+        afterwards, and each missing one is reported as a warning.
+        """
+        from copier.errors import CopierError
+
         vault_root = vault_root.resolve()
         validation_error = WorkflowService.validate_init_target(vault_root)
         if validation_error is not None:
@@ -232,14 +402,16 @@ class WorkflowService:
                 ),
             )
 
+        files_written, warnings = WorkflowService._files_written(vault_root, verify=verify)
         return ServiceResult(
             ok=True,
             op="workflow_init",
             data={
                 "vault_path": str(vault_root),
-                "files_written": list(_GENERATED_FILES),
-                "choices": choices.as_data(),
+                "files_written": files_written,
+                "choices": dict(choices.as_data()),
             },
+            warnings=warnings,
         )
 
     @staticmethod
@@ -248,8 +420,14 @@ class WorkflowService:
         vault_root: Path,
         *,
         choices: WorkflowChoices | None = None,
+        verify: bool = False,
     ) -> ServiceResult:
-        """Update workflow scaffolding using stored answers plus optional overrides."""
+        """Update workflow scaffolding using stored answers plus optional overrides.
+
+        *verify* checks the generated files as in :meth:`init_workflow`.
+        """
+        from copier.errors import CopierError
+
         vault_root = vault_root.resolve()
         validation_error = WorkflowService.validate_update_target(vault_root)
         if validation_error is not None:
@@ -267,11 +445,15 @@ class WorkflowService:
                 ),
             )
 
-        final_choices = WorkflowService.read_answers(vault_root)
+        # Explicit choices are exactly what Copier just recorded; only a
+        # reconcile against stored answers needs the file read back.
+        final_choices = choices if choices is not None else WorkflowService.read_answers(vault_root)
+        files_written, missing = WorkflowService._files_written(vault_root, verify=verify)
+        warnings.extend(missing)
         data = {
             "vault_path": str(vault_root),
-            "files_written": list(_GENERATED_FILES),
+            "files_written": files_written,
             "mode": mode,
-            "choices": final_choices.as_data() if final_choices is not None else {},
+            "choices": dict(final_choices.as_data()) if final_choices is not None else {},
         }
         return ServiceResult(ok=True, op="workflow_update", data=data, warnings=warnings)
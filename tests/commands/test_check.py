@@ -6,8 +6,20 @@ import json
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json, create_note
 
 from ztlctl.cli import cli
+from ztlctl.infrastructure.vault import Vault
+
+
+@pytest.fixture
+def _warning_note(_isolated_vault: None, vault: Vault) -> None:
+    """Seed a note whose unscoped tag only raises an advisory warning.
+
+    Created through the service layer: only the ``check`` invocation under
+    test needs to go through the CLI.
+    """
+    create_note(vault, "Warning Note", tags=["unscoped"])
 
 
 @pytest.mark.usefixtures("_isolated_vault")
@@ -22,7 +34,7 @@ class TestCheckCommand:
         """JSON output includes issue count."""
         result = cli_runner.invoke(cli, ["--json", "check"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "count" in data["data"]
         assert "error_count" in data["data"]
@@ -33,7 +45,7 @@ class TestCheckCommand:
         """--fix flag runs repair."""
         result = cli_runner.invoke(cli, ["--json", "check", "--fix"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["op"] == "fix"
 
@@ -41,14 +53,14 @@ class TestCheckCommand:
         """--fix --level aggressive runs aggressive repair."""
         result = cli_runner.invoke(cli, ["--json", "check", "--fix", "--level", "aggressive"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
     def test_check_rebuild(self, cli_runner: CliRunner) -> None:
         """--rebuild flag runs full rebuild."""
         result = cli_runner.invoke(cli, ["--json", "check", "--rebuild"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["op"] == "rebuild"
         assert "nodes_indexed" in data["data"]
@@ -63,34 +75,31 @@ class TestCheckCommand:
         assert payload["op"] == "rollback"
         assert payload["error"]["code"] == "NO_BACKUPS"
 
+    @pytest.mark.usefixtures("_warning_note")
     def test_check_errors_only_filters_warning_issues(self, cli_runner: CliRunner) -> None:
-        cli_runner.invoke(cli, ["--json", "create", "note", "Warning Note", "--tags", "unscoped"])
-
         result = cli_runner.invoke(cli, ["--json", "check", "--errors-only"])
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["data"]["count"] == 0
         assert data["data"]["error_count"] == 0
         assert data["data"]["warning_count"] == 0
         assert data["data"]["healthy"] is True
         assert data["data"]["issues"] == []
 
+    @pytest.mark.usefixtures("_warning_note")
     def test_check_warning_only_vault_reports_healthy(self, cli_runner: CliRunner) -> None:
-        cli_runner.invoke(cli, ["create", "note", "Warning Note", "--tags", "unscoped"])
-
         result = cli_runner.invoke(cli, ["--json", "check"])
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["data"]["count"] > 0
         assert data["data"]["error_count"] == 0
         assert data["data"]["warning_count"] == data["data"]["count"]
         assert data["data"]["healthy"] is True
 
+    @pytest.mark.usefixtures("_warning_note")
     def test_check_warning_only_human_output_marks_advisory(self, cli_runner: CliRunner) -> None:
-        cli_runner.invoke(cli, ["create", "note", "Warning Note", "--tags", "unscoped"])
-
         result = cli_runner.invoke(cli, ["check"])
 
         assert result.exit_code == 0
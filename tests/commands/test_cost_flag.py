@@ -2,26 +2,87 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import create_decision, create_note, start_session
 
 from ztlctl.cli import cli
+from ztlctl.infrastructure.vault import Vault
+from ztlctl.services.session import SessionService
+from ztlctl.services.update import UpdateService
+
+
+def _total_cost(vault: Vault) -> int:
+    """Read the active session's total cost in-process."""
+    result = SessionService(vault).cost()
+    assert result.ok, result.error
+    return result.data["total_cost"]
+
+
+def _update_args(vault: Vault) -> list[str]:
+    return ["update", create_note(vault, "Update Me")["id"], "--title", "Updated"]
+
+
+def _archive_args(vault: Vault) -> list[str]:
+    return ["archive", create_note(vault, "Archive Me")["id"]]
+
+
+def _supersede_args(vault: Vault) -> list[str]:
+    old_id = create_decision(vault, "Old Decision")["id"]
+    # Transition old decision to accepted (required before supersede)
+    result = UpdateService(vault).update(old_id, changes={"status": "accepted"})
+    assert result.ok, result.error
+    new_id = create_decision(vault, "New Decision")["id"]
+    return ["supersede", old_id, new_id]
+
+
+# (command argv, or a builder that seeds its prerequisites and returns it; cost)
+COST_CASES: list[tuple[list[str] | Callable[[Vault], list[str]], int]] = [
+    (["create", "note", "Costed Note"], 1200),
+    (["create", "reference", "Ref"], 800),
+    (["create", "task", "Task"], 300),
+    (_update_args, 600),
+    (_archive_args, 200),
+    (_supersede_args, 400),
+]
+
+
+@pytest.fixture
+def session_id(_isolated_vault: None, vault: Vault) -> str:
+    """Start a session in the isolated vault and return its ID.
+
+    Setup goes through the services; only the command under test and the
+    cost readback run through the CLI.
+    """
+    return start_session(vault, "Cost Test")["id"]
+
+
+@pytest.mark.usefixtures("session_id")
+class TestCostLoggedToSession:
+    @pytest.mark.parametrize(
+        ("command", "cost"),
+        COST_CASES,
+        ids=["note", "reference", "task", "update", "archive", "supersede"],
+    )
+    def test_cost_logged(
+        self,
+        cli_runner: CliRunner,
+        vault: Vault,
+        command: list[str] | Callable[[Vault], list[str]],
+        cost: int,
+    ) -> None:
+        """--cost value is logged to the active session."""
+        args = command(vault) if callable(command) else command
+        result = cli_runner.invoke(cli, [*args, "--cost", str(cost)])
+        assert result.exit_code == 0
+        assert _total_cost(vault) == cost
 
-
-def _start_session(cli_runner: CliRunner) -> str:
-    """Start a session and return the session ID."""
-    r = cli_runner.invoke(cli, ["--json", "agent", "session", "start", "Cost Test"])
-    assert r.exit_code == 0
-    return json.loads(r.output)["data"]["id"]
-
-
-def _get_total_cost(cli_runner: CliRunner) -> int:
-    """Get total session cost."""
-    r = cli_runner.invoke(cli, ["--json", "agent", "session", "cost"])
-    assert r.exit_code == 0
-    return json.loads(r.output)["data"]["total_cost"]
+    def test_zero_cost_is_noop(self, cli_runner: CliRunner, vault: Vault) -> None:
+        """--cost 0 (default) does not create a log entry."""
+        cli_runner.invoke(cli, ["create", "note", "Free Note"])
+        assert _total_cost(vault) == 0
 
 
 @pytest.mark.usefixtures("_isolated_vault")
@@ -31,76 +92,6 @@ class TestCostFlagCreateNote:
         result = cli_runner.invoke(cli, ["create", "note", "Test", "--cost", "500"])
         assert result.exit_code == 0
 
-    def test_cost_logged_to_session(self, cli_runner: CliRunner) -> None:
-        """--cost value is logged to the active session."""
-        _start_session(cli_runner)
-        cli_runner.invoke(cli, ["create", "note", "Costed Note", "--cost", "1200"])
-        assert _get_total_cost(cli_runner) == 1200
-
-    def test_zero_cost_is_noop(self, cli_runner: CliRunner) -> None:
-        """--cost 0 (default) does not create a log entry."""
-        _start_session(cli_runner)
-        cli_runner.invoke(cli, ["create", "note", "Free Note"])
-        assert _get_total_cost(cli_runner) == 0
-
-
-@pytest.mark.usefixtures("_isolated_vault")
-class TestCostFlagCreateReference:
-    def test_cost_logged(self, cli_runner: CliRunner) -> None:
-        _start_session(cli_runner)
-        cli_runner.invoke(cli, ["create", "reference", "Ref", "--cost", "800"])
-        assert _get_total_cost(cli_runner) == 800
-
-
-@pytest.mark.usefixtures("_isolated_vault")
-class TestCostFlagCreateTask:
-    def test_cost_logged(self, cli_runner: CliRunner) -> None:
-        _start_session(cli_runner)
-        cli_runner.invoke(cli, ["create", "task", "Task", "--cost", "300"])
-        assert _get_total_cost(cli_runner) == 300
-
-
-@pytest.mark.usefixtures("_isolated_vault")
-class TestCostFlagUpdate:
-    def test_cost_logged(self, cli_runner: CliRunner) -> None:
-        _start_session(cli_runner)
-        r = cli_runner.invoke(cli, ["--json", "create", "note", "Update Me"])
-        content_id = json.loads(r.output)["data"]["id"]
-        cli_runner.invoke(cli, ["update", content_id, "--title", "Updated", "--cost", "600"])
-        assert _get_total_cost(cli_runner) == 600
-
-
-@pytest.mark.usefixtures("_isolated_vault")
-class TestCostFlagArchive:
-    def test_cost_logged(self, cli_runner: CliRunner) -> None:
-        _start_session(cli_runner)
-        r = cli_runner.invoke(cli, ["--json", "create", "note", "Archive Me"])
-        content_id = json.loads(r.output)["data"]["id"]
-        cli_runner.invoke(cli, ["archive", content_id, "--cost", "200"])
-        assert _get_total_cost(cli_runner) == 200
-
-
-@pytest.mark.usefixtures("_isolated_vault")
-class TestCostFlagSupersede:
-    def test_cost_logged(self, cli_runner: CliRunner) -> None:
-        _start_session(cli_runner)
-        r1 = cli_runner.invoke(
-            cli,
-            ["--json", "create", "note", "Old Decision", "--subtype", "decision"],
-        )
-        old_id = json.loads(r1.output)["data"]["id"]
-        # Transition old decision to accepted (required before supersede)
-        update_result = cli_runner.invoke(cli, ["update", old_id, "--status", "accepted"])
-        assert update_result.exit_code == 0
-        r2 = cli_runner.invoke(
-            cli,
-            ["--json", "create", "note", "New Decision", "--subtype", "decision"],
-        )
-        new_id = json.loads(r2.output)["data"]["id"]
-        supersede_result = cli_runner.invoke(cli, ["supersede", old_id, new_id, "--cost", "400"])
-        assert supersede_result.exit_code == 0
-        assert _get_total_cost(cli_runner) == 400
-
 
 @pytest.mark.usefixtures("_isolated_vault")
 class TestCostFlagReweave:
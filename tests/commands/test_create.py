@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json
 
 from ztlctl.cli import cli
 from ztlctl.domain.content import CONTENT_REGISTRY
@@ -19,39 +19,35 @@ class TestCreateNoteCommand:
         assert result.exit_code == 0
         assert "OK" in result.output
 
-    def test_create_note_json(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["--json", "create", "note", "JSON Note"])
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert data["ok"] is True
-        assert data["data"]["title"] == "JSON Note"
-
-    def test_create_note_with_subtype(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(
-            cli, ["--json", "create", "note", "Decision", "--subtype", "decision"]
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert data["ok"] is True
-
-    def test_create_note_with_tags(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["--json", "create", "note", "Tagged", "--tags", "ai/ml"])
+    @pytest.mark.parametrize(
+        ("title", "extra_args", "path_fragment"),
+        [
+            ("JSON Note", [], None),
+            ("Decision", ["--subtype", "decision"], None),
+            ("Tagged", ["--tags", "ai/ml"], None),
+            ("Topic Note", ["--topic", "math"], "math"),
+        ],
+        ids=["plain", "subtype", "tags", "topic"],
+    )
+    def test_create_note_json(
+        self,
+        cli_runner: CliRunner,
+        title: str,
+        extra_args: list[str],
+        path_fragment: str | None,
+    ) -> None:
+        result = cli_runner.invoke(cli, ["--json", "create", "note", title, *extra_args])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
-
-    def test_create_note_with_topic(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(
-            cli, ["--json", "create", "note", "Topic Note", "--topic", "math"]
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "math" in data["data"]["path"]
+        assert data["data"]["title"] == title
+        if path_fragment is not None:
+            assert path_fragment in data["data"]["path"]
 
     def test_create_note_with_plugin_subtype(self, cli_runner: CliRunner, tmp_path: Path) -> None:
         original_registry = CONTENT_REGISTRY.copy()
         plugin_dir = tmp_path / ".ztlctl" / "plugins"
-        plugin_dir.mkdir(parents=True)
+        plugin_dir.mkdir(parents=True, exist_ok=True)
         plugin_dir.joinpath("custom_content.py").write_text(
             """import pluggy
 from ztlctl.domain.content import NoteModel
@@ -81,7 +77,7 @@ class CustomContentPlugin:
             CONTENT_REGISTRY.update(original_registry)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
 
@@ -90,7 +86,7 @@ class TestCreateReferenceCommand:
     def test_create_reference(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "create", "reference", "Cool Article"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["id"].startswith("ref_")
 
@@ -100,7 +96,7 @@ class TestCreateReferenceCommand:
             ["--json", "create", "reference", "Python Docs", "--url", "https://python.org"],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
 
@@ -109,7 +105,7 @@ class TestCreateTaskCommand:
     def test_create_task(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "create", "task", "Fix bug"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["id"].startswith("TASK-")
 
@@ -118,7 +114,7 @@ class TestCreateTaskCommand:
             cli, ["--json", "create", "task", "Urgent", "--priority", "high"]
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
     def test_create_task_invalid_priority(self, cli_runner: CliRunner) -> None:
@@ -126,62 +122,42 @@ class TestCreateTaskCommand:
         assert result.exit_code != 0
 
 
+@pytest.fixture
+def _force_interactive(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Treat the CliRunner session as a TTY so create prompts fire."""
+    monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
+
+
 @pytest.mark.usefixtures("_isolated_vault")
 class TestCreateInteractivePrompts:
     """Interactive prompts fire when --no-interact and --json are absent.
 
     ``_is_interactive`` checks ``sys.stdin.isatty()`` which returns False
-    in CliRunner, so prompt-testing methods monkeypatch it to return True.
+    in CliRunner, so prompt tests use ``_force_interactive`` to make it return True.
     Skip-prompt tests don't patch it (naturally non-interactive in tests).
     """
 
-    def test_note_tags_prompt(self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Providing tags via stdin when no --tags flag is given."""
-        monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
-        result = cli_runner.invoke(
-            cli,
-            ["create", "note", "Prompted Tags"],
-            input="ai/ml, dev/ops\n\n",  # tags prompt, topic prompt
-        )
+    @pytest.mark.usefixtures("_force_interactive")
+    @pytest.mark.parametrize(
+        ("args", "stdin"),
+        [
+            # tags prompt, topic prompt
+            (["create", "note", "Prompted Tags"], "ai/ml, dev/ops\n\n"),
+            (["create", "note", "Topic Prompted"], "\nmathematics\n"),
+            (["create", "reference", "Ref Prompted"], "https://example.com\n\n"),
+            # priority, impact, effort
+            (["create", "task", "Task Prompted"], "high\nhigh\nlow\n"),
+            # explicit --tags skips the tag prompt; only the topic prompt fires
+            (["create", "note", "Pre-Tagged", "--tags", "ai/ml"], "\n"),
+        ],
+        ids=["note-tags", "note-topic", "reference-url", "task-priority", "provided-flags"],
+    )
+    def test_prompts_read_stdin(self, cli_runner: CliRunner, args: list[str], stdin: str) -> None:
+        """Missing optional fields are prompted for and read from stdin."""
+        result = cli_runner.invoke(cli, args, input=stdin)
         assert result.exit_code == 0
         assert "OK" in result.output
 
-    def test_note_topic_prompt(
-        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Providing topic via stdin."""
-        monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
-        result = cli_runner.invoke(
-            cli,
-            ["create", "note", "Topic Prompted"],
-            input="\nmathematics\n",
-        )
-        assert result.exit_code == 0
-
-    def test_reference_url_prompt(
-        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Providing URL via stdin when no --url flag is given."""
-        monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
-        result = cli_runner.invoke(
-            cli,
-            ["create", "reference", "Ref Prompted"],
-            input="https://example.com\n\n",
-        )
-        assert result.exit_code == 0
-
-    def test_task_priority_prompt(
-        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Providing priority/impact/effort via stdin."""
-        monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
-        result = cli_runner.invoke(
-            cli,
-            ["create", "task", "Task Prompted"],
-            input="high\nhigh\nlow\n",
-        )
-        assert result.exit_code == 0
-
     def test_no_interact_skips_prompts(self, cli_runner: CliRunner) -> None:
         """--no-interact flag prevents prompting (no stdin needed)."""
         result = cli_runner.invoke(
@@ -189,7 +165,7 @@ class TestCreateInteractivePrompts:
             ["--no-interact", "--json", "create", "note", "No Prompt Note"],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
     def test_json_mode_skips_prompts(self, cli_runner: CliRunner) -> None:
@@ -199,17 +175,5 @@ class TestCreateInteractivePrompts:
             ["--json", "create", "task", "JSON Task"],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
-
-    def test_provided_flags_skip_prompt(
-        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Explicit --tags flag skips the tag prompt (only topic prompt fires)."""
-        monkeypatch.setattr("ztlctl.commands.create._is_interactive", lambda _app: True)
-        result = cli_runner.invoke(
-            cli,
-            ["create", "note", "Pre-Tagged", "--tags", "ai/ml"],
-            input="\n",  # Only topic prompt should fire
-        )
-        assert result.exit_code == 0
@@ -5,6 +5,7 @@ Parametrized to cover all commands that define examples text.
 
 from __future__ import annotations
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -55,6 +56,18 @@ EXAMPLES_COMMANDS: list[tuple[list[str], list[str]]] = [
 ]
 
 
+def _resolve_context(path: list[str]) -> click.Context:
+    """Build the context chain for the command at *path* without invoking it."""
+    ctx = click.Context(cli, info_name="ztlctl")
+    for name in path:
+        group = ctx.command
+        assert isinstance(group, click.Group)
+        command = group.get_command(ctx, name)
+        assert command is not None, f"Unknown command {path}"
+        ctx = click.Context(command, info_name=name, parent=ctx)
+    return ctx
+
+
 def _examples_id(item: tuple[list[str], list[str]]) -> str:
     """Generate a readable test ID from args."""
     args, _ = item
@@ -67,40 +80,58 @@ def _examples_id(item: tuple[list[str], list[str]]) -> str:
     ids=[_examples_id(item) for item in EXAMPLES_COMMANDS],
 )
 def test_examples_flag(
-    cli_runner: CliRunner, args: list[str], expected_keywords: list[str]
+    capsys: pytest.CaptureFixture[str], args: list[str], expected_keywords: list[str]
 ) -> None:
-    result = cli_runner.invoke(cli, args)
-    assert result.exit_code == 0
-    for kw in expected_keywords:
-        assert kw in result.output, f"Expected '{kw}' in examples output for {args}"
+    # --examples is eager and static: parse it on the resolved command rather
+    # than running the root callback (settings discovery) through CliRunner.
+    *path, flag = args
+    ctx = _resolve_context(path)
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        ctx.command.parse_args(ctx, [flag])
+    assert exc_info.value.exit_code == 0
+    output = capsys.readouterr().out
+    # The command object holds the exact text: compare the whole page.
+    header = f"Examples for 'ztlctl {' '.join(path)}':"
+    assert output == f"{header}\n\n{ctx.command.examples}\n"
+    missing = [kw for kw in expected_keywords if kw not in output]
+    assert not missing, f"Expected {missing} in examples output for {args}"
 
 
 class TestExamplesInHelp:
-    """Test that --examples appears in --help output for commands that have it."""
+    """Test that --examples is a visible option on commands that have it."""
 
     @pytest.mark.parametrize(
-        "args",
+        "path",
         [
-            ["create", "--help"],
-            ["create", "note", "--help"],
-            ["query", "--help"],
-            ["query", "list", "--help"],
-            ["graph", "--help"],
-            ["graph", "related", "--help"],
-            ["workflow", "--help"],
-            ["workflow", "init", "--help"],
-            ["workflow", "update", "--help"],
-            ["check", "--help"],
-            ["reweave", "--help"],
-            ["update", "--help"],
-            ["archive", "--help"],
-            ["supersede", "--help"],
+            ["create"],
+            ["create", "note"],
+            ["query"],
+            ["query", "list"],
+            ["graph"],
+            ["graph", "related"],
+            ["workflow"],
+            ["workflow", "init"],
+            ["workflow", "update"],
+            ["check"],
+            ["reweave"],
+            ["update"],
+            ["archive"],
+            ["supersede"],
         ],
+        ids="_".join,
     )
-    def test_examples_in_help(self, cli_runner: CliRunner, args: list[str]) -> None:
-        result = cli_runner.invoke(cli, args)
+    def test_examples_option_listed(self, path: list[str]) -> None:
+        # Inspect the option rather than rendering each help page.
+        command = _resolve_context(path).command
+        option = next((p for p in command.params if p.name == "examples"), None)
+        assert isinstance(option, click.Option)
+        assert "--examples" in option.opts
+        assert not option.hidden
+
+    def test_examples_in_help(self, cli_runner: CliRunner) -> None:
+        result = cli_runner.invoke(cli, ["update", "--help"])
         assert result.exit_code == 0
-        assert "--examples" in result.output
+        assert b"--examples" in result.stdout_bytes
 
 
 class TestExamplesEagerExit:
@@ -110,12 +141,12 @@ class TestExamplesEagerExit:
         # 'update' requires CONTENT_ID, but --examples should work without it
         result = cli_runner.invoke(cli, ["update", "--examples"])
         assert result.exit_code == 0
-        assert "Examples for" in result.output
-
-    def test_examples_skips_required_args_archive(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["archive", "--examples"])
-        assert result.exit_code == 0
-
-    def test_examples_skips_required_args_supersede(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["supersede", "--examples"])
-        assert result.exit_code == 0
+        assert b"Examples for" in result.stdout_bytes
+
+    @pytest.mark.parametrize("name", ["update", "archive", "supersede"])
+    def test_examples_option_is_eager(self, name: str) -> None:
+        # Eager and valueless: Click runs it before checking required args.
+        command = cli.commands[name]
+        option = next(p for p in command.params if p.name == "examples")
+        assert option.is_eager
+        assert not option.expose_value
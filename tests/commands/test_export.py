@@ -7,10 +7,23 @@ from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json
 
 from ztlctl.cli import cli
 
 
+class TestExportMarkdownValidation:
+    """Option validation fails before the command opens a vault."""
+
+    def test_export_markdown_requires_output(
+        self, cli_runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # An empty CWD keeps settings discovery away from the checkout.
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(cli, ["export", "markdown"])
+        assert result.exit_code != 0
+
+
 @pytest.mark.usefixtures("_isolated_vault")
 class TestExportMarkdownCommand:
     def test_export_markdown(self, cli_runner: CliRunner, tmp_path: Path) -> None:
@@ -22,15 +35,11 @@ class TestExportMarkdownCommand:
         output = tmp_path / "md-json"
         result = cli_runner.invoke(cli, ["--json", "export", "markdown", "--output", str(output)])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["op"] == "export_markdown"
         assert "file_count" in data["data"]
 
-    def test_export_markdown_requires_output(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["export", "markdown"])
-        assert result.exit_code != 0
-
     def test_export_markdown_json_includes_filters(
         self, cli_runner: CliRunner, tmp_path: Path
     ) -> None:
@@ -43,7 +52,7 @@ class TestExportMarkdownCommand:
         )
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["data"]["filters"] == {"type": "note"}
 
 
@@ -58,7 +67,7 @@ class TestExportIndexesCommand:
         output = tmp_path / "idx-json"
         result = cli_runner.invoke(cli, ["--json", "export", "indexes", "--output", str(output)])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["op"] == "export_indexes"
 
@@ -78,7 +87,7 @@ class TestExportIndexesCommand:
         )
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["data"]["node_count"] == 1
         assert data["data"]["filters"] == {"type": "note"}
         assert "Index Note" in (output / "by-type" / "note.md").read_text()
@@ -86,15 +95,18 @@ class TestExportIndexesCommand:
 
 @pytest.mark.usefixtures("_isolated_vault")
 class TestExportGraphCommand:
-    def test_export_graph_dot_stdout(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["export", "graph", "--format", "dot"])
+    @pytest.mark.parametrize(
+        "extra_args", [["--format", "dot"], []], ids=["explicit_dot", "default_format"]
+    )
+    def test_export_graph_dot_stdout(self, cli_runner: CliRunner, extra_args: list[str]) -> None:
+        result = cli_runner.invoke(cli, ["export", "graph", *extra_args])
         assert result.exit_code == 0
-        assert "digraph vault" in result.output
+        assert result.stdout_bytes.startswith(b"digraph vault")
 
     def test_export_graph_json_stdout(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["export", "graph", "--format", "json"])
         assert result.exit_code == 0
-        d3 = json.loads(result.output)
+        d3 = as_json(result)
         assert "nodes" in d3
         assert "links" in d3
 
@@ -105,7 +117,8 @@ class TestExportGraphCommand:
         )
         assert result.exit_code == 0
         assert output.is_file()
-        assert "digraph vault" in output.read_text()
+        with output.open() as f:
+            assert f.readline().startswith("digraph vault")
 
     def test_export_graph_json_to_file(self, cli_runner: CliRunner, tmp_path: Path) -> None:
         output = tmp_path / "graph.json"
@@ -116,11 +129,6 @@ class TestExportGraphCommand:
         d3 = json.loads(output.read_text())
         assert "nodes" in d3
 
-    def test_export_graph_default_format(self, cli_runner: CliRunner) -> None:
-        result = cli_runner.invoke(cli, ["export", "graph"])
-        assert result.exit_code == 0
-        assert "digraph vault" in result.output
-
     def test_export_graph_filtered_stdout(self, cli_runner: CliRunner) -> None:
         cli_runner.invoke(cli, ["create", "note", "Graph Note"])
         cli_runner.invoke(cli, ["create", "reference", "Graph Reference"])
@@ -128,6 +136,6 @@ class TestExportGraphCommand:
         result = cli_runner.invoke(cli, ["export", "graph", "--format", "json", "--type", "note"])
 
         assert result.exit_code == 0
-        d3 = json.loads(result.output)
+        d3 = as_json(result)
         assert len(d3["nodes"]) == 1
         assert d3["nodes"][0]["type"] == "note"
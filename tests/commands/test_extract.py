@@ -2,40 +2,46 @@
 
 from __future__ import annotations
 
-import json
-
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json, start_session
 
 from ztlctl.cli import cli
+from ztlctl.infrastructure.vault import Vault
+from ztlctl.services.session import SessionService
+
+
+@pytest.fixture
+def closed_session(vault: Vault) -> str:
+    """A closed session with one pinned and one plain log entry.
+
+    Built through the service layer: only the ``extract`` invocation under
+    test needs to go through the CLI.
+    """
+    session_id = start_session(vault, "Auth design")["id"]
+    svc = SessionService(vault)
+    assert svc.log_entry("Key finding", pin=True).ok
+    assert svc.log_entry("Minor note").ok
+    assert svc.close().ok
+    return session_id
 
 
 @pytest.mark.usefixtures("_isolated_vault")
 class TestExtractCommand:
-    def test_extract_basic(self, cli_runner: CliRunner) -> None:
-        # Start session, log entries, close, then extract
-        start = cli_runner.invoke(cli, ["--json", "agent", "session", "start", "Auth design"])
-        session_id = json.loads(start.output)["data"]["id"]
-        cli_runner.invoke(cli, ["agent", "session", "log", "Key finding", "--pin"])
-        cli_runner.invoke(cli, ["agent", "session", "log", "Minor note"])
-        cli_runner.invoke(cli, ["agent", "session", "close"])
-
-        result = cli_runner.invoke(cli, ["--json", "extract", session_id])
+    def test_extract_basic(self, cli_runner: CliRunner, closed_session: str) -> None:
+        result = cli_runner.invoke(cli, ["--json", "extract", closed_session])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["op"] == "extract_decision"
-        assert data["data"]["session_id"] == session_id
-
-    def test_extract_with_title(self, cli_runner: CliRunner) -> None:
-        start = cli_runner.invoke(cli, ["--json", "agent", "session", "start", "DB choice"])
-        session_id = json.loads(start.output)["data"]["id"]
-        cli_runner.invoke(cli, ["agent", "session", "log", "Use Postgres", "--pin"])
-        cli_runner.invoke(cli, ["agent", "session", "close"])
+        assert data["data"]["session_id"] == closed_session
 
-        result = cli_runner.invoke(cli, ["--json", "extract", session_id, "--title", "My Decision"])
+    def test_extract_with_title(self, cli_runner: CliRunner, closed_session: str) -> None:
+        result = cli_runner.invoke(
+            cli, ["--json", "extract", closed_session, "--title", "My Decision"]
+        )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["data"]["title"] == "My Decision"
 
     def test_extract_not_found(self, cli_runner: CliRunner) -> None:
@@ -2,25 +2,29 @@
 
 from __future__ import annotations
 
-import json
+import subprocess
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json
 
 from ztlctl.cli import cli
+from ztlctl.plugins.builtins.git import GitPlugin
+
+
+def _git_not_found(self: GitPlugin, *args: str) -> subprocess.CompletedProcess[str]:
+    raise FileNotFoundError(2, "No such file or directory", "git")
 
 
 @pytest.mark.usefixtures("_isolated_vault")
 class TestGitMissingRuntime:
     def test_create_note_succeeds_when_git_missing(
-        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
-        no_bin_dir = tmp_path / "no-bin"
-        no_bin_dir.mkdir()
-        monkeypatch.setenv("PATH", str(no_bin_dir))
+        # Fail inside the plugin's subprocess wrapper, as a missing binary would.
+        monkeypatch.setattr(GitPlugin, "_run_git", _git_not_found)
 
-        cli_runner = CliRunner()
         result = cli_runner.invoke(
             cli,
             [
@@ -36,7 +40,7 @@ class TestGitMissingRuntime:
         )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = as_json(result)
         assert data["ok"] is True
         assert (tmp_path / data["data"]["path"]).exists()
         assert "git add failed" in result.stderr.lower()
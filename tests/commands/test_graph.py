@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 from sqlalchemy import insert
+from tests.conftest import as_json, copy_db_template, create_note, make_vault_layout
 
 from ztlctl.cli import cli
 from ztlctl.config.settings import ZtlSettings
@@ -15,207 +17,208 @@ from ztlctl.infrastructure.database.schema import edges
 from ztlctl.infrastructure.vault import Vault
 
 
-def _seed_graph(runner: CliRunner, vault_root: Path) -> dict[str, str]:
+def _seed_graph(vault_root: Path) -> dict[str, str]:
     """Create notes and link them, returning a map of title -> id.
 
-    Creates: A -> B -> C chain plus D (isolated).
+    Creates: A -> B -> C chain plus D (isolated). Notes go through
+    CreateService and both edges through one executemany insert.
     """
-    titles = ["Alpha", "Beta", "Gamma", "Delta"]
-    id_map: dict[str, str] = {}
+    settings = ZtlSettings.from_cli(vault_root=vault_root, no_reweave=True)
+    vault = Vault(settings)
+    id_map = {
+        title: create_note(vault, title)["id"] for title in ["Alpha", "Beta", "Gamma", "Delta"]
+    }
 
-    for title in titles:
-        runner.invoke(cli, ["create", "note", title])
+    # Chain: Alpha -> Beta -> Gamma
+    _link(vault, id_map, [("Alpha", "Beta"), ("Beta", "Gamma")])
+    vault.close()
 
-    # Get IDs from the vault
-    result = runner.invoke(cli, ["--json", "query", "list", "--type", "note"])
-    data = json.loads(result.output)
-    for item in data["data"]["items"]:
-        id_map[item["title"]] = item["id"]
+    return id_map
 
-    # Insert edges directly into the DB
-    now = "2025-01-01T00:00:00"
-    settings = ZtlSettings.from_cli(vault_root=vault_root)
-    vault = Vault(settings)
+
+def _link(vault: Vault, id_map: dict[str, str], pairs: list[tuple[str, str]]) -> None:
+    """Insert a body edge for each (source title, target title) pair in one statement."""
     with vault.engine.begin() as conn:
-        # Chain: Alpha -> Beta -> Gamma
-        conn.execute(
-            insert(edges).values(
-                source_id=id_map["Alpha"],
-                target_id=id_map["Beta"],
-                edge_type="relates",
-                weight=1.0,
-                source_layer="body",
-                created=now,
-            )
-        )
         conn.execute(
-            insert(edges).values(
-                source_id=id_map["Beta"],
-                target_id=id_map["Gamma"],
-                edge_type="relates",
-                weight=1.0,
-                source_layer="body",
-                created=now,
-            )
+            insert(edges),
+            [
+                {
+                    "source_id": id_map[source],
+                    "target_id": id_map[target],
+                    "edge_type": "relates",
+                    "weight": 1.0,
+                    "source_layer": "body",
+                    "created": "2025-01-01T00:00:00",
+                }
+                for source, target in pairs
+            ],
         )
 
+
+@pytest.fixture(scope="module")
+def _graph_template(
+    tmp_path_factory: pytest.TempPathFactory, _db_template: Path
+) -> tuple[Path, dict[str, str]]:
+    """A vault seeded by :func:`_seed_graph`, built once per module."""
+    root = tmp_path_factory.mktemp("graph_template")
+    make_vault_layout(root)
+    copy_db_template(_db_template, root)
+    return root, _seed_graph(root)
+
+
+@pytest.fixture
+def seeded_graph(
+    _graph_template: tuple[Path, dict[str, str]],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> dict[str, str]:
+    """Copy the seeded template into ``tmp_path`` and chdir there.
+
+    Each test gets its own copy, so the unlink tests can mutate edges
+    freely. Returns the title -> id map.
+    """
+    template, id_map = _graph_template
+    shutil.copytree(template, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
     return id_map
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestRelatedCommand:
-    def test_related_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
-        result = cli_runner.invoke(cli, ["--json", "graph", "related", id_map["Alpha"]])
+    def test_related_basic(self, cli_runner: CliRunner, seeded_graph: dict[str, str]) -> None:
+        result = cli_runner.invoke(cli, ["--json", "graph", "related", seeded_graph["Alpha"]])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["count"] >= 1
 
+    @pytest.mark.usefixtures("_isolated_vault")
     def test_related_not_found(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "related", "nonexistent"])
         assert result.exit_code == 1
-        data = json.loads(result.output)
+        data = json.loads(result.stderr)
         assert data["ok"] is False
         assert data["error"]["code"] == "NOT_FOUND"
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestThemesCommand:
-    def test_themes_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        _seed_graph(cli_runner, tmp_path)
+    @pytest.mark.usefixtures("seeded_graph")
+    def test_themes_basic(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "themes"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "communities" in data["data"]
 
+    @pytest.mark.usefixtures("_isolated_vault")
     def test_themes_empty(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "themes"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["count"] == 0
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestRankCommand:
-    def test_rank_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        _seed_graph(cli_runner, tmp_path)
+    @pytest.mark.usefixtures("seeded_graph")
+    def test_rank_basic(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "rank"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["count"] >= 1
 
-    def test_rank_with_top(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        _seed_graph(cli_runner, tmp_path)
+    @pytest.mark.usefixtures("seeded_graph")
+    def test_rank_with_top(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "rank", "--top", "2"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["count"] <= 2
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestPathCommand:
-    def test_path_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
+    def test_path_basic(self, cli_runner: CliRunner, seeded_graph: dict[str, str]) -> None:
         result = cli_runner.invoke(
             cli,
-            ["--json", "graph", "path", id_map["Alpha"], id_map["Gamma"]],
+            ["--json", "graph", "path", seeded_graph["Alpha"], seeded_graph["Gamma"]],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["length"] >= 1
 
-    def test_path_no_path(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
+    def test_path_no_path(self, cli_runner: CliRunner, seeded_graph: dict[str, str]) -> None:
         # Delta is isolated — no path from Alpha
         result = cli_runner.invoke(
             cli,
-            ["--json", "graph", "path", id_map["Alpha"], id_map["Delta"]],
+            ["--json", "graph", "path", seeded_graph["Alpha"], seeded_graph["Delta"]],
         )
         assert result.exit_code == 1
-        data = json.loads(result.output)
+        data = json.loads(result.stderr)
         assert data["ok"] is False
         assert data["error"]["code"] == "NO_PATH"
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestGapsCommand:
-    def test_gaps_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        _seed_graph(cli_runner, tmp_path)
+    @pytest.mark.usefixtures("seeded_graph")
+    def test_gaps_basic(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "gaps"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestBridgesCommand:
-    def test_bridges_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        _seed_graph(cli_runner, tmp_path)
+    @pytest.mark.usefixtures("seeded_graph")
+    def test_bridges_basic(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "bridges"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
 
 
-@pytest.mark.usefixtures("_isolated_vault")
 class TestUnlinkCommand:
-    def test_unlink_basic(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
+    def test_unlink_basic(self, cli_runner: CliRunner, seeded_graph: dict[str, str]) -> None:
         result = cli_runner.invoke(
             cli,
-            ["--json", "graph", "unlink", id_map["Alpha"], id_map["Beta"]],
+            ["--json", "graph", "unlink", seeded_graph["Alpha"], seeded_graph["Beta"]],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["edges_removed"] == 1
 
-    def test_unlink_both_flag(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
-        settings = ZtlSettings.from_cli(vault_root=tmp_path)
-        vault = Vault(settings)
-        with vault.engine.begin() as conn:
-            conn.execute(
-                insert(edges).values(
-                    source_id=id_map["Beta"],
-                    target_id=id_map["Alpha"],
-                    edge_type="relates",
-                    weight=1.0,
-                    source_layer="body",
-                    created="2025-01-01T00:00:00",
-                )
-            )
+    def test_unlink_both_flag(
+        self, cli_runner: CliRunner, seeded_graph: dict[str, str], tmp_path: Path
+    ) -> None:
+        vault = Vault(ZtlSettings.from_cli(vault_root=tmp_path))
+        _link(vault, seeded_graph, [("Beta", "Alpha")])
+        vault.close()
 
         result = cli_runner.invoke(
             cli,
-            ["--json", "graph", "unlink", id_map["Alpha"], id_map["Beta"], "--both"],
+            ["--json", "graph", "unlink", seeded_graph["Alpha"], seeded_graph["Beta"], "--both"],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["edges_removed"] == 2
 
-    def test_unlink_no_link(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        id_map = _seed_graph(cli_runner, tmp_path)
+    def test_unlink_no_link(self, cli_runner: CliRunner, seeded_graph: dict[str, str]) -> None:
         # Alpha and Delta have no link
         result = cli_runner.invoke(
             cli,
-            ["--json", "graph", "unlink", id_map["Alpha"], id_map["Delta"]],
+            ["--json", "graph", "unlink", seeded_graph["Alpha"], seeded_graph["Delta"]],
         )
         assert result.exit_code == 1
-        data = json.loads(result.output)
+        data = json.loads(result.stderr)
         assert data["ok"] is False
         assert data["error"]["code"] == "NO_LINK"
 
+    @pytest.mark.usefixtures("_isolated_vault")
     def test_unlink_not_found(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "graph", "unlink", "MISSING_A", "MISSING_B"])
         assert result.exit_code == 1
-        data = json.loads(result.output)
+        data = json.loads(result.stderr)
         assert data["ok"] is False
         assert data["error"]["code"] == "NOT_FOUND"
@@ -10,11 +10,6 @@ from click.testing import CliRunner
 from ztlctl.cli import cli
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    return CliRunner()
-
-
 class TestServeCommand:
     """Tests for ztlctl serve."""
 
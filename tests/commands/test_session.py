@@ -6,6 +6,7 @@ import json
 
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json, created_id
 
 from ztlctl.cli import cli
 
@@ -20,9 +21,8 @@ class TestSessionCommands:
     def test_session_start_json(self, cli_runner: CliRunner) -> None:
         result = cli_runner.invoke(cli, ["--json", "agent", "session", "start", "JSON Topic"])
         assert result.exit_code == 0
-        import json
 
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["id"].startswith("LOG-")
 
@@ -42,14 +42,12 @@ class TestSessionCommands:
         assert payload["error"]["code"] == "NO_ACTIVE_SESSION"
 
     def test_session_reopen(self, cli_runner: CliRunner) -> None:
-        import json
 
         # Start with JSON to get the session ID
         start_result = cli_runner.invoke(
             cli, ["--json", "agent", "session", "start", "Reopen Topic"]
         )
-        assert start_result.exit_code == 0
-        session_id = json.loads(start_result.output)["data"]["id"]
+        session_id = created_id(start_result)
 
         cli_runner.invoke(cli, ["agent", "session", "close"])
         result = cli_runner.invoke(cli, ["agent", "session", "reopen", session_id])
@@ -65,7 +63,7 @@ class TestSessionCommands:
         start_result = cli_runner.invoke(
             cli, ["--json", "agent", "session", "start", "Already Open Topic"]
         )
-        session_id = json.loads(start_result.output)["data"]["id"]
+        session_id = created_id(start_result)
 
         result = cli_runner.invoke(cli, ["--json", "agent", "session", "reopen", session_id])
 
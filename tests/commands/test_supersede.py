@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json, created_id
 
 from ztlctl.cli import cli
 
@@ -17,14 +16,12 @@ class TestSupersedeCommand:
         r1 = cli_runner.invoke(
             cli, ["--json", "create", "note", "Old Decision", "--subtype", "decision"]
         )
-        assert r1.exit_code == 0
-        old_id = json.loads(r1.output)["data"]["id"]
+        old_id = created_id(r1)
 
         r2 = cli_runner.invoke(
             cli, ["--json", "create", "note", "New Decision", "--subtype", "decision"]
         )
-        assert r2.exit_code == 0
-        new_id = json.loads(r2.output)["data"]["id"]
+        new_id = created_id(r2)
 
         # Must accept the decision first (proposed → accepted → superseded)
         accept_r = cli_runner.invoke(cli, ["--json", "update", old_id, "--status", "accepted"])
@@ -33,7 +30,7 @@ class TestSupersedeCommand:
         # Now supersede
         result = cli_runner.invoke(cli, ["--json", "supersede", old_id, new_id])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert data["data"]["status"] == "superseded"
 
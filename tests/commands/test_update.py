@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
 import pytest
 from click.testing import CliRunner
+from tests.conftest import as_json, created_id
 
 from ztlctl.cli import cli
 
@@ -15,46 +14,42 @@ class TestUpdateCommand:
     def test_update_title(self, cli_runner: CliRunner) -> None:
         # Create a note first
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Old Title"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         # Update the title
         result = cli_runner.invoke(cli, ["--json", "update", content_id, "--title", "New Title"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "title" in data["data"]["fields_changed"]
 
     def test_update_tags(self, cli_runner: CliRunner) -> None:
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Tag Target"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         result = cli_runner.invoke(cli, ["--json", "update", content_id, "--tags", "domain/new"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "tags" in data["data"]["fields_changed"]
 
     def test_update_topic(self, cli_runner: CliRunner) -> None:
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Topic Note"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         result = cli_runner.invoke(cli, ["--json", "update", content_id, "--topic", "math"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "topic" in data["data"]["fields_changed"]
 
     def test_update_maturity(self, cli_runner: CliRunner) -> None:
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Garden Note"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         result = cli_runner.invoke(cli, ["--json", "update", content_id, "--maturity", "seed"])
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "maturity" in data["data"]["fields_changed"]
 
@@ -73,21 +68,19 @@ class TestUpdateCommand:
 
     def test_update_body(self, cli_runner: CliRunner) -> None:
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Body Note"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         result = cli_runner.invoke(
             cli, ["--json", "update", content_id, "--body", "New body content"]
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "body" in data["data"]["fields_changed"]
 
     def test_update_multiple_fields(self, cli_runner: CliRunner) -> None:
         r = cli_runner.invoke(cli, ["--json", "create", "note", "Multi Update"])
-        assert r.exit_code == 0
-        content_id = json.loads(r.output)["data"]["id"]
+        content_id = created_id(r)
 
         result = cli_runner.invoke(
             cli,
@@ -102,7 +95,7 @@ class TestUpdateCommand:
             ],
         )
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = as_json(result)
         assert data["ok"] is True
         assert "title" in data["data"]["fields_changed"]
         assert "topic" in data["data"]["fields_changed"]
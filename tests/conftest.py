@@ -2,27 +2,90 @@
 
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 from sqlalchemy.engine import Engine
 
 from ztlctl.config.settings import ZtlSettings
 from ztlctl.infrastructure.database.engine import init_database
 from ztlctl.infrastructure.vault import Vault
 
+_RAM_DISK = "/dev/shm"
+_ram_basetemp: str | None = None
 
-@pytest.fixture
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path on a RAM-backed filesystem when one is available.
+
+    Vault tests are dominated by small writes and SQLite fsyncs, and fsync
+    is a no-op on tmpfs. An explicit ``--basetemp`` wins, and xdist workers
+    inherit the controller's choice.
+    """
+    global _ram_basetemp
+    if config.option.basetemp or sys.platform != "linux":
+        return
+    if not os.path.isdir(_RAM_DISK) or not os.access(_RAM_DISK, os.W_OK):
+        return
+    _ram_basetemp = tempfile.mkdtemp(prefix="ztlctl-pytest-", dir=_RAM_DISK)
+    config.option.basetemp = _ram_basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if _ram_basetemp is not None:
+        shutil.rmtree(_ram_basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Provide a Click CLI test runner."""
+    """Provide a Click CLI test runner.
+
+    Shared by the whole session: each ``invoke()`` builds fresh streams, and
+    Click 8.2+ always keeps stderr separate from stdout.
+    """
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def _db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An initialized ``.ztlctl/`` directory, built once per test session.
+
+    Copying it is several times cheaper than creating the schema, FTS5
+    table and counters again; ``init_database`` on the copy is a no-op
+    apart from its existence checks.
+    """
+    root = tmp_path_factory.mktemp("db_template")
+    init_database(root).dispose()
+    return root / ".ztlctl"
+
+
+def make_vault_layout(vault_root: Path) -> None:
+    """Create the basic vault directory structure under *vault_root*."""
+    (vault_root / "notes").mkdir()
+    (vault_root / "ops" / "logs").mkdir(parents=True)
+    (vault_root / "ops" / "tasks").mkdir(parents=True)
+
+
+def copy_db_template(template: Path, vault_root: Path) -> None:
+    # Never copy over a database a fixture already opened: its -wal file
+    # would survive and pair with the template's main file.
+    if (vault_root / ".ztlctl" / "ztlctl.db").exists():
+        return
+    # Plain copies, not hardlinks: SQLite rewrites the file in place.
+    shutil.copytree(template, vault_root / ".ztlctl", dirs_exist_ok=True)
+
+
 @pytest.fixture
-def db_engine(tmp_path: Path) -> Engine:
+def db_engine(tmp_path: Path, _db_template: Path) -> Engine:
     """Initialized SQLite engine with all tables created."""
+    copy_db_template(_db_template, tmp_path)
     engine = init_database(tmp_path)
     try:
         yield engine
@@ -34,22 +97,22 @@ def db_engine(tmp_path: Path) -> Engine:
 def vault_root(tmp_path: Path) -> Path:
     """Temporary vault directory with basic structure.
 
-    This is the single source of truth for the vault directory layout.
-    All vault-related fixtures (vault, _isolated_vault) build on this.
+    The layout comes from :func:`make_vault_layout`, the single source of
+    truth for the vault directory structure. All vault-related fixtures
+    (vault, _isolated_vault) build on this.
     """
-    (tmp_path / "notes").mkdir()
-    (tmp_path / "ops" / "logs").mkdir(parents=True)
-    (tmp_path / "ops" / "tasks").mkdir(parents=True)
+    make_vault_layout(tmp_path)
     return tmp_path
 
 
 @pytest.fixture
-def vault(vault_root: Path) -> Vault:
+def vault(vault_root: Path, _db_template: Path) -> Vault:
     """Fully initialized vault on a temp directory.
 
     Creates the vault directory structure, initializes the database,
     and returns a ready-to-use Vault instance.
     """
+    copy_db_template(_db_template, vault_root)
     settings = ZtlSettings.from_cli(vault_root=vault_root, no_reweave=True)
     v = Vault(settings)
     try:
@@ -59,13 +122,14 @@ def vault(vault_root: Path) -> Vault:
 
 
 @pytest.fixture
-def _isolated_vault(vault_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def _isolated_vault(vault_root: Path, _db_template: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Change CWD to a temp vault root so the CLI creates an isolated vault.
 
     Use via ``@pytest.mark.usefixtures("_isolated_vault")`` on command test
     classes. Tests that need the path can also request ``tmp_path`` directly
     (pytest deduplicates — it's the same directory).
     """
+    copy_db_template(_db_template, vault_root)
     monkeypatch.chdir(vault_root)
 
 
@@ -74,6 +138,17 @@ def _isolated_vault(vault_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
 # ---------------------------------------------------------------------------
 
 
+def as_json(result: Result) -> Any:
+    """Parse a CliRunner result's stdout as JSON, straight from the raw bytes."""
+    return json.loads(result.stdout_bytes)
+
+
+def created_id(result: Result) -> str:
+    """Return ``data.id`` from a successful ``--json`` create/start invocation."""
+    assert result.exit_code == 0, result.output
+    return as_json(result)["data"]["id"]
+
+
 def create_note(vault: Vault, title: str, **kwargs: Any) -> dict[str, Any]:
     """Create a note via CreateService, asserting success."""
     from ztlctl.services.create import CreateService
@@ -16,6 +16,7 @@ from ztlctl.domain.content import (
     ValidationResult,
     get_content_model,
     parse_frontmatter,
+    patch_frontmatter,
     register_content_model,
     render_frontmatter,
 )
@@ -277,6 +278,38 @@ class TestParseFrontmatterEdgeCases:
         assert body == "Body here."
 
 
+class TestPatchFrontmatter:
+    def test_matches_full_render(self) -> None:
+        fm = {
+            "id": "ztl_1",
+            "type": "note",
+            "status": "draft",
+            "title": "A: b",
+            "tags": ["x/y"],
+            "created": "2026-01-01",
+            "modified": "2026-01-02",
+            "zeta": 1,
+        }
+        content = render_frontmatter(fm, "Body.\n")
+        updates = {"archived": True, "modified": "2026-10-17"}
+
+        expected_fm, body = parse_frontmatter(content)
+        expected_fm.update(updates)
+        assert patch_frontmatter(content, updates) == render_frontmatter(expected_fm, body)
+
+    def test_falls_back_for_complex_values(self) -> None:
+        content = "---\nid: test\n---\nBody."
+        assert patch_frontmatter(content, {"tags": ["a"]}) is None
+        assert patch_frontmatter(content, {"title": "Free text"}) is None
+
+    def test_falls_back_without_fence(self) -> None:
+        assert patch_frontmatter("No frontmatter", {"archived": True}) is None
+
+    def test_falls_back_for_multiline_entry(self) -> None:
+        content = "---\nid: test\narchived:\n- odd\n---\nBody."
+        assert patch_frontmatter(content, {"archived": True}) is None
+
+
 # ---------------------------------------------------------------------------
 # from_file
 # ---------------------------------------------------------------------------
@@ -29,6 +29,13 @@ class TestCreateDbEngine:
             result = conn.execute(text("PRAGMA foreign_keys")).scalar()
             assert result == 1
 
+    def test_tuning_pragmas_applied(self, tmp_path: Path) -> None:
+        engine = create_db_engine(tmp_path / "test.db")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+
 
 class TestInitDatabase:
     def test_creates_ztlctl_directory(self, tmp_path: Path) -> None:
@@ -30,6 +30,7 @@ class TestSchemaCreation:
             "event_wal",
             "session_logs",
             "nodes_fts",
+            "fts_doc_map",
         }
         assert expected.issubset(table_names)
 
@@ -312,6 +312,66 @@ class TestFTSHelpers:
             assert row.title == "New"
             assert row.body == "new body"
 
+    def test_upsert_fts_updates_mapped_row_in_place(self, vault: Vault) -> None:
+        _insert_node(vault, "ztl_fts00006")
+        with vault.transaction() as txn:
+            txn.upsert_fts("ztl_fts00006", "Old", "old body")
+        with vault.engine.connect() as conn:
+            rowid = conn.execute(
+                text("SELECT fts_rowid FROM fts_doc_map WHERE doc_id = :id"),
+                {"id": "ztl_fts00006"},
+            ).scalar_one()
+        with vault.transaction() as txn:
+            txn.upsert_fts("ztl_fts00006", "New", "new body")
+        with vault.engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT rowid, title FROM nodes_fts WHERE id = :id"),
+                {"id": "ztl_fts00006"},
+            ).fetchall()
+        assert [(r.rowid, r.title) for r in rows] == [(rowid, "New")]
+
+    def test_upsert_fts_replaces_row_behind_stale_map_entry(self, vault: Vault) -> None:
+        _insert_node(vault, "ztl_fts00007")
+        with vault.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO nodes_fts(id, title, body) VALUES ('ztl_fts00007', 'Old', '')")
+            )
+            conn.execute(
+                text("INSERT INTO fts_doc_map(doc_id, fts_rowid) VALUES ('ztl_fts00007', 999999)")
+            )
+        with vault.transaction() as txn:
+            txn.upsert_fts("ztl_fts00007", "New", "body")
+        with vault.engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT rowid, title FROM nodes_fts WHERE id = :id"),
+                {"id": "ztl_fts00007"},
+            ).fetchall()
+            mapped = conn.execute(
+                text("SELECT fts_rowid FROM fts_doc_map WHERE doc_id = :id"),
+                {"id": "ztl_fts00007"},
+            ).scalar_one()
+        assert [(r.rowid, r.title) for r in rows] == [(mapped, "New")]
+
+    def test_upsert_fts_replaces_unmapped_row(self, vault: Vault) -> None:
+        # Pre-migration-003 vaults hold FTS rows with no map entry
+        _insert_node(vault, "ztl_fts00008")
+        with vault.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO nodes_fts(id, title, body) VALUES ('ztl_fts00008', 'Old', '')")
+            )
+        with vault.transaction() as txn:
+            txn.upsert_fts("ztl_fts00008", "New", "body")
+        with vault.engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT rowid, title FROM nodes_fts WHERE id = :id"),
+                {"id": "ztl_fts00008"},
+            ).fetchall()
+            mapped = conn.execute(
+                text("SELECT fts_rowid FROM fts_doc_map WHERE doc_id = :id"),
+                {"id": "ztl_fts00008"},
+            ).scalar_one()
+        assert [(r.rowid, r.title) for r in rows] == [(mapped, "New")]
+
     def test_delete_fts(self, vault: Vault) -> None:
         _insert_node(vault, "ztl_fts00003")
         with vault.transaction() as txn:
@@ -325,6 +385,21 @@ class TestFTSHelpers:
             ).first()
             assert row is None
 
+    def test_delete_fts_removes_unmapped_row(self, vault: Vault) -> None:
+        _insert_node(vault, "ztl_fts00008")
+        with vault.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO nodes_fts(id, title, body) VALUES ('ztl_fts00008', 'Old', '')")
+            )
+        with vault.transaction() as txn:
+            txn.delete_fts("ztl_fts00008")
+        with vault.engine.connect() as conn:
+            row = conn.execute(
+                text("SELECT id FROM nodes_fts WHERE id = :id"),
+                {"id": "ztl_fts00008"},
+            ).first()
+        assert row is None
+
     def test_clear_fts(self, vault: Vault) -> None:
         _insert_node(vault, "ztl_fts00004")
         _insert_node(vault, "ztl_fts00005")
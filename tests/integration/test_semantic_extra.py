@@ -42,7 +42,10 @@ class _FakeEncoder:
 
 
 @pytest.fixture
-def semantic_vault(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Vault:
+def semantic_vault(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Vault:
+    storage = getattr(request, "param", "float32")
     config_path = tmp_path / "ztlctl.toml"
     config_path.write_text(
         (
@@ -57,6 +60,7 @@ def semantic_vault(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Vault:
             "semantic_enabled = true\n"
             "embedding_dim = 4\n"
             "semantic_weight = 0.5\n"
+            f'embedding_storage = "{storage}"\n'
         ),
         encoding="utf-8",
     )
@@ -146,3 +150,31 @@ class TestSemanticExtra:
 
         assert result.ok
         assert result.data["indexed_count"] >= 2
+
+    @pytest.mark.parametrize("semantic_vault", ["int8"], indirect=True)
+    def test_int8_semantic_scores_stay_in_unit_range(self, semantic_vault: Vault) -> None:
+        python_note = create_note(semantic_vault, "Python Patterns")
+        create_note(semantic_vault, "Graph Systems")
+
+        result = QueryService(semantic_vault).search("python", rank_by="semantic")
+
+        assert result.ok
+        items = result.data["items"]
+        assert items[0]["id"] == python_note["id"]
+        assert all(0.0 <= item["score"] <= 1.0 for item in items)
+
+    def test_ensure_table_warns_when_layout_changes(self, semantic_vault: Vault) -> None:
+        with semantic_vault.engine.begin() as conn:
+            VectorService._load_sqlite_vec(conn)
+            conn.execute(
+                text(
+                    "CREATE VIRTUAL TABLE vec_items "
+                    "USING vec0(node_id TEXT PRIMARY KEY, embedding FLOAT[8])"
+                )
+            )
+
+        warning = VectorService(semantic_vault).ensure_table()
+
+        assert warning is not None
+        assert "ztlctl vector reindex" in warning
+        assert VectorService(semantic_vault).ensure_table() is None
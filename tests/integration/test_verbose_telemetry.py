@@ -14,15 +14,19 @@ import pytest
 from click.testing import CliRunner
 
 from ztlctl.cli import cli
-from ztlctl.services.telemetry import _current_span, _verbose_enabled, disable_telemetry
+from ztlctl.services.telemetry import (
+    _current_span,
+    disable_telemetry,
+    is_telemetry_enabled,
+)
 
 
 @pytest.fixture(autouse=True)
 def _reset_telemetry() -> Generator[None]:
-    """Ensure telemetry ContextVar is reset between tests.
+    """Ensure telemetry state is reset between tests.
 
-    The --verbose flag calls enable_telemetry() which sets a ContextVar.
-    Without cleanup, enabled state leaks across tests in the same thread.
+    The --verbose flag calls enable_telemetry() which flips a process-wide
+    flag. Without cleanup, enabled state leaks across tests.
     """
     yield
     disable_telemetry()
@@ -33,37 +37,34 @@ def _reset_telemetry() -> Generator[None]:
 class TestVerboseTelemetry:
     """Test --verbose produces telemetry span tree in output."""
 
-    def setup_method(self) -> None:
-        self.runner = CliRunner()
-
-    def test_verbose_create_shows_telemetry(self) -> None:
+    def test_verbose_create_shows_telemetry(self, cli_runner: CliRunner) -> None:
         """Verbose mode renders the meta block with telemetry span tree."""
-        result = self.runner.invoke(cli, ["-v", "create", "note", "Verbose Tel Note"])
+        result = cli_runner.invoke(cli, ["-v", "create", "note", "Verbose Tel Note"])
         assert result.exit_code == 0
         assert "meta:" in result.output
         assert "CreateService.create_note" in result.output
         assert "ms" in result.output
 
-    def test_verbose_create_shows_sub_stages(self) -> None:
+    def test_verbose_create_shows_sub_stages(self, cli_runner: CliRunner) -> None:
         """Verbose mode shows trace_span sub-stages (validate, generate, etc.)."""
-        result = self.runner.invoke(cli, ["-v", "create", "note", "Sub Stage Note"])
+        result = cli_runner.invoke(cli, ["-v", "create", "note", "Sub Stage Note"])
         assert result.exit_code == 0
         assert "validate" in result.output
         assert "generate" in result.output
         assert "persist" in result.output
         assert "index" in result.output
 
-    def test_non_verbose_no_telemetry(self) -> None:
+    def test_non_verbose_no_telemetry(self, cli_runner: CliRunner) -> None:
         """Non-verbose mode does not include meta or telemetry output."""
-        result = self.runner.invoke(cli, ["create", "note", "No Tel Note"])
+        result = cli_runner.invoke(cli, ["create", "note", "No Tel Note"])
         assert result.exit_code == 0
         assert "meta:" not in result.output
         assert "telemetry" not in result.output
         assert "CreateService" not in result.output
 
-    def test_verbose_json_includes_telemetry_in_meta(self) -> None:
+    def test_verbose_json_includes_telemetry_in_meta(self, cli_runner: CliRunner) -> None:
         """Verbose + JSON mode serializes telemetry in the meta field."""
-        result = self.runner.invoke(cli, ["-v", "--json", "create", "note", "JSON Tel Note"])
+        result = cli_runner.invoke(cli, ["-v", "--json", "create", "note", "JSON Tel Note"])
         assert result.exit_code == 0
         # The JSON output may have structlog lines before it; find the JSON object
         lines = result.output.strip().splitlines()
@@ -99,15 +100,15 @@ class TestVerboseTelemetry:
         assert "duration_ms" in data["meta"]["telemetry"]
         assert "children" in data["meta"]["telemetry"]
 
-    def test_log_json_flag_accepted(self) -> None:
+    def test_log_json_flag_accepted(self, cli_runner: CliRunner) -> None:
         """The --log-json flag is accepted and does not cause errors."""
-        result = self.runner.invoke(cli, ["-v", "--log-json", "create", "note", "JSON Log Note"])
+        result = cli_runner.invoke(cli, ["-v", "--log-json", "create", "note", "JSON Log Note"])
         assert result.exit_code == 0
         assert "OK" in result.output or "create_note" in result.output
 
-    def test_log_json_produces_json_log_lines(self) -> None:
+    def test_log_json_produces_json_log_lines(self, cli_runner: CliRunner) -> None:
         """With --log-json, structlog emits JSON-formatted log lines."""
-        result = self.runner.invoke(cli, ["-v", "--log-json", "create", "note", "JSON Lines Note"])
+        result = cli_runner.invoke(cli, ["-v", "--log-json", "create", "note", "JSON Lines Note"])
         assert result.exit_code == 0
         # structlog JSON lines appear in output; find one with span.complete
         found_json_log = False
@@ -126,9 +127,9 @@ class TestVerboseTelemetry:
                 continue
         assert found_json_log, "Expected a JSON log line with event=span.complete"
 
-    def test_log_json_registration_lines_are_fully_structured(self) -> None:
+    def test_log_json_registration_lines_are_fully_structured(self, cli_runner: CliRunner) -> None:
         """Bootstrap plugin registration logs should include standard JSONL fields."""
-        result = self.runner.invoke(
+        result = cli_runner.invoke(
             cli,
             ["-v", "--log-json", "create", "note", "Registration JSON Note"],
         )
@@ -155,25 +156,23 @@ class TestVerboseTelemetry:
             assert "logger" in line
             assert "timestamp" in line
 
-    def test_telemetry_disabled_without_verbose(self) -> None:
-        """Without --verbose, telemetry ContextVar remains disabled."""
+    def test_telemetry_disabled_without_verbose(self, cli_runner: CliRunner) -> None:
+        """Without --verbose, telemetry remains disabled."""
         # Run non-verbose command
-        result = self.runner.invoke(cli, ["create", "note", "Disabled Tel Note"])
+        result = cli_runner.invoke(cli, ["create", "note", "Disabled Tel Note"])
         assert result.exit_code == 0
-        # The ContextVar should not have been flipped (it's per-thread,
-        # and CliRunner runs in the same thread)
-        assert not _verbose_enabled.get()
+        assert not is_telemetry_enabled()
 
-    def test_verbose_reference_shows_telemetry(self) -> None:
+    def test_verbose_reference_shows_telemetry(self, cli_runner: CliRunner) -> None:
         """Verbose mode works for reference creation too."""
-        result = self.runner.invoke(cli, ["-v", "create", "reference", "Verbose Ref"])
+        result = cli_runner.invoke(cli, ["-v", "create", "reference", "Verbose Ref"])
         assert result.exit_code == 0
         assert "meta:" in result.output
         assert "CreateService.create_reference" in result.output
 
-    def test_verbose_task_shows_telemetry(self) -> None:
+    def test_verbose_task_shows_telemetry(self, cli_runner: CliRunner) -> None:
         """Verbose mode works for task creation."""
-        result = self.runner.invoke(cli, ["-v", "create", "task", "Verbose Task"])
+        result = cli_runner.invoke(cli, ["-v", "create", "task", "Verbose Task"])
         assert result.exit_code == 0
         assert "meta:" in result.output
         assert "CreateService.create_task" in result.output
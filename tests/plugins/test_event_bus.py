@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -296,6 +298,31 @@ class TestEventBusAsync:
         bus.shutdown()
         assert len(recorder.calls) == 5
 
+    def test_drain_timeout_leaves_slow_events_running(self, engine):
+        release = threading.Event()
+
+        class BlockingPlugin:
+            @hookimpl
+            def post_check(self, issues_found: int, issues_fixed: int) -> None:
+                release.wait(5)
+
+        pm = PluginManager()
+        pm.register_plugin(BlockingPlugin(), name="blocker")
+        bus = EventBus(engine, pm, sync=False, max_workers=1)
+        event_id = bus.dispatch("post_check", {"issues_found": 0, "issues_fixed": 0})
+
+        start = time.monotonic()
+        assert bus.drain(timeout=0.05) == []
+        assert time.monotonic() - start < 1
+
+        release.set()
+        bus.shutdown()
+        with engine.connect() as conn:
+            status = conn.execute(
+                select(event_wal.c.status).where(event_wal.c.id == event_id)
+            ).scalar_one()
+        assert status == "completed"
+
 
 class TestEventBusNoPlugins:
     """Tests for dispatch when no plugins are registered."""
@@ -7,8 +7,10 @@ from typing import Any
 
 import pluggy
 import pytest
+from sqlalchemy import select
 
 from ztlctl.config.settings import ZtlSettings
+from ztlctl.infrastructure.database.schema import event_wal, nodes
 from ztlctl.infrastructure.vault import Vault
 from ztlctl.plugins.event_bus import EventBus
 from ztlctl.plugins.manager import PluginManager
@@ -303,6 +305,65 @@ class TestUpdateEventDispatch:
         assert payload["content_id"] == content_id
         assert payload["summary"] == "archived"
 
+    def test_deferred_event_shares_transaction(
+        self, vault_with_events: tuple[Vault, RecordingPlugin]
+    ):
+        vault, recorder = vault_with_events
+        content_id = CreateService(vault).create_note("Deferred").data["id"]
+        recorder.calls.clear()
+
+        with pytest.raises(RuntimeError), vault.transaction() as txn:
+            txn.defer_event("post_close", {"content_id": content_id}, [])
+            raise RuntimeError("boom")
+
+        assert recorder.calls == []
+        with vault.engine.connect() as conn:
+            hooks = [r.hook_name for r in conn.execute(select(event_wal.c.hook_name))]
+        assert "post_close" not in hooks
+
+        assert UpdateService(vault).archive(content_id).ok
+        assert [c[0] for c in recorder.calls] == ["post_close"]
+        with vault.engine.connect() as conn:
+            row = conn.execute(
+                select(event_wal.c.status).where(event_wal.c.hook_name == "post_close")
+            ).one()
+        assert row.status == "completed"
+
+    def test_deferred_delivery_failure_is_a_warning(
+        self, vault_with_events: tuple[Vault, RecordingPlugin], monkeypatch: pytest.MonkeyPatch
+    ):
+        vault, _ = vault_with_events
+        content_id = CreateService(vault).create_note("Undeliverable").data["id"]
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("executor gone")
+
+        monkeypatch.setattr(vault.event_bus, "deliver", fail)
+        result = UpdateService(vault).archive(content_id)
+
+        assert result.ok
+        assert result.warnings == ["Event dispatch failed for post_close"]
+
+    def test_deferred_record_failure_keeps_the_update(
+        self, vault_with_events: tuple[Vault, RecordingPlugin], monkeypatch: pytest.MonkeyPatch
+    ):
+        vault, recorder = vault_with_events
+        content_id = CreateService(vault).create_note("Unrecorded").data["id"]
+        recorder.calls.clear()
+
+        def fail(*args: Any, **kwargs: Any) -> int:
+            raise RuntimeError("WAL unavailable")
+
+        monkeypatch.setattr(vault.event_bus, "record", fail)
+        result = UpdateService(vault).update(content_id, changes={"title": "Still Saved"})
+
+        assert result.ok
+        assert result.warnings == ["Event dispatch failed for post_update"]
+        assert recorder.calls == []
+        with vault.engine.connect() as conn:
+            title = conn.execute(select(nodes.c.title).where(nodes.c.id == content_id)).scalar_one()
+        assert title == "Still Saved"
+
 
 # ---------------------------------------------------------------------------
 # Tests — SessionService dispatch
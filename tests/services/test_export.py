@@ -283,7 +283,7 @@ class TestExportGraph:
         assert result.ok
         assert result.op == "export_graph"
         assert result.data["format"] == "dot"
-        assert "digraph vault" in result.data["content"]
+        assert result.data["content"].startswith("digraph vault")
         assert result.data["node_count"] == 0
 
     def test_graph_json_empty(self, vault: Vault) -> None:
@@ -535,6 +535,23 @@ class TestMaterializeMetrics:
         assert row_b is not None
         assert row_b.degree_out == 1
 
+    def test_materialize_only_if_stale(self, vault: Vault) -> None:
+        """The stale probe skips recomputation until an edge changes."""
+        _build_chain(vault, ["A", "B"])
+        svc = GraphService(vault)
+        assert svc.materialize_metrics(only_if_stale=True).data["nodes_updated"] == 2
+
+        skipped = svc.materialize_metrics(only_if_stale=True)
+        assert skipped.ok
+        assert skipped.data["skipped"] is True
+
+        _insert_node(vault, "C")
+        _insert_edge(vault, "B", "C")
+        vault.graph._graph = None
+        result = svc.materialize_metrics(only_if_stale=True)
+        assert "skipped" not in result.data
+        assert result.data["nodes_updated"] == 3
+
     def test_materialize_populates_cluster_id(self, vault: Vault) -> None:
         """Materialize should assign cluster_id from community detection."""
         _build_star(vault, "HUB", ["S1", "S2", "S3"])
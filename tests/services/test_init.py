@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -201,6 +202,46 @@ class PostInitPlugin:
         assert result.ok  # init still succeeds
         assert any("stamp" in w.lower() for w in result.warnings)
 
+    def test_workflow_runs_last_on_calling_thread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Copier chdirs process-wide, so it must not overlap steps 4-6."""
+        from ztlctl.services.workflow import WorkflowService
+
+        monkeypatch.chdir(tmp_path)
+        vault = tmp_path / "v"
+        caller = threading.current_thread().name
+        original = WorkflowService.init_workflow
+        real_chdir = os.chdir
+        chdir_threads: set[str] = set()
+        seen: dict[str, Any] = {}
+
+        def spy_chdir(path: Any) -> None:
+            chdir_threads.add(threading.current_thread().name)
+            real_chdir(path)
+
+        def spy_init(vault_root: Path, choices: Any, **kwargs: Any) -> Any:
+            seen["thread"] = threading.current_thread().name
+            seen["ready"] = [
+                (vault / rel).exists()
+                for rel in (
+                    ".ztlctl/ztlctl.db",
+                    "self/identity.md",
+                    ".obsidian/snippets/ztlctl.css",
+                )
+            ]
+            return original(vault_root, choices, **kwargs)
+
+        monkeypatch.setattr(WorkflowService, "init_workflow", staticmethod(spy_init))
+        monkeypatch.setattr(os, "chdir", spy_chdir)
+
+        result = InitService.init_vault(Path("v"), name="v")
+
+        assert result.ok
+        assert seen == {"thread": caller, "ready": [True, True, True]}
+        assert chdir_threads <= {caller}
+        assert Path.cwd() == tmp_path
+
 
 class TestRegenerateSelf:
     """Tests for InitService.regenerate_self()."""
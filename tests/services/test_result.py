@@ -53,6 +53,18 @@ class TestServiceResult:
         except Exception:
             pass  # Expected — frozen model
 
+    def test_with_meta_merges_in_place(self) -> None:
+        result = ServiceResult(ok=True, op="test", meta={"existing": 1})
+        returned = result.with_meta({"telemetry": {"name": "x"}})
+        assert returned is result
+        assert result.meta == {"existing": 1, "telemetry": {"name": "x"}}
+        assert json.loads(result.model_dump_json(exclude_unset=True))["meta"]["existing"] == 1
+
+    def test_with_meta_on_empty_meta(self) -> None:
+        result = ServiceResult(ok=True, op="test").with_meta({"k": "v"})
+        assert result.meta == {"k": "v"}
+        assert "meta" in result.model_fields_set
+
 
 class TestServiceError:
     def test_with_detail(self) -> None:
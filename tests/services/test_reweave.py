@@ -406,6 +406,61 @@ class TestConnect:
             assert len(log_count) == 0
 
 
+# ---------------------------------------------------------------------------
+# Bulk reweave
+# ---------------------------------------------------------------------------
+
+
+class TestReweaveMany:
+    def test_connects_each_target(self, vault: Vault) -> None:
+        a = create_note(vault, "Python Programming", tags=["lang/python"])
+        b = create_note(vault, "Python Language Reference", tags=["lang/python"])
+
+        result = ReweaveService(vault).reweave_many([a["id"], b["id"]], min_score_override=0.0)
+        assert result.ok
+        assert result.data["failed"] == []
+        assert result.data["count"] == sum(r["count"] for r in result.data["results"])
+
+        with vault.engine.connect() as conn:
+            sources = {str(r.source_id) for r in conn.execute(select(edges.c.source_id)).fetchall()}
+        assert {r["target_id"] for r in result.data["results"]} <= sources
+        assert a["id"] in sources
+
+    def test_matches_single_reweave_suggestions(self, vault: Vault) -> None:
+        a = create_note(vault, "Graph Theory Basics", tags=["math/graphs"])
+        create_note(vault, "Graph Algorithms", tags=["math/graphs"])
+        create_note(vault, "Cooking Pasta")
+
+        svc = ReweaveService(vault)
+        single = svc.reweave(content_id=a["id"], dry_run=True)
+        bulk = svc.reweave_many([a["id"]])
+        assert bulk.ok
+
+        expected = {s["id"] for s in single.data["suggestions"]}
+        connected = {c["id"] for r in bulk.data["results"] for c in r["connected"]}
+        assert connected == expected
+
+    def test_unknown_id_reported_as_failed(self, vault: Vault) -> None:
+        a = create_note(vault, "Known Note")
+        create_note(vault, "Known Neighbour")
+
+        result = ReweaveService(vault).reweave_many(["ztl_nonexist", a["id"]])
+        assert result.ok
+        assert [f["id"] for f in result.data["failed"]] == ["ztl_nonexist"]
+
+    def test_disabled(self, vault_root: Any) -> None:
+        from ztlctl.config.settings import ZtlSettings
+
+        (vault_root / "ztlctl.toml").write_text("[reweave]\nenabled = false\n", encoding="utf-8")
+        disabled_vault = Vault(ZtlSettings.from_cli(vault_root=vault_root))
+        data = create_note(disabled_vault, "Some Note")
+
+        result = ReweaveService(disabled_vault).reweave_many([data["id"]])
+        assert result.ok
+        assert result.data["skipped"] is True
+        assert result.data["count"] == 0
+
+
 # ---------------------------------------------------------------------------
 # Prune
 # ---------------------------------------------------------------------------
@@ -42,6 +42,19 @@ class TestSessionStart:
             assert row is not None
             assert "File Test" in row.summary
 
+    def test_start_lifecycle_metadata_escapes_topic(self, vault: Vault) -> None:
+        topic = 'Quotes "and" \\ slashes'
+        data = start_session(vault, topic)
+        with vault.engine.connect() as conn:
+            row = conn.execute(
+                select(session_logs).where(
+                    session_logs.c.session_id == data["id"],
+                    session_logs.c.type == "session_start",
+                )
+            ).first()
+            assert row is not None
+            assert json.loads(row.metadata) == {"topic": topic}
+
     def test_start_creates_db_row(self, vault: Vault) -> None:
         data = start_session(vault, "DB Test")
         with vault.engine.connect() as conn:
@@ -151,6 +164,20 @@ class TestSessionClose:
         assert result.data["integrity_issues"] == 0
         assert not any("Integrity check found" in warning for warning in result.warnings)
 
+    def test_close_reports_integrity_errors_from_worker(self, vault: Vault) -> None:
+        start_session(vault, "Broken Close")
+        issues = [{"severity": "error", "message": "boom"}] * 2
+
+        with patch("ztlctl.services.check.CheckService") as mock_cls:
+            mock_cls.return_value.check.return_value = ServiceResult(
+                ok=True, op="check", data={"issues": issues}
+            )
+            result = SessionService(vault).close()
+
+        assert result.ok
+        assert result.data["integrity_issues"] == 2
+        assert "Integrity check found 2 errors" in result.warnings
+
     def test_close_with_session_notes_reweave(self, vault: Vault) -> None:
         """Notes created in the session are reweaved on close."""
         data = start_session(vault, "Reweave Session")
@@ -165,6 +192,22 @@ class TestSessionClose:
         # Reweave count may be 0 if scores are below threshold, but pipeline ran
         assert result.data["reweave_count"] >= 0
 
+    def test_close_materializes_isolated_new_node(self, vault: Vault) -> None:
+        """A node added without edges still triggers metric materialization."""
+        from ztlctl.services.graph import GraphService
+
+        create_note(vault, "Existing Note")
+        assert GraphService(vault).materialize_metrics().ok
+        data = start_session(vault, "Isolated Log")
+
+        assert SessionService(vault).close().ok
+
+        with vault.engine.connect() as conn:
+            pagerank = conn.execute(
+                select(nodes.c.pagerank).where(nodes.c.id == data["id"])
+            ).scalar_one()
+        assert pagerank > 0
+
 
 # ---------------------------------------------------------------------------
 # close() — disabled enrichment
@@ -202,13 +245,13 @@ class TestSessionCloseDisabled:
         expected_threshold = vault.settings.session.orphan_reweave_threshold
 
         with patch("ztlctl.services.reweave.ReweaveService") as mock_cls:
-            mock_cls.return_value.reweave.return_value = ServiceResult(
-                ok=True, op="reweave", data={"count": 0, "suggestions": []}
+            mock_cls.return_value.reweave_many.return_value = ServiceResult(
+                ok=True, op="reweave_many", data={"results": [], "failed": [], "count": 0}
             )
             SessionService(vault).close()
 
-            # Verify orphan sweep called reweave with the lower threshold
-            calls = mock_cls.return_value.reweave.call_args_list
+            # Verify orphan sweep called reweave_many with the lower threshold
+            calls = mock_cls.return_value.reweave_many.call_args_list
             orphan_calls = [c for c in calls if c.kwargs.get("min_score_override") is not None]
             assert len(orphan_calls) > 0
             for call in orphan_calls:
@@ -319,6 +362,12 @@ class TestLogEntry:
             assert rows[1].type == "log_entry"
             assert rows[1].summary == "Entry one"
 
+    def test_log_entry_keeps_cached_graph(self, vault: Vault) -> None:
+        start_session(vault, "Graph Cache Test")
+        graph = vault.graph.graph
+        SessionService(vault).log_entry("No graph change")
+        assert vault.graph.graph is graph
+
     def test_log_entry_inserts_db_row(self, vault: Vault) -> None:
         start_session(vault, "DB Log Test")
         SessionService(vault).log_entry("DB entry", cost=1500)
@@ -651,6 +700,18 @@ class TestContext:
         types = [e["type"] for e in entries]
         assert "checkpoint" in types
 
+    def test_context_log_entries_include_references(self, vault: Vault) -> None:
+        start_session(vault, "Reference Context")
+        note = create_note(vault, "Cited Note")
+        svc = SessionService(vault)
+        svc.log_entry("Cited a note", references=[note["id"]])
+
+        result = svc.context()
+        assert result.ok
+        entries = result.data["layers"]["log_entries"]
+        cited = [e for e in entries if e["summary"] == "Cited a note"]
+        assert cited[0]["references"] == [note["id"]]
+
     def test_context_ignore_checkpoints(self, vault: Vault) -> None:
         """With ignore_checkpoints, all entries are returned regardless of checkpoint."""
         start_session(vault, "Ignore Checkpoint")
@@ -720,6 +781,7 @@ class TestBrief:
         stats = result.data["vault_stats"]
         assert stats.get("note") == 2
         assert stats.get("task") == 1
+        assert stats.get("reference") == 0
 
     def test_brief_recent_decisions(self, vault: Vault) -> None:
         create_note(vault, "Use Postgres", subtype="decision")
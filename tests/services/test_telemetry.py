@@ -15,6 +15,7 @@ from ztlctl.services.telemetry import (
     disable_telemetry,
     enable_telemetry,
     get_current_span,
+    is_telemetry_enabled,
     trace_span,
     traced,
 )
@@ -49,6 +50,13 @@ class TestSpan:
         assert d["name"] == "root"
         assert "duration_ms" in d
         assert "children" not in d  # no empty children key
+        assert set(d) == {"name", "duration_ms"}
+
+    def test_slotted(self) -> None:
+        span = Span(name="test")
+        assert not hasattr(span, "__dict__")
+        with pytest.raises(AttributeError):
+            span.extra = 1  # type: ignore[attr-defined]
 
     def test_to_dict_with_children(self) -> None:
         root = Span(name="root")
@@ -253,6 +261,51 @@ class TestTracedDecorator:
             disable_telemetry()
 
 
+class _Probe:
+    """Module-level class so @traced can defer instrumentation."""
+
+    @traced
+    def run(self) -> ServiceResult:
+        return ServiceResult(ok=True, op="probe")
+
+    @staticmethod
+    @traced
+    def run_static() -> ServiceResult:
+        return ServiceResult(ok=True, op="probe_static")
+
+
+class TestTracedDeferredInstall:
+    def test_methods_unwrapped_while_disabled(self) -> None:
+        from ztlctl.services.session import SessionService
+        from ztlctl.services.workflow import WorkflowService
+
+        assert not hasattr(_Probe.run, "__wrapped__")
+        assert not hasattr(_Probe.run_static, "__wrapped__")
+        assert not hasattr(SessionService.start, "__wrapped__")
+        assert not hasattr(WorkflowService.init_workflow, "__wrapped__")
+        assert not hasattr(WorkflowService.update_workflow, "__wrapped__")
+
+    def test_enable_installs_wrappers(self) -> None:
+        enable_telemetry()
+        try:
+            assert _Probe.run.__wrapped__ is not None  # type: ignore[attr-defined]
+            result = _Probe().run()
+            assert result.meta is not None
+            assert result.meta["telemetry"]["name"] == "_Probe.run"
+            static_result = _Probe.run_static()
+            assert static_result.meta is not None
+            assert static_result.meta["telemetry"]["name"] == "_Probe.run_static"
+        finally:
+            disable_telemetry()
+
+    def test_disable_restores_originals(self) -> None:
+        enable_telemetry()
+        enable_telemetry()  # idempotent: no double wrapping
+        disable_telemetry()
+        assert not hasattr(_Probe.run, "__wrapped__")
+        assert _Probe().run().meta is None
+
+
 # ── get_current_span tests ───────────────────────────────────────────
 
 
@@ -271,6 +324,25 @@ class TestGetCurrentSpan:
             disable_telemetry()
 
 
+# ── enable / disable switch ──────────────────────────────────────────
+
+
+class TestTelemetrySwitch:
+    def test_toggle(self) -> None:
+        assert not is_telemetry_enabled()
+        enable_telemetry()
+        assert is_telemetry_enabled()
+        disable_telemetry()
+        assert not is_telemetry_enabled()
+
+    def test_enabled_state_is_process_wide(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        enable_telemetry()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(is_telemetry_enabled).result()
+
+
 # ── @traced on real services ────────────────────────────────────────
 
 
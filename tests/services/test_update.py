@@ -371,6 +371,24 @@ class TestSupersede:
         assert fm["status"] == "superseded"
         assert fm["superseded_by"] == data_new["id"]
 
+        with vault.engine.connect() as conn:
+            row = conn.execute(select(nodes.c.status).where(nodes.c.id == data_old["id"])).one()
+        assert row.status == "superseded"
+        assert result.data["fields_changed"] == ["status", "superseded_by"]
+
+    def test_supersede_requires_accepted_decision(self, vault: Vault) -> None:
+        data_old = create_decision(vault, "Proposed Decision")
+        result = UpdateService(vault).supersede(data_old["id"], "ztl_new00000")
+        assert not result.ok
+        assert result.error is not None
+        assert result.error.code == "VALIDATION_FAILED"
+
+    def test_supersede_not_found(self, vault: Vault) -> None:
+        result = UpdateService(vault).supersede("ztl_missing0", "ztl_new00000")
+        assert not result.ok
+        assert result.error is not None
+        assert result.error.code == "NOT_FOUND"
+
 
 # ---------------------------------------------------------------------------
 # Alias resolution
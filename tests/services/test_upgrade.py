@@ -5,8 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from sqlalchemy import create_engine
+from alembic import command
+from sqlalchemy import create_engine, inspect, text
 
+from ztlctl.infrastructure.database.migrations import build_config
 from ztlctl.infrastructure.vault import Vault
 from ztlctl.services.upgrade import UpgradeService
 
@@ -38,7 +40,7 @@ class TestCheckPending:
         """check_pending() always reports the head revision."""
         result = UpgradeService(vault).check_pending()
         assert result.ok
-        assert result.data["head"] == "002_node_timestamps"
+        assert result.data["head"] == "003_fts_doc_map"
 
 
 # ---------------------------------------------------------------------------
@@ -65,6 +67,19 @@ class TestApply:
         assert result.ok
         assert result.data["applied_count"] > 0
 
+    def test_apply_runs_pending_migration_on_vault_connection(self, vault: Vault) -> None:
+        """A partially migrated vault is upgraded to head through the vault engine."""
+        with vault.engine.begin() as conn:
+            conn.execute(text("DROP TABLE fts_doc_map"))
+        command.stamp(build_config(UpgradeService(vault)._db_url()), "002_node_timestamps")
+
+        result = UpgradeService(vault).apply()
+
+        assert result.ok
+        assert result.data["applied_count"] == 1
+        assert "fts_doc_map" in inspect(vault.engine).get_table_names()
+        assert UpgradeService(vault).check_pending().data["current"] == "003_fts_doc_map"
+
     def test_apply_creates_backup(self, vault: Vault) -> None:
         """Apply creates a backup file."""
         svc = UpgradeService(vault)
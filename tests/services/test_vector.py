@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import text
 
 from ztlctl.infrastructure.vault import Vault
-from ztlctl.services.vector import VectorService, _serialize_f32
+from ztlctl.services.vector import VectorService, _serialize_f32, _serialize_int8
+
+
+@pytest.fixture(autouse=True)
+def _reset_availability_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each test probes sqlite-vec afresh; the real cache is process-wide."""
+    monkeypatch.setattr("ztlctl.services.vector._vec_available", None)
 
 
 class TestSerializeF32:
@@ -38,6 +46,56 @@ class TestSerializeF32:
         (val,) = struct.unpack("f", result)
         assert abs(val - 42.0) < 1e-6
 
+    def test_serialize_numpy_array_matches_list(self) -> None:
+        import numpy as np
+
+        vec = [0.25, -1.5, 3.0]
+        assert _serialize_f32(np.array(vec, dtype=np.float64)) == _serialize_f32(vec)
+
+
+class TestSerializeInt8:
+    def test_unit_scale_and_one_byte_per_dim(self) -> None:
+        import numpy as np
+
+        blob = _serialize_int8([3.0, -4.0, 0.0])
+        assert np.frombuffer(blob, dtype=np.int8).tolist() == [76, -102, 0]
+
+    def test_zero_vector(self) -> None:
+        assert _serialize_int8([0.0, 0.0]) == b"\x00\x00"
+
+    def test_service_uses_configured_storage(self, tmp_path: Path) -> None:
+        from ztlctl.config.settings import ZtlSettings
+
+        (tmp_path / "ztlctl.toml").write_text('[search]\nembedding_storage = "int8"\n')
+        settings = ZtlSettings.from_cli(vault_root=tmp_path)
+        svc = VectorService(Vault(settings))
+        assert svc._codec.serialize is _serialize_int8
+        assert "vec_int8(?)" in svc._codec.search_sql
+
+    def test_search_returns_unit_scale_distances(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        from ztlctl.config.settings import ZtlSettings
+
+        (tmp_path / "ztlctl.toml").write_text('[search]\nembedding_storage = "int8"\n')
+        vault = Vault(ZtlSettings.from_cli(vault_root=tmp_path))
+        provider = MagicMock()
+        provider.embed.return_value = [1.0, 0.0]
+        # Orthogonal unit vectors quantized to int8 sit 127 * sqrt(2) apart
+        sa_conn = MagicMock()
+        sa_conn.exec_driver_sql.return_value.fetchall.return_value = [("a", 127.0 * 2**0.5)]
+        connect_ctx = MagicMock()
+        connect_ctx.__enter__.return_value = sa_conn
+        monkeypatch.setattr(vault.engine, "connect", MagicMock(return_value=connect_ctx))
+        monkeypatch.setattr(VectorService, "_load_sqlite_vec", MagicMock())
+        svc = VectorService(vault, provider=provider)
+        svc._vec_available = True
+
+        (hit,) = svc.search_similar("query")
+
+        assert hit["distance"] == pytest.approx(2**0.5)
+        assert 0.0 <= 1.0 - hit["distance"] / 2.0 <= 1.0
+
 
 class TestVectorServiceAvailability:
     def test_is_available_returns_bool(self, vault: Vault) -> None:
@@ -54,6 +112,14 @@ class TestVectorServiceAvailability:
         assert result1 == result2
         assert svc._vec_available is not None
 
+    def test_probe_result_shared_across_instances(
+        self, monkeypatch: pytest.MonkeyPatch, vault: Vault
+    ) -> None:
+        assert VectorService(vault).is_available() is False
+        connect = MagicMock(side_effect=AssertionError("probed twice"))
+        monkeypatch.setattr(vault.engine, "connect", connect)
+        assert VectorService(vault).is_available() is False
+
     def test_is_available_uses_driver_connection(
         self, monkeypatch: pytest.MonkeyPatch, vault: Vault
     ) -> None:
@@ -102,6 +168,18 @@ class TestVectorServiceAvailability:
         raw_conn.enable_load_extension.assert_any_call(True)
         raw_conn.enable_load_extension.assert_any_call(False)
 
+    def test_extension_loaded_once_per_pooled_connection(
+        self, monkeypatch: pytest.MonkeyPatch, vault: Vault
+    ) -> None:
+        sqlite_vec = MagicMock()
+        monkeypatch.setitem(sys.modules, "sqlite_vec", sqlite_vec)
+
+        for _ in range(3):
+            with vault.engine.connect() as conn:
+                VectorService._load_sqlite_vec(conn)
+
+        assert sqlite_vec.load.call_count == 1
+
 
 class TestVectorServiceGracefulDegradation:
     """When sqlite-vec is unavailable, all operations are no-ops."""
@@ -113,6 +191,14 @@ class TestVectorServiceGracefulDegradation:
         svc.index_node("ztl_123", "test content")
         provider.embed.assert_not_called()
 
+    def test_flush_noop_when_unavailable(self, vault: Vault) -> None:
+        provider = MagicMock()
+        svc = VectorService(vault, provider=provider)
+        svc.queue_node("ztl_123", "test content")
+        assert svc.flush() == 0
+        provider.embed_batch.assert_not_called()
+        assert svc._pending == {}
+
     def test_remove_node_noop_when_unavailable(self, vault: Vault) -> None:
         svc = VectorService(vault)
         svc.remove_node("ztl_123")  # Should not raise
@@ -134,6 +220,121 @@ class TestVectorServiceGracefulDegradation:
         svc.ensure_table()  # Should not raise
 
 
+@pytest.fixture
+def plain_vec_svc(monkeypatch: pytest.MonkeyPatch, vault: Vault) -> VectorService:
+    """VectorService over a plain vec_items table; embeds text as [len]."""
+    monkeypatch.setitem(sys.modules, "sqlite_vec", MagicMock())
+    with vault.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE vec_items (node_id TEXT PRIMARY KEY, embedding BLOB)"))
+    provider = MagicMock()
+    provider.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    svc = VectorService(vault, provider=provider)
+    svc._vec_available = True
+    return svc
+
+
+def _vec_rows(vault: Vault) -> dict[str, bytes]:
+    with vault.engine.connect() as conn:
+        return dict(conn.execute(text("SELECT node_id, embedding FROM vec_items")).all())
+
+
+class TestVectorServiceFlush:
+    def test_flush_batches_queued_nodes(self, plain_vec_svc: VectorService, vault: Vault) -> None:
+        svc = plain_vec_svc
+        provider = svc._provider
+        assert isinstance(provider, MagicMock)
+
+        svc.queue_node("a", "x")
+        svc.queue_node("b", "yy")
+        svc.queue_node("c", "zzz")
+        svc.queue_node("a", "xxxx")  # re-queue replaces pending content
+        assert svc.flush(batch_size=2) == 3
+
+        assert provider.embed_batch.call_count == 2
+        assert _vec_rows(vault) == {
+            "a": _serialize_f32([4.0]),
+            "b": _serialize_f32([2.0]),
+            "c": _serialize_f32([3.0]),
+        }
+
+    def test_index_node_replaces_existing_row(
+        self, plain_vec_svc: VectorService, vault: Vault
+    ) -> None:
+        provider = plain_vec_svc._provider
+        assert isinstance(provider, MagicMock)
+        provider.embed.side_effect = lambda content: [float(len(content))]
+
+        plain_vec_svc.index_node("a", "xy")
+        plain_vec_svc.index_node("a", "xyz")
+
+        assert _vec_rows(vault) == {"a": _serialize_f32([3.0])}
+
+    def test_index_node_reindexes_real_vec0_row(self, vault: Vault) -> None:
+        pytest.importorskip("sqlite_vec")
+        dim = vault.settings.search.embedding_dim
+        provider = MagicMock()
+        provider.embed.side_effect = lambda content: [float(len(content))] * dim
+        svc = VectorService(vault, provider=provider)
+        svc.ensure_table()
+
+        svc.index_node("a", "xy")
+        svc.index_node("a", "xyz")
+
+        with vault.engine.connect() as conn:
+            VectorService._load_sqlite_vec(conn)
+            rows = conn.execute(text("SELECT node_id, embedding FROM vec_items")).all()
+        assert [(r.node_id, r.embedding) for r in rows] == [("a", _serialize_f32([3.0] * dim))]
+
+    def test_remove_nodes_deletes_in_one_call(
+        self, plain_vec_svc: VectorService, vault: Vault
+    ) -> None:
+        for nid in ("a", "b", "c"):
+            plain_vec_svc.queue_node(nid, nid)
+        plain_vec_svc.flush()
+        plain_vec_svc.remove_nodes(["a", "c", "missing"])
+        assert list(_vec_rows(vault)) == ["b"]
+
+    def test_reindex_all_replaces_live_and_drops_stale(
+        self, plain_vec_svc: VectorService, vault: Vault
+    ) -> None:
+        from ztlctl.services.create import CreateService
+
+        note_id = CreateService(vault).create_note("Alpha").data["id"]
+        with vault.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO vec_items VALUES (:a, x'00'), ('gone', x'00')"), {"a": note_id}
+            )
+
+        result = plain_vec_svc.reindex_all()
+
+        assert result.ok
+        assert result.data["indexed_count"] == 1
+        rows = _vec_rows(vault)
+        assert list(rows) == [note_id]
+        provider = plain_vec_svc._provider
+        assert isinstance(provider, MagicMock)
+        (texts,) = provider.embed_batch.call_args.args
+        assert texts == ["Alpha"]
+        assert rows[note_id] == _serialize_f32([5.0])
+
+    def test_reindex_all_streams_in_batches(
+        self, monkeypatch: pytest.MonkeyPatch, plain_vec_svc: VectorService, vault: Vault
+    ) -> None:
+        from ztlctl.services.create import CreateService
+
+        monkeypatch.setattr("ztlctl.services.vector._REINDEX_BATCH_SIZE", 2)
+        svc = CreateService(vault)
+        ids = {svc.create_note(f"Note {i}").data["id"] for i in range(5)}
+
+        result = plain_vec_svc.reindex_all()
+
+        assert result.data["indexed_count"] == 5
+        provider = plain_vec_svc._provider
+        assert isinstance(provider, MagicMock)
+        assert [len(c.args[0]) for c in provider.embed_batch.call_args_list] == [2, 2, 1]
+        assert set(_vec_rows(vault)) == ids
+
+
 class TestVectorServiceProvider:
     def test_explicit_provider_used(self, vault: Vault) -> None:
         mock_provider = MagicMock()
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from ztlctl.services.init import InitService
-from ztlctl.services.workflow import WorkflowChoices, WorkflowService
+from ztlctl.services.workflow import WorkflowChoices, WorkflowService, _yaml_backend
 
 
 class TestWorkflowService:
@@ -30,6 +31,22 @@ class TestWorkflowService:
         assert (tmp_path / ".ztlctl" / "workflow" / "README.md").is_file()
         assert "claude-driven" in (tmp_path / ".ztlctl" / "workflow" / "README.md").read_text()
 
+    def test_verify_reports_generated_files(self, tmp_path: Path) -> None:
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        init_result = WorkflowService.init_workflow(
+            tmp_path, WorkflowService.default_choices(), verify=True
+        )
+        assert init_result.ok
+        assert not init_result.warnings
+        assert len(init_result.data["files_written"]) == 6
+
+        (tmp_path / ".ztlctl" / "workflow" / "viewer.md").unlink()
+        files_written, warnings = WorkflowService._files_written(tmp_path, verify=True)
+
+        assert ".ztlctl/workflow/viewer.md" not in files_written
+        assert len(files_written) == 5
+        assert warnings == ["Expected workflow file was not written: .ztlctl/workflow/viewer.md"]
+
     def test_init_workflow_rejects_duplicate(self, tmp_path: Path) -> None:
         InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
         WorkflowService.init_workflow(tmp_path, WorkflowService.default_choices())
@@ -56,6 +73,13 @@ class TestWorkflowService:
 
         assert result.ok
         assert result.data["mode"] == "recopy"
+        assert result.data["choices"]["workflow"] == "manual"
+        assert WorkflowService.read_answers(tmp_path) == WorkflowChoices(
+            source_control="none",
+            viewer="vanilla",
+            workflow="manual",
+            skill_set="minimal",
+        )
         assert result.warnings
         operating_mode = (tmp_path / ".ztlctl" / "workflow" / "operating-mode.md").read_text()
         assert "Manual mode" in operating_mode
@@ -79,6 +103,170 @@ class TestWorkflowService:
         assert answers.workflow == "agent-generic"
         assert answers.skill_set == "engineering"
 
+    @pytest.mark.parametrize("c_loader", [True, False], ids=["libyaml", "ruamel"])
+    def test_read_answers_loader_fallback(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        request: pytest.FixtureRequest,
+        c_loader: bool,
+    ) -> None:
+        _yaml_backend.cache_clear()
+        if not c_loader:
+            monkeypatch.setitem(sys.modules, "yaml", None)  # import now fails
+        request.addfinalizer(_yaml_backend.cache_clear)
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
+        # Flow style is beyond the line scanner, so a YAML loader must run.
+        answers_path.write_text(
+            "{source_control: none, viewer: obsidian, workflow: manual, skill_set: minimal}\n",
+            encoding="utf-8",
+        )
+
+        answers = WorkflowService.read_answers(tmp_path)
+
+        assert answers == WorkflowChoices(
+            source_control="none", viewer="obsidian", workflow="manual", skill_set="minimal"
+        )
+
+    def test_read_answers_flat_file_skips_yaml_loader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _no_yaml() -> Any:
+            raise AssertionError("flat answers file should not need a YAML loader")
+
+        monkeypatch.setattr("ztlctl.services.workflow._yaml_backend", _no_yaml)
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
+        answers_path.write_bytes(
+            b"# Changes here will be overwritten by Copier\r\n"
+            b"_src_path: /opt/templates/workflow\r\n"
+            b"skill_set: 'engineering'\r\n\r\n"
+            b'source_control: "git"\r\n'
+            b"viewer: vanilla\r\n"
+            b"workflow: agent-generic\r\n"
+        )
+
+        answers = WorkflowService.read_answers(tmp_path)
+
+        assert answers == WorkflowChoices(
+            source_control="git",
+            viewer="vanilla",
+            workflow="agent-generic",
+            skill_set="engineering",
+        )
+
+    def test_read_answers_large_file_uses_yaml_loader(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[bytes] = []
+        load, errors = _yaml_backend()
+
+        def _recording_load(raw: bytes) -> Any:
+            calls.append(raw)
+            return load(raw)
+
+        monkeypatch.setattr(
+            "ztlctl.services.workflow._yaml_backend", lambda: (_recording_load, errors)
+        )
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
+        answers_path.write_text(
+            "# padding\n" * 60
+            + "source_control: git\nviewer: obsidian\nworkflow: manual\nskill_set: minimal\n",
+            encoding="utf-8",
+        )
+
+        answers = WorkflowService.read_answers(tmp_path)
+
+        assert answers == WorkflowChoices(
+            source_control="git", viewer="obsidian", workflow="manual", skill_set="minimal"
+        )
+        assert len(calls) == 1
+
+    def test_read_answers_memoized_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
+        answers_path.write_text(
+            "source_control: git\nviewer: obsidian\nworkflow: manual\nskill_set: minimal\n",
+            encoding="utf-8",
+        )
+        first = WorkflowService.read_answers(tmp_path)
+
+        reads: list[Path] = []
+        original_read_bytes = Path.read_bytes
+
+        def _counting_read_bytes(path: Path) -> bytes:
+            reads.append(path)
+            return original_read_bytes(path)
+
+        monkeypatch.setattr(Path, "read_bytes", _counting_read_bytes)
+        assert WorkflowService.read_answers(tmp_path) is first
+        assert reads == []
+
+        answers_path.write_text(
+            "source_control: none\nviewer: vanilla\nworkflow: manual\nskill_set: research\n",
+            encoding="utf-8",
+        )
+        updated = WorkflowService.read_answers(tmp_path)
+        assert updated is not None
+        assert updated.viewer == "vanilla"
+        assert reads == [answers_path]
+
+    def test_equal_choices_are_shared(self, tmp_path: Path) -> None:
+        defaults = WorkflowService.default_choices()
+        assert WorkflowService.default_choices() is defaults
+        assert WorkflowService.default_choices(viewer="vanilla") is not defaults
+
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        WorkflowService.init_workflow(tmp_path, defaults)
+        assert WorkflowService.read_answers(tmp_path) is defaults
+
+    def test_as_data_is_built_once_and_read_only(self) -> None:
+        choices = WorkflowService.default_choices()
+        data = choices.as_data()
+
+        assert choices.as_data() is data
+        assert dict(data) == {
+            "source_control": "git",
+            "viewer": "obsidian",
+            "workflow": "claude-driven",
+            "skill_set": "research",
+        }
+        with pytest.raises(TypeError):
+            data["viewer"] = "vanilla"  # type: ignore[index]
+
+    def test_validate_targets(self, tmp_path: Path) -> None:
+        def code(result: Any) -> str | None:
+            return None if result is None else result.error.code
+
+        assert code(WorkflowService.validate_init_target(tmp_path)) == "NOT_A_VAULT"
+        (tmp_path / "ztlctl.toml").write_text("", encoding="utf-8")
+        assert code(WorkflowService.validate_init_target(tmp_path)) is None
+        assert code(WorkflowService.validate_update_target(tmp_path)) == "WORKFLOW_NOT_INITIALIZED"
+        answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
+        answers_path.parent.mkdir()
+        answers_path.write_text("", encoding="utf-8")
+        assert code(WorkflowService.validate_init_target(tmp_path)) == "WORKFLOW_EXISTS"
+        assert code(WorkflowService.validate_update_target(tmp_path)) is None
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "source_control: git\nviewer: obsidian\nworkflow: manual\n",
+            "source_control: svn\nviewer: obsidian\nworkflow: manual\nskill_set: minimal\n",
+            "source_control: [git]\nviewer: obsidian\nworkflow: manual\nskill_set: minimal\n",
+        ],
+        ids=["missing-key", "unknown-value", "unhashable-value"],
+    )
+    def test_read_answers_rejects_invalid_choices(self, tmp_path: Path, body: str) -> None:
+        InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
+        (tmp_path / ".ztlctl" / "workflow-answers.yml").write_text(body, encoding="utf-8")
+
+        assert WorkflowService.read_answers(tmp_path) is None
+
     def test_read_answers_returns_none_for_invalid_yaml(self, tmp_path: Path) -> None:
         InitService.init_vault(tmp_path, name="wf-vault", no_workflow=True)
         answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
@@ -93,13 +281,13 @@ class TestWorkflowService:
         answers_path = tmp_path / ".ztlctl" / "workflow-answers.yml"
         answers_path.write_text("source_control: git\n", encoding="utf-8")
 
-        original_read_text = Path.read_text
+        original_read_bytes = Path.read_bytes
 
-        def _raise_permission_error(path: Path, *args: Any, **kwargs: Any) -> str:
+        def _raise_permission_error(path: Path) -> bytes:
             if path == answers_path:
                 raise PermissionError("denied")
-            return original_read_text(path, *args, **kwargs)
+            return original_read_bytes(path)
 
-        monkeypatch.setattr(Path, "read_text", _raise_permission_error)
+        monkeypatch.setattr(Path, "read_bytes", _raise_permission_error)
 
         assert WorkflowService.read_answers(tmp_path) is None